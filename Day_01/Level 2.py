@@ -7,6 +7,7 @@ from itertools import combinations
 from typing import Set
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_01.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
@@ -24,12 +25,24 @@ def day_01_part_2(data: Set[int]) -> int:
     return 0  # Avoid linter return None complaint
 
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    data = {int(line.strip()) for line in input_fp.readlines()}
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
 
-result = day_01_part_2(data)
+    Args:
+        input_path (Path): Puzzle input file
 
-print(result)
-# Submit result
-print(submit_output(2020, 1, 2, result))
\ No newline at end of file
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    data = set(read_input(input_path))
+
+    return day_01_part_2(data)
+
+
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    # Submit result
+    print(submit_output(2020, 1, 2, result))
@@ -0,0 +1,53 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from itertools import combinations
+from random import Random
+
+GOAL = 2020
+# Number of entries in a real input
+_BASE_COUNT = 200
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    One pair and one triple summing to 2020 are planted among entries that are
+      all larger than 2020, so no other pair or triple can sum to 2020
+
+    Args:
+        size (float): Number of entries, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 5)
+
+    while True:
+        num1 = rng.randint(1, GOAL - 1)
+        pair = (num1, GOAL - num1)
+        num2 = rng.randint(1, GOAL - 2)
+        num3 = rng.randint(1, GOAL - num2 - 1)
+        triple = (num2, num3, GOAL - num2 - num3)
+        planted = pair + triple
+        if len(set(planted)) < 5:
+            continue
+        # The planted numbers may only sum to 2020 the intended way
+        pairs = [p for p in combinations(planted, 2) if sum(p) == GOAL]
+        triples = [t for t in combinations(planted, 3) if sum(t) == GOAL]
+        if pairs == [pair] and triples == [triple]:
+            break
+
+    others = rng.sample(range(GOAL + 1, GOAL + 1 + 10 * count), count - 5)
+    entries = list(planted) + others
+    rng.shuffle(entries)
+    text = "".join(f"{entry}\n" for entry in entries)
+    return text, (pair[0] * pair[1], triple[0] * triple[1] * triple[2])
@@ -0,0 +1,24 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from array import array
+from pathlib import Path
+
+from aoc_io.loader import read_ints
+
+
+def read_input(path: Path) -> array:
+    """
+    Read and parse the input file
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (array): Expense report entries
+    """
+    return read_ints(path)
@@ -5,23 +5,31 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_02.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input. This time I'll do the processing while reading
-count = 0
-with INPUT_FILE_PATH.open("r") as input_fp:
+
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input. This time I'll do the processing while reading
     count = 0
-    for line in input_fp:
-        if not (line := line.strip()):
-            break
-        counts, letter, password = line.split()
-        lower, upper = [int(n) for n in counts.split("-")]
-        letter = letter[0]
+    for lower, upper, letter, password in read_input(input_path):
         if lower <= password.count(letter) <= upper:
             count += 1
+    return count
 
 
-print(count)
-print(submit_output(2020, 2, 1, count))
\ No newline at end of file
+if __name__ == "__main__":
+    count = level1()
+    print(count)
+    print(submit_output(2020, 2, 1, count))
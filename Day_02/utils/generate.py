@@ -0,0 +1,47 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+from string import ascii_lowercase
+
+# Number of passwords in a real input
+_BASE_COUNT = 1000
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Passwords are drawn from a few letters at a time, so that the policy
+      letter shows up often enough to make both policies interesting
+
+    Args:
+        size (float): Number of passwords, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 1)
+
+    lines: list[str] = []
+    valid1 = valid2 = 0
+    for _ in range(count):
+        letters = rng.sample(ascii_lowercase, rng.randint(2, 6))
+        letter = letters[0]
+        password = "".join(rng.choices(letters, k=rng.randint(3, 20)))
+        lower = rng.randint(1, len(password) - 1)
+        upper = rng.randint(lower + 1, len(password))
+        lines.append(f"{lower}-{upper} {letter}: {password}\n")
+        if lower <= password.count(letter) <= upper:
+            valid1 += 1
+        if (password[lower - 1] == letter) != (password[upper - 1] == letter):
+            valid2 += 1
+
+    return "".join(lines), (valid1, valid2)
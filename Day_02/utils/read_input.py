@@ -0,0 +1,30 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+from typing import Iterator
+
+from aoc_io.loader import iter_lines
+
+
+def read_input(path: Path) -> Iterator[tuple[int, int, str, str]]:
+    """
+    Read and parse the input file, one line at a time
+
+    Args:
+        path (Path): Input file path
+
+    Yields:
+        (int): First number of the policy
+        (int): Second number of the policy
+        (str): Letter of the policy
+        (str): Password
+    """
+    for line in iter_lines(path):
+        counts, letter, password = line.split()
+        first, second = counts.split("-")
+        yield int(first), int(second), letter[0], password
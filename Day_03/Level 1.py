@@ -5,18 +5,32 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_03.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    map_ = [cleaned_row for row in input_fp.readlines() if (cleaned_row := row.strip())]
 
-map_width = len(map_[0])
-right = 3
-spaces = [map_[i][i * right % map_width] for i in range(len(map_))]
-result = spaces.count("#")
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
 
-print(result)
-print(submit_output(2020, 3, 1, result))
\ No newline at end of file
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    map_ = read_input(input_path)
+
+    map_width = len(map_[0])
+    right = 3
+    spaces = [map_[i][i * right % map_width] for i in range(len(map_))]
+    return spaces.count("#")
+
+
+if __name__ == "__main__":
+    result = level1()
+    print(result)
+    print(submit_output(2020, 3, 1, result))
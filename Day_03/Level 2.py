@@ -5,23 +5,42 @@ Solution to part 2
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_03.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    map_ = [cleaned_row for row in input_fp.readlines() if (cleaned_row := row.strip())]
 
-moves = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
-map_width = len(map_[0])
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
 
-result = 1
+    Args:
+        input_path (Path): Puzzle input file
 
-for right, down in moves:
-    spaces = [map_[i * down][i * right % map_width] for i in range(len(map_) // down)]
-    count = spaces.count("#")
-    result *= count
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    map_ = read_input(input_path)
 
-print(result)
-print(submit_output(2020, 3, 2, result))
\ No newline at end of file
+    moves = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+    map_width = len(map_[0])
+
+    result = 1
+
+    for right, down in moves:
+        spaces = [
+            map_[i * down][i * right % map_width]
+            for i in range((len(map_) + down - 1) // down)
+        ]
+        count = spaces.count("#")
+        result *= count
+
+    return result
+
+
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 3, 2, result))
@@ -0,0 +1,50 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from math import prod
+from random import Random
+
+SLOPES = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+# Dimensions of a real input
+_BASE_HEIGHT = 323
+_WIDTH = 31
+_TREE_DENSITY = 0.25
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    The map keeps the width of a real input and grows downwards
+
+    Args:
+        size (float): Height of the map, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    height = max(round(_BASE_HEIGHT * size), 2)
+
+    map_ = [
+        "".join("#" if rng.random() < _TREE_DENSITY else "." for _ in range(_WIDTH))
+        for _ in range(height)
+    ]
+    # The toboggan starts on an open square
+    map_[0] = "." + map_[0][1:]
+
+    trees = [
+        sum(
+            map_[i * down][i * right % _WIDTH] == "#"
+            for i in range((height + down - 1) // down)
+        )
+        for right, down in SLOPES
+    ]
+    text = "".join(f"{row}\n" for row in map_)
+    return text, (trees[1], prod(trees))
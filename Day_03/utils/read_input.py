@@ -0,0 +1,23 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+
+from aoc_io.loader import iter_lines
+
+
+def read_input(path: Path) -> list[str]:
+    """
+    Read and parse the input file
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (list[str]): Rows of the map
+    """
+    return list(iter_lines(path))
@@ -5,22 +5,38 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_04.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    people = input_fp.read().replace("\n", " ").split("  ")
-
 REQUIRED = {"byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid"}
 
-count = 0
 
-for person in people:
-    keys = {entry.split(":")[0] for entry in person.split()}
-    if keys >= REQUIRED:
-        count += 1
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    people = read_input(input_path)
+
+    count = 0
+
+    for person in people:
+        keys = {entry.split(":")[0] for entry in person.split()}
+        if keys >= REQUIRED:
+            count += 1
+
+    return count
+
 
-print(count)
-print(submit_output(2020, 4, 1, count))
\ No newline at end of file
+if __name__ == "__main__":
+    count = level1()
+    print(count)
+    print(submit_output(2020, 4, 1, count))
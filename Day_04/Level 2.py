@@ -7,14 +7,11 @@ from pathlib import Path
 from typing import Callable
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_04.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    people = input_fp.read().replace("\n", " ").split("  ")
-
 REQUIRED: dict[str, Callable[[str], bool]] = {
     "byr": (lambda x: 1920 <= int(x) <= 2002),
     "iyr": (lambda x: 2010 <= int(x) <= 2020),
@@ -29,21 +26,40 @@ REQUIRED: dict[str, Callable[[str], bool]] = {
     "pid": (lambda x: len(x) == 9 and x.isdigit()),
 }
 
-count = 0
-
-for person in people:
-    passport = {}
-    for entry in person.split():
-        key, value = entry.split(":")
-        passport[key] = value
-    for key, verifunc in REQUIRED.items():
-        value = passport.get(key)
-        if value is None:
-            break
-        if not verifunc(value):
-            break
-    else:
-        count += 1
-
-print(count)
-print(submit_output(2020, 4, 2, count))
\ No newline at end of file
+
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    people = read_input(input_path)
+
+    count = 0
+
+    for person in people:
+        passport = {}
+        for entry in person.split():
+            key, value = entry.split(":")
+            passport[key] = value
+        for key, verifunc in REQUIRED.items():
+            value = passport.get(key)
+            if value is None:
+                break
+            if not verifunc(value):
+                break
+        else:
+            count += 1
+
+    return count
+
+
+if __name__ == "__main__":
+    count = level2()
+    print(count)
+    print(submit_output(2020, 4, 2, count))
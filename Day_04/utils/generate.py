@@ -0,0 +1,120 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+from typing import Callable
+
+# Number of passports in a real input
+_BASE_COUNT = 290
+
+_EYE_COLORS = ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]
+
+
+def _height(rng: Random, valid: bool) -> str:
+    unit = rng.choice(["cm", "in"])
+    low, high = (150, 193) if unit == "cm" else (59, 76)
+    if valid:
+        return f"{rng.randint(low, high)}{unit}"
+    too_low = rng.randint(low - 40, low - 1)
+    too_high = rng.randint(high + 1, high + 40)
+    return f"{rng.choice([too_low, too_high])}{unit}"
+
+
+def _year(low: int, high: int) -> Callable[[Random, bool], str]:
+    def year(rng: Random, valid: bool) -> str:
+        if valid:
+            return str(rng.randint(low, high))
+        return str(
+            rng.choice(
+                [rng.randint(low - 50, low - 1), rng.randint(high + 1, high + 50)]
+            )
+        )
+
+    return year
+
+
+def _hair(rng: Random, valid: bool) -> str:
+    if valid:
+        return "#" + "".join(rng.choices("0123456789abcdef", k=6))
+    return rng.choice(
+        [
+            "".join(rng.choices("0123456789abcdef", k=6)),
+            "#" + "".join(rng.choices("0123456789abcdef", k=5)),
+            "#" + "".join(rng.choices("0123456789xyz", k=6)) + "z",
+        ]
+    )
+
+
+def _eye(rng: Random, valid: bool) -> str:
+    if valid:
+        return rng.choice(_EYE_COLORS)
+    return rng.choice(["xry", "zzz", "gmt", "lzr", "utc"])
+
+
+def _passport_id(rng: Random, valid: bool) -> str:
+    if valid:
+        return "".join(rng.choices("0123456789", k=9))
+    return "".join(rng.choices("0123456789", k=rng.choice([7, 8, 10, 11])))
+
+
+_FIELDS: dict[str, Callable[[Random, bool], str]] = {
+    "byr": _year(1920, 2002),
+    "iyr": _year(2010, 2020),
+    "eyr": _year(2020, 2030),
+    "hgt": _height,
+    "hcl": _hair,
+    "ecl": _eye,
+    "pid": _passport_id,
+}
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Each passport either misses a required field, has all of them with some
+      invalid values, or is entirely valid; `cid` comes and goes at random
+
+    Args:
+        size (float): Number of passports, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 1)
+
+    passports: list[str] = []
+    complete = valid = 0
+    for _ in range(count):
+        kind = rng.choice(["missing", "invalid", "valid"])
+        invalid_keys = set()
+        if kind == "invalid":
+            invalid_keys = set(rng.sample(list(_FIELDS), rng.randint(1, 3)))
+        fields = {
+            key: func(rng, key not in invalid_keys) for key, func in _FIELDS.items()
+        }
+        if kind == "missing":
+            for key in rng.sample(list(fields), rng.randint(1, 3)):
+                del fields[key]
+        if rng.random() < 0.5:
+            fields["cid"] = str(rng.randint(10, 350))
+        entries = [f"{key}:{value}" for key, value in fields.items()]
+        rng.shuffle(entries)
+        # Fields are separated by spaces or newlines
+        passports.append(
+            "".join(
+                entry + (rng.choice(" \n") if i < len(entries) - 1 else "\n")
+                for i, entry in enumerate(entries)
+            )
+        )
+        complete += kind != "missing"
+        valid += kind == "valid"
+
+    return "\n".join(passports), (complete, valid)
@@ -0,0 +1,25 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+from typing import Iterator
+
+from aoc_io.loader import iter_records
+
+
+def read_input(path: Path) -> Iterator[str]:
+    """
+    Read and parse the input file, one passport at a time
+
+    Args:
+        path (Path): Input file path
+
+    Yields:
+        (str): Space-separated fields of each passport
+    """
+    for record in iter_records(path):
+        yield " ".join(record)
@@ -5,19 +5,29 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_05.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
 mapping = str.maketrans({"B": "1", "F": "0", "R": "1", "L": "0"})
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    result = max(
-        int(row_stripped.translate(mapping), 2)
-        for row in input_fp.readlines()
-        if (row_stripped := row.strip())
-    )
 
-print(result)
-print(submit_output(2020, 5, 1, result))
\ No newline at end of file
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    return max(int(row.translate(mapping), 2) for row in read_input(input_path))
+
+
+if __name__ == "__main__":
+    result = level1()
+    print(result)
+    print(submit_output(2020, 5, 1, result))
@@ -5,24 +5,35 @@ Solution to part 2
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_05.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
 mapping = str.maketrans({"B": "1", "F": "0", "R": "1", "L": "0"})
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    seat_ids = {
-        int(row_stripped.translate(mapping), 2)
-        for row in input_fp.readlines()
-        if (row_stripped := row.strip())
-    }
-
-result = 0
-for seat_id in seat_ids:
-    if seat_id + 1 not in seat_ids and seat_id + 2 in seat_ids:
-        result = seat_id + 1
-
-print(result)
-print(submit_output(2020, 5, 2, result))
\ No newline at end of file
+
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    seat_ids = {int(row.translate(mapping), 2) for row in read_input(input_path)}
+
+    result = 0
+    for seat_id in seat_ids:
+        if seat_id + 1 not in seat_ids and seat_id + 2 in seat_ids:
+            result = seat_id + 1
+    return result
+
+
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 5, 2, result))
@@ -0,0 +1,52 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+
+# Number of boarding passes in a real input
+_BASE_COUNT = 850
+# Bits of a seat ID that encode the column
+_COLUMN_BITS = 3
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    The passes cover a contiguous range of seat IDs, save for one seat. Larger
+      planes get more rows, i.e. more `F`/`B` characters per pass
+
+    Args:
+        size (float): Number of boarding passes, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 3)
+    # Keep some seats at the front and the back of the plane empty
+    bits = max((count * 5 // 4).bit_length(), 10)
+
+    first = rng.randint(1, (1 << bits) - count - 2)
+    last = first + count
+    missing = rng.randint(first + 1, last - 1)
+    row_table = str.maketrans("01", "FB")
+    col_table = str.maketrans("01", "LR")
+
+    passes: list[str] = []
+    for seat_id in range(first, last + 1):
+        if seat_id == missing:
+            continue
+        binary = format(seat_id, f"0{bits}b")
+        row = binary[:-_COLUMN_BITS].translate(row_table)
+        col = binary[-_COLUMN_BITS:].translate(col_table)
+        passes.append(f"{row}{col}\n")
+    rng.shuffle(passes)
+
+    return "".join(passes), (last, missing)
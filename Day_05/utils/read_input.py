@@ -0,0 +1,24 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+from typing import Iterator
+
+from aoc_io.loader import iter_lines
+
+
+def read_input(path: Path) -> Iterator[str]:
+    """
+    Read and parse the input file, one boarding pass at a time
+
+    Args:
+        path (Path): Input file path
+
+    Yields:
+        (str): Each boarding pass
+    """
+    yield from iter_lines(path)
@@ -8,19 +8,33 @@ Solution to part 2
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_06.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    groups = [group for g in input_fp.read().split("\n\n") if (group := g.strip())]
 
-count = 0
-for group in groups:
-    people = group.split()
-    responses = set.intersection(*[set(person) for person in people])
-    count += len(responses)
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
 
-print(count)
-print(submit_output(2020, 6, 2, count))
\ No newline at end of file
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    groups = read_input(input_path)
+
+    count = 0
+    for people in groups:
+        responses = set.intersection(*[set(person) for person in people])
+        count += len(responses)
+    return count
+
+
+if __name__ == "__main__":
+    count = level2()
+    print(count)
+    print(submit_output(2020, 6, 2, count))
@@ -0,0 +1,47 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+from string import ascii_lowercase
+
+# Number of groups in a real input
+_BASE_COUNT = 490
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    People in a group share a common core of answers, so intersections are
+      seldom empty
+
+    Args:
+        size (float): Number of groups, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 1)
+
+    groups: list[str] = []
+    anyone = everyone = 0
+    for _ in range(count):
+        core = set(rng.sample(ascii_lowercase, rng.randint(0, 6)))
+        people = [
+            core | set(rng.sample(ascii_lowercase, rng.randint(0 if core else 1, 8)))
+            for _ in range(rng.randint(1, 5))
+        ]
+        groups.append(
+            "".join("".join(rng.sample(sorted(p), len(p))) + "\n" for p in people)
+        )
+        anyone += len(set.union(*people))
+        everyone += len(set.intersection(*people))
+
+    return "\n".join(groups), (anyone, everyone)
@@ -0,0 +1,24 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+from typing import Iterator
+
+from aoc_io.loader import iter_records
+
+
+def read_input(path: Path) -> Iterator[list[str]]:
+    """
+    Read and parse the input file, one group at a time
+
+    Args:
+        path (Path): Input file path
+
+    Yields:
+        (list[str]): Answers of each person in the group
+    """
+    yield from iter_records(path)
@@ -0,0 +1,145 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from functools import cache
+from itertools import product
+from random import Random
+from string import ascii_lowercase
+
+TARGET = "shiny gold"
+# Number of rules in a real input
+_BASE_COUNT = 594
+# Levels of bags inside `shiny gold`
+_LEVELS = 4
+
+_ADJECTIVES = [
+    "bright", "clear", "dark", "dim", "dotted", "drab", "dull", "faded",
+    "light", "mirrored", "muted", "pale", "plaid", "posh", "shiny", "striped",
+    "vibrant", "wavy",
+]  # fmt: skip
+_HUES = [
+    "aqua", "beige", "black", "blue", "bronze", "brown", "chartreuse",
+    "coral", "crimson", "cyan", "fuchsia", "gold", "gray", "green", "indigo",
+    "lavender", "lime", "magenta", "maroon", "olive", "orange", "plum",
+    "purple", "red", "salmon", "silver", "tan", "teal", "tomato", "turquoise",
+    "violet", "white", "yellow",
+]  # fmt: skip
+
+
+def _colors(count: int, rng: Random) -> list[str]:
+    """
+    Make up distinct colors, `shiny gold` among them
+
+    Once the real adjectives run out, letters are appended to them
+
+    Args:
+        count (int)   : Number of colors
+        rng   (Random): Random number generator
+
+    Returns:
+        (list[str]): The colors, shuffled
+    """
+    colors: list[str] = []
+    suffix_len = 0
+    while len(colors) < count:
+        for letters in product(ascii_lowercase, repeat=suffix_len):
+            suffix = "".join(letters)
+            colors += (f"{adj}{suffix} {hue}" for adj in _ADJECTIVES for hue in _HUES)
+            if len(colors) >= count:
+                break
+        suffix_len += 1
+    colors = [color for color in colors if color != TARGET][: count - 1]
+    colors.append(TARGET)
+    rng.shuffle(colors)
+    return colors
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Colors are split into containers, `shiny gold` and contents. Containers
+      only contain bags that come later in a random order of the colors, so
+      the rules form a DAG. Contents are arranged in a few levels, which keeps
+      the number of bags inside `shiny gold` realistic at any size
+
+    Args:
+        size (float): Number of rules, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), _LEVELS + 2)
+
+    colors = _colors(count, rng)
+    colors.remove(TARGET)
+    containers = colors[: (count - 1) // 2]
+    levels = [colors[len(containers) + i :: _LEVELS] for i in range(_LEVELS)]
+
+    contents: dict[str, dict[str, int]] = {}
+    for i, level in enumerate(levels):
+        below = levels[i + 1] if i + 1 < len(levels) else []
+        for color in level:
+            kinds = (
+                rng.randint(1, min(3, len(below)))
+                if below and rng.random() < 0.8
+                else 0
+            )
+            contents[color] = {
+                child: rng.randint(1, 4) for child in rng.sample(below, kinds)
+            }
+    contents[TARGET] = {
+        child: rng.randint(1, 4)
+        for child in rng.sample(levels[0], min(3, len(levels[0])))
+    }
+    everything = [color for level in levels for color in level]
+    for i, container in enumerate(containers):
+        # Containers mostly hold containers close by, so that the DAG is deep
+        later = containers[i + 1 : i + 31]
+        children: dict[str, int] = {}
+        for _ in range(rng.randint(1, 4)):
+            roll = rng.random()
+            if roll < 0.05:
+                child = TARGET
+            elif roll < 0.75 and later:
+                child = rng.choice(later)
+            else:
+                child = rng.choice(everything)
+            children[child] = rng.randint(1, 5)
+        contents[container] = children
+
+    parents: dict[str, set[str]] = {color: set() for color in contents}
+    for color, children in contents.items():
+        for child in children:
+            parents[child].add(color)
+    ancestors: set[str] = set()
+    stack = [TARGET]
+    while stack:
+        for parent in parents[stack.pop()] - ancestors:
+            ancestors.add(parent)
+            stack.append(parent)
+
+    @cache
+    def inside(color: str) -> int:
+        return sum(n * (1 + inside(child)) for child, n in contents[color].items())
+
+    lines: list[str] = []
+    for color in rng.sample(list(contents), len(contents)):
+        children = contents[color]
+        if children:
+            inner = ", ".join(
+                f"{n} {child} bag{'s' if n > 1 else ''}"
+                for child, n in children.items()
+            )
+        else:
+            inner = "no other bags"
+        lines.append(f"{color} bags contain {inner}.\n")
+
+    return "".join(lines), (len(ancestors), inside(TARGET))
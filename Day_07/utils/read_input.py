@@ -0,0 +1,37 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+import re
+from pathlib import Path
+from typing import Iterator
+
+from aoc_io.loader import iter_lines
+
+CHILDREN_COLOR_REGEX = re.compile(r"^(?P<count>\d+) (?P<color>.+) bags?$")
+
+
+def read_input(path: Path) -> Iterator[tuple[str, dict[str, int]]]:
+    """
+    Read and parse the input file, one rule at a time
+
+    Args:
+        path (Path): Input file path
+
+    Yields:
+        (str)           : Color of the outer bag
+        (dict[str, int]): Color-count mapping of the bags inside
+    """
+    for line in iter_lines(path):
+        root_color, children = line.split(" bags contain ")
+        contents: dict[str, int] = {}
+        if children != "no other bags.":
+            for child in children[:-1].split(", "):
+                color_match = CHILDREN_COLOR_REGEX.fullmatch(child)
+                if color_match is None:
+                    raise ValueError(child)
+                contents[color_match["color"]] = int(color_match["count"])
+        yield root_color, contents
@@ -5,35 +5,48 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_08.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    code = []
-    for line in input_fp:
-        command, param = line.strip().split()
-        code.append((command, int(param)))
-
-ids = set()
-acc = 0
-pointer = 0
-
-while True:
-    if pointer in ids:
-        break
-    ids.add(pointer)
-    command, param = code[pointer]
-    if command == "acc":
-        acc += param
-        pointer += 1
-    elif command == "jmp":
-        pointer += param
-    elif command == "nop":
-        pointer += 1
-    else:
-        raise ValueError(f"{acc} {pointer}")
-
-print(acc)
-print(submit_output(2020, 8, 1, acc))
\ No newline at end of file
+
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    code = read_input(input_path)
+
+    ids = set()
+    acc = 0
+    pointer = 0
+
+    while True:
+        if pointer in ids:
+            break
+        ids.add(pointer)
+        command, param = code[pointer]
+        if command == "acc":
+            acc += param
+            pointer += 1
+        elif command == "jmp":
+            pointer += param
+        elif command == "nop":
+            pointer += 1
+        else:
+            raise ValueError(f"{acc} {pointer}")
+
+    return acc
+
+
+if __name__ == "__main__":
+    acc = level1()
+    print(acc)
+    print(submit_output(2020, 8, 1, acc))
@@ -6,17 +6,11 @@ Solution to part 2
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_08.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    code = []
-    for line in input_fp:
-        command, param = line.strip().split()
-        code.append((command, int(param)))
-
 
 def main(code: list[tuple[str, int]]) -> int:
     for i in range(len(code)):
@@ -53,7 +47,23 @@ def main(code: list[tuple[str, int]]) -> int:
     return 0  # Make linter happy
 
 
-acc = main(code)
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    code = read_input(input_path)
+
+    return main(code)
+
 
-print(acc)
-print(submit_output(2020, 8, 2, acc))
\ No newline at end of file
+if __name__ == "__main__":
+    acc = level2()
+    print(acc)
+    print(submit_output(2020, 8, 2, acc))
@@ -0,0 +1,72 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+
+# Number of instructions in a real input
+_BASE_COUNT = 630
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    The program is laid out as
+      - a body, whose jumps and `nop` arguments all stay inside the body,
+      - a `jmp` back to the start, closing the infinite loop, and
+      - a tail that runs off the end of the program.
+    Only that closing `jmp` leads out of the body, so flipping it is the only
+      repair, and flipping anything in the body still loops
+
+    Args:
+        size (float): Number of instructions, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 4)
+    tail_len = max(count // 20, 1)
+    body_len = count - tail_len - 1
+
+    # Instruction `body_len` is the closing `jmp`
+    code: list[tuple[str, int]] = []
+    for i in range(body_len):
+        kind = rng.choices(["acc", "nop", "jmp"], [5, 2, 3])[0]
+        if kind == "acc":
+            code.append(("acc", rng.randint(-50, 50)))
+        elif kind == "nop":
+            code.append(("nop", rng.randint(-i, body_len - i)))
+        else:
+            code.append(("jmp", rng.randint(1, min(8, body_len - i))))
+    code.append(("jmp", -body_len))
+    for i in range(tail_len):
+        if rng.random() < 0.8:
+            code.append(("acc", rng.randint(-50, 50)))
+        else:
+            code.append((rng.choice(["nop", "jmp"]), rng.randint(1, tail_len - i)))
+
+    # Follow the body to the closing `jmp`, then the tail to the end
+    acc = 0
+    pointer = 0
+    while pointer < body_len:
+        command, param = code[pointer]
+        if command == "acc":
+            acc += param
+        pointer += param if command == "jmp" else 1
+    loop_acc = acc
+    pointer = body_len + 1
+    while pointer < count:
+        command, param = code[pointer]
+        if command == "acc":
+            acc += param
+        pointer += param if command == "jmp" else 1
+
+    text = "".join(f"{command} {param:+d}\n" for command, param in code)
+    return text, (loop_acc, acc)
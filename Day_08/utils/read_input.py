@@ -0,0 +1,27 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+
+from aoc_io.loader import iter_lines
+
+
+def read_input(path: Path) -> list[tuple[str, int]]:
+    """
+    Read and parse the input file
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (list[tuple[str, int]]): Operation and argument of each instruction
+    """
+    code: list[tuple[str, int]] = []
+    for line in iter_lines(path):
+        command, param = line.split()
+        code.append((command, int(param)))
+    return code
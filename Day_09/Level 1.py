@@ -2,33 +2,33 @@
 """
 Solution to part 1
 """
-from collections import deque
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_09.utils.read_input import read_input
+from Day_09.utils.xmas import find_invalid
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    nums = [int(line.strip()) for line in input_fp]
 
-queue = deque(nums[:25])
-left = deque(nums[25:])
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
 
-while True:
-    queue_set = set(queue)
-    next_num = left.popleft()
-    for num in queue:
-        remainder = next_num - num
-        if remainder in queue_set - {num}:
-            break
-    else:
-        break
-    queue.popleft()
-    queue.append(next_num)
+    Args:
+        input_path (Path): Puzzle input file
 
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    nums = read_input(input_path)
 
-print(next_num)
-print(submit_output(2020, 9, 1, next_num))
\ No newline at end of file
+    return find_invalid(nums)
+
+
+if __name__ == "__main__":
+    next_num = level1()
+    print(next_num)
+    print(submit_output(2020, 9, 1, next_num))
@@ -5,18 +5,14 @@ Solution to part 2
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_09.utils.read_input import read_input
+from Day_09.utils.xmas import find_invalid
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    nums = [int(line.strip()) for line in input_fp]
 
-target = 373803594
-
-
-def main() -> int:
+def main(nums: list[int], target: int) -> int:
     for i, num_start in enumerate(nums):
         sum_ = num_start
         for j, num in enumerate(nums[i + 1 :]):
@@ -29,7 +25,23 @@ def main() -> int:
     return 0  # Make linter happy
 
 
-sum_ = main()
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    nums = read_input(input_path)
+
+    return main(nums, find_invalid(nums))
+
 
-print(sum_)
-print(submit_output(2020, 9, 2, sum_))
\ No newline at end of file
+if __name__ == "__main__":
+    sum_ = level2()
+    print(sum_)
+    print(submit_output(2020, 9, 2, sum_))
@@ -0,0 +1,71 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from itertools import accumulate, combinations
+from random import Random
+
+PREAMBLE = 25
+# Number of numbers in a real input
+_BASE_COUNT = 1000
+# Picking terms among the smallest numbers of the window slows down growth
+_SMALLEST = 8
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Every number is the sum of 2 different numbers among the 25 before it,
+      except for the invalid one, which is the sum of a contiguous run of
+      earlier numbers instead. Since each number is at least the sum of 2
+      earlier ones, the numbers double about every 25 lines; very large sizes
+      get slow
+
+    Args:
+        size (float): Number of numbers, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), PREAMBLE + 2)
+    invalid_at = rng.randint((count * 3) // 5, count - 1)
+
+    nums = rng.sample(range(1, 2 * PREAMBLE + 1), PREAMBLE)
+    while len(nums) < invalid_at:
+        num1, num2 = rng.sample(sorted(set(nums[-PREAMBLE:]))[:_SMALLEST], 2)
+        nums.append(num1 + num2)
+
+    window = nums[-PREAMBLE:]
+    pair_sums = {a + b for a, b in combinations(window, 2) if a != b}
+    while True:
+        start = rng.randint(0, invalid_at - 2)
+        end = rng.randint(start + 2, min(start + 17, invalid_at))
+        invalid = sum(nums[start:end])
+        if invalid not in pair_sums:
+            break
+    nums.append(invalid)
+    while len(nums) < count:
+        num1, num2 = rng.sample(sorted(set(nums[-PREAMBLE:]))[:_SMALLEST], 2)
+        nums.append(num1 + num2)
+
+    # The first run of at least 2 numbers that sums to the invalid number;
+    #   runs are unique per start since all numbers are positive
+    prefix = [0, *accumulate(nums)]
+    starts = {total: i for i, total in reversed(list(enumerate(prefix)))}
+    weakness = 0
+    best_start = len(nums)
+    for end, total in enumerate(prefix):
+        i = starts.get(total - invalid)
+        if i is not None and end - i >= 2 and i < best_start:
+            best_start = i
+            run = nums[i:end]
+            weakness = min(run) + max(run)
+
+    return "".join(f"{num}\n" for num in nums), (invalid, weakness)
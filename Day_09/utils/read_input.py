@@ -0,0 +1,26 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+
+from aoc_io.loader import iter_lines
+
+
+def read_input(path: Path) -> list[int]:
+    """
+    Read and parse the input file
+
+    The numbers outgrow 64 bits in large generated inputs, so they are not
+      parsed into an array
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (list[int]): The XMAS data
+    """
+    return [int(line) for line in iter_lines(path)]
@@ -0,0 +1,42 @@
+"""
+Module: Find the flaw in XMAS data
+
+Public Functions:
+    find_invalid: Find the first number that is not a sum of 2 of the numbers
+                  before it
+"""
+
+from collections import deque
+
+# Number of numbers each number may be a sum of 2 of
+PREAMBLE = 25
+
+
+def find_invalid(nums: list[int]) -> int:
+    """
+    Find the first number that is not a sum of 2 different numbers among the
+      25 before it
+
+    Args:
+        nums (list[int]): The XMAS data
+
+    Returns:
+        (int): The first invalid number
+
+    Raises:
+        IndexError: When every number is valid
+    """
+    queue = deque(nums[:PREAMBLE])
+    left = deque(nums[PREAMBLE:])
+
+    while True:
+        queue_set = set(queue)
+        next_num = left.popleft()
+        for num in queue:
+            remainder = next_num - num
+            if remainder in queue_set - {num}:
+                break
+        else:
+            return next_num
+        queue.popleft()
+        queue.append(next_num)
@@ -5,30 +5,44 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_10.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    jolts = [0] + [int(line.strip()) for line in input_fp]
 
-jolts.sort()
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
 
-jolt_1 = 0
-jolt_3 = 1
+    Args:
+        input_path (Path): Puzzle input file
 
-for i, jolt in enumerate(jolts[:-1]):
-    next_jolt = jolts[i + 1]
-    diff = next_jolt - jolt
-    if diff == 1:
-        jolt_1 += 1
-    elif diff == 3:
-        jolt_3 += 1
-    elif diff >= 4:
-        break
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    jolts = [0, *read_input(input_path)]
 
-result = jolt_1 * jolt_3
+    jolts.sort()
 
-print(result)
-print(submit_output(2020, 10, 1, result))
\ No newline at end of file
+    jolt_1 = 0
+    jolt_3 = 1
+
+    for i, jolt in enumerate(jolts[:-1]):
+        next_jolt = jolts[i + 1]
+        diff = next_jolt - jolt
+        if diff == 1:
+            jolt_1 += 1
+        elif diff == 3:
+            jolt_3 += 1
+        elif diff >= 4:
+            break
+
+    return jolt_1 * jolt_3
+
+
+if __name__ == "__main__":
+    result = level1()
+    print(result)
+    print(submit_output(2020, 10, 1, result))
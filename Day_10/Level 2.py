@@ -7,16 +7,11 @@ from functools import cache
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_10.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    jolts = [0] + [int(line.strip()) for line in input_fp]
-
-jolts.sort()
-
 
 @cache
 def count_ways(jolts: tuple[int, ...]) -> int:
@@ -36,7 +31,25 @@ def count_ways(jolts: tuple[int, ...]) -> int:
     return cumulative + count_ways(jolts[3:])
 
 
-result = count_ways(tuple(jolts))
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    jolts = [0, *read_input(input_path)]
+
+    jolts.sort()
+
+    return count_ways(tuple(jolts))
+
 
-print(result)
-print(submit_output(2020, 10, 2, result))
\ No newline at end of file
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 10, 2, result))
@@ -0,0 +1,54 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+
+# Number of adapters in a real input
+_BASE_COUNT = 100
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Consecutive adapters differ by 1 or 3 jolts, with runs of at most 4
+      1-jolt differences, like real inputs
+
+    Args:
+        size (float): Number of adapters, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 1)
+
+    jolts = [0]
+    run = 0
+    for _ in range(count):
+        if run < 4 and rng.random() < 0.65:
+            jolts.append(jolts[-1] + 1)
+            run += 1
+        else:
+            jolts.append(jolts[-1] + 3)
+            run = 0
+    diffs = [b - a for a, b in zip(jolts, jolts[1:])]
+
+    # Number of arrangements ending at each adapter
+    ways = [1]
+    for i in range(1, len(jolts)):
+        ways.append(
+            sum(ways[j] for j in range(max(i - 3, 0), i) if jolts[i] - jolts[j] <= 3)
+        )
+
+    adapters = jolts[1:]
+    rng.shuffle(adapters)
+    text = "".join(f"{adapter}\n" for adapter in adapters)
+    # The device is always 3 jolts above the highest adapter
+    return text, (diffs.count(1) * (diffs.count(3) + 1), ways[-1])
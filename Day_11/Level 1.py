@@ -8,17 +8,11 @@ from itertools import product
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_11.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    map_ = [list(line.strip()) for line in input_fp]
-
-height = len(map_)
-width = len(map_[0])
-
 
 def get_neighbor_occupied(
     map_: list[list[str]], neighbors: list[tuple[int, int]]
@@ -28,7 +22,9 @@ def get_neighbor_occupied(
 
 
 @cache
-def get_neighbors(row: int, col: int) -> list[tuple[int, int]]:
+def get_neighbors(
+    row: int, col: int, height: int, width: int
+) -> list[tuple[int, int]]:
     neighbors = [
         (r, c)
         for r, c in product(range(row - 1, row + 2), range(col - 1, col + 2))
@@ -37,22 +33,41 @@ def get_neighbors(row: int, col: int) -> list[tuple[int, int]]:
     return neighbors
 
 
-while True:
-    new_map = [list(row) for row in map_]
-    for r, c in product(range(height), range(width)):
-        if map_[r][c] == ".":
-            continue
-        if map_[r][c] == "L":
-            if get_neighbor_occupied(map_, get_neighbors(r, c)) == 0:
-                new_map[r][c] = "#"
-        else:
-            if get_neighbor_occupied(map_, get_neighbors(r, c)) >= 4:
-                new_map[r][c] = "L"
-    if new_map == map_:
-        break
-    map_ = new_map
-
-result = sum(row.count("#") for row in map_)
-
-print(result)
-print(submit_output(2020, 11, 1, result))
\ No newline at end of file
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    map_ = read_input(input_path)
+
+    height = len(map_)
+    width = len(map_[0])
+
+    while True:
+        new_map = [list(row) for row in map_]
+        for r, c in product(range(height), range(width)):
+            if map_[r][c] == ".":
+                continue
+            if map_[r][c] == "L":
+                if get_neighbor_occupied(map_, get_neighbors(r, c, height, width)) == 0:
+                    new_map[r][c] = "#"
+            else:
+                if get_neighbor_occupied(map_, get_neighbors(r, c, height, width)) >= 4:
+                    new_map[r][c] = "L"
+        if new_map == map_:
+            break
+        map_ = new_map
+
+    return sum(row.count("#") for row in map_)
+
+
+if __name__ == "__main__":
+    result = level1()
+    print(result)
+    print(submit_output(2020, 11, 1, result))
@@ -6,23 +6,20 @@ Solution to part 2
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_11.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    map_ = [list(line.strip()) for line in input_fp]
-
-height = len(map_)
-width = len(map_[0])
-directions = [(r, c) for r in range(-1, 2) for c in range(-1, 2) if r or c]
+DIRECTIONS = [(r, c) for r in range(-1, 2) for c in range(-1, 2) if r or c]
 
 
 def get_neighbor_occupied(map_: list[list[str]], coord: tuple[int, int]) -> int:
+    height = len(map_)
+    width = len(map_[0])
     row, col = coord
     count = 0
-    for dr, dc in directions:
+    for dr, dc in DIRECTIONS:
         r = row
         c = col
         while 0 <= (r := r + dr) < height and 0 <= (c := c + dc) < width:
@@ -34,25 +31,44 @@ def get_neighbor_occupied(map_: list[list[str]], coord: tuple[int, int]) -> int:
     return count
 
 
-while True:
-    new_map = [row[:] for row in map_]
-    for r in range(height):
-        for c in range(width):
-            if map_[r][c] == ".":
-                continue
-            elif map_[r][c] == "L":
-                if get_neighbor_occupied(map_, (r, c)) == 0:
-                    new_map[r][c] = "#"
-            elif map_[r][c] == "#":
-                if get_neighbor_occupied(map_, (r, c)) >= 5:
-                    new_map[r][c] = "L"
-            else:
-                raise ValueError(f"{(r, c)} {new_map[r][c]}")
-    if new_map == map_:
-        break
-    map_ = new_map
-
-result = sum(row.count("#") for row in map_)
-
-print(result)
-print(submit_output(2020, 11, 2, result))
\ No newline at end of file
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    map_ = read_input(input_path)
+
+    height = len(map_)
+    width = len(map_[0])
+
+    while True:
+        new_map = [row[:] for row in map_]
+        for r in range(height):
+            for c in range(width):
+                if map_[r][c] == ".":
+                    continue
+                elif map_[r][c] == "L":
+                    if get_neighbor_occupied(map_, (r, c)) == 0:
+                        new_map[r][c] = "#"
+                elif map_[r][c] == "#":
+                    if get_neighbor_occupied(map_, (r, c)) >= 5:
+                        new_map[r][c] = "L"
+                else:
+                    raise ValueError(f"{(r, c)} {new_map[r][c]}")
+        if new_map == map_:
+            break
+        map_ = new_map
+
+    return sum(row.count("#") for row in map_)
+
+
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 11, 2, result))
@@ -0,0 +1,128 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from math import sqrt
+from random import Random
+
+# Dimensions of a real input
+_BASE_HEIGHT = 91
+_BASE_WIDTH = 98
+# Fraction of floor tiles in a real input
+_FLOOR = 0.17
+
+_DIRECTIONS = [(r, c) for r in range(-1, 2) for c in range(-1, 2) if r or c]
+
+
+def _neighbors(
+    map_: list[list[str]], row: int, col: int, far: bool
+) -> list[tuple[int, int]]:
+    """
+    Seats seen from a seat
+
+    Args:
+        map_ (list[list[str]]): Seat layout
+        row  (int)            : Row of the seat
+        col  (int)            : Column of the seat
+        far  (bool)           : Whether to look past the floor, like in level 2
+
+    Returns:
+        (list[tuple[int, int]]): Coordinates of the seen seats
+    """
+    height = len(map_)
+    width = len(map_[0])
+    seen: list[tuple[int, int]] = []
+    for dr, dc in _DIRECTIONS:
+        r = row + dr
+        c = col + dc
+        while 0 <= r < height and 0 <= c < width:
+            if map_[r][c] == "L":
+                seen.append((r, c))
+                break
+            if not far:
+                break
+            r += dr
+            c += dc
+    return seen
+
+
+def _settle(
+    map_: list[list[str]], far: bool, tolerance: int
+) -> tuple[int, list[tuple[int, int]]]:
+    """
+    Simulate the seating until it stops changing
+
+    Args:
+        map_      (list[list[str]]): Seat layout
+        far       (bool)           : Whether to look past the floor
+        tolerance (int)            : Number of occupied seats that makes people
+                                       leave
+
+    Returns:
+        (int)                  : Number of occupied seats at the end
+        (list[tuple[int, int]]): Seats that still change after a generous
+                                   number of rounds; empty if it settled
+    """
+    seats = [
+        (r, c)
+        for r, row in enumerate(map_)
+        for c, tile in enumerate(row)
+        if tile == "L"
+    ]
+    index = {seat: i for i, seat in enumerate(seats)}
+    neighbors = [
+        [index[seen] for seen in _neighbors(map_, *seat, far)] for seat in seats
+    ]
+    occupied = [False] * len(seats)
+    # Seats settle from the edges inwards, which takes about a round per tile
+    for _ in range(2 * (len(map_) + len(map_[0])) + 10):
+        counts = [sum(occupied[j] for j in seen) for seen in neighbors]
+        changed = [
+            i
+            for i, count in enumerate(counts)
+            if ((count >= tolerance) if occupied[i] else (count == 0))
+        ]
+        if not changed:
+            return sum(occupied), []
+        for i in changed:
+            occupied[i] = not occupied[i]
+    return 0, [seats[i] for i in changed]
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Args:
+        size (float): Number of tiles, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    scale = sqrt(size)
+    height = max(round(_BASE_HEIGHT * scale), 1)
+    width = max(round(_BASE_WIDTH * scale), 1)
+
+    map_ = [
+        ["." if rng.random() < _FLOOR else "L" for _ in range(width)]
+        for _ in range(height)
+    ]
+    # Random layouts can blink forever; turn some of the blinking seats into
+    #   floor until both levels settle
+    while True:
+        occupied1, blinking = _settle(map_, False, 4)
+        if not blinking:
+            occupied2, blinking = _settle(map_, True, 5)
+            if not blinking:
+                break
+        for row, col in rng.sample(blinking, max(len(blinking) // 10, 1)):
+            map_[row][col] = "."
+
+    text = "".join(f"{''.join(row)}\n" for row in map_)
+    return text, (occupied1, occupied2)
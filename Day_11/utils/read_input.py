@@ -0,0 +1,23 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+
+from aoc_io.loader import iter_lines
+
+
+def read_input(path: Path) -> list[list[str]]:
+    """
+    Read and parse the input file
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (list[list[str]]): Seat layout
+    """
+    return [list(line) for line in iter_lines(path)]
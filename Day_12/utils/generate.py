@@ -0,0 +1,82 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+
+# Number of instructions in a real input
+_BASE_COUNT = 783
+
+# Unit vectors of the cardinal directions
+_UNITS = {"N": (0, 1), "S": (0, -1), "E": (1, 0), "W": (-1, 0)}
+
+
+def _turn(x: int, y: int, action: str, degrees: int) -> tuple[int, int]:
+    """
+    Rotate a vector around the origin
+
+    Args:
+        x       (int): East component of the vector
+        y       (int): North component of the vector
+        action  (str): "L" or "R"
+        degrees (int): Multiple of 90 degrees to turn by
+
+    Returns:
+        (tuple[int, int]): Rotated vector
+    """
+    quarters = degrees // 90 if action == "L" else -degrees // 90
+    for _ in range(quarters % 4):
+        x, y = -y, x
+    return x, y
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Args:
+        size (float): Number of instructions, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 1)
+
+    moves: list[tuple[str, int]] = []
+    for _ in range(count):
+        action = rng.choice("NSEWLRFF")
+        if action in "LR":
+            moves.append((action, rng.choice((90, 90, 90, 180, 270))))
+        elif action == "F":
+            moves.append((action, rng.randint(1, 100)))
+        else:
+            moves.append((action, rng.randint(1, 5)))
+
+    # Level 1 moves the ship, level 2 moves the waypoint
+    ship = [0, 0]
+    facing = (1, 0)
+    position = [0, 0]
+    waypoint = (10, 1)
+    for action, num in moves:
+        if action in _UNITS:
+            dx, dy = _UNITS[action]
+            ship[0] += num * dx
+            ship[1] += num * dy
+            waypoint = (waypoint[0] + num * dx, waypoint[1] + num * dy)
+        elif action == "F":
+            ship[0] += num * facing[0]
+            ship[1] += num * facing[1]
+            position[0] += num * waypoint[0]
+            position[1] += num * waypoint[1]
+        else:
+            facing = _turn(*facing, action, num)
+            waypoint = _turn(*waypoint, action, num)
+
+    text = "".join(f"{action}{num}\n" for action, num in moves)
+    return text, (abs(ship[0]) + abs(ship[1]), abs(position[0]) + abs(position[1]))
@@ -5,19 +5,33 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_13.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    ts = int(input_fp.readline().strip())
-    buses = [int(num) for num in input_fp.readline().strip().split(",") if num != "x"]
 
-schedules = [(b - ts % b, b) for b in buses]
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
 
-min_ = min(schedules)
-result = min_[0] * min_[1]
+    Args:
+        input_path (Path): Puzzle input file
 
-print(result)
-print(submit_output(2020, 13, 1, result))
\ No newline at end of file
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    ts, schedule = read_input(input_path)
+    buses = [int(num) for num in schedule if num != "x"]
+
+    schedules = [(b - ts % b, b) for b in buses]
+
+    min_ = min(schedules)
+    return min_[0] * min_[1]
+
+
+if __name__ == "__main__":
+    result = level1()
+    print(result)
+    print(submit_output(2020, 13, 1, result))
@@ -7,17 +7,11 @@ from math import lcm
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_13.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    input_fp.readline()
-    line = input_fp.readline().strip().split(",")
-    length = len(line)
-    buses = [(t, int(num)) for t, num in enumerate(line) if num != "x"]
-
 
 def crt(mods_rems: list[tuple[int, int]]) -> int:
     """
@@ -75,8 +69,26 @@ def mul_inv(n: int, m: int) -> int:
     return y
 
 
-mods_rems = [(num, num - t % num) for t, num in buses]
-result = crt(mods_rems)
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    _, line = read_input(input_path)
+    length = len(line)
+    buses = [(t, int(num)) for t, num in enumerate(line) if num != "x"]
+
+    mods_rems = [(num, num - t % num) for t, num in buses]
+    return crt(mods_rems)
+
 
-print(result)
-print(submit_output(2020, 13, 2, result))
\ No newline at end of file
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 13, 2, result))
@@ -0,0 +1,55 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from math import prod
+from random import Random
+
+# Number of buses in a real input
+_BASE_COUNT = 9
+# Bus IDs are distinct primes in this range, so that level 2 has a solution
+_PRIMES = [n for n in range(13, 1000) if all(n % d for d in range(2, int(n**0.5) + 1))]
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Args:
+        size (float): Number of buses, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = min(max(round(_BASE_COUNT * size), 2), len(_PRIMES))
+
+    buses = rng.sample(_PRIMES, count)
+    offsets = [0, *sorted(rng.sample(range(1, 10 * count), count - 1))]
+    schedule = ["x"] * (offsets[-1] + 1)
+    for bus, offset in zip(buses, offsets):
+        schedule[offset] = str(bus)
+
+    # Make sure that the first bus to come is unique and does not leave right
+    #   at the timestamp
+    while True:
+        ts = rng.randint(10**5, 10**7)
+        waits = sorted((bus - ts % bus, bus) for bus in buses)
+        if ts % waits[0][1] and waits[0][0] < waits[1][0]:
+            break
+
+    # Chinese Remainder Theorem for `t + offset = 0 (mod bus)`
+    modulus = prod(buses)
+    earliest = 0
+    for bus, offset in zip(buses, offsets):
+        others = modulus // bus
+        earliest += -offset * others * pow(others, -1, bus)
+    earliest %= modulus
+
+    text = f"{ts}\n{','.join(schedule)}\n"
+    return text, (waits[0][0] * waits[0][1], earliest)
@@ -0,0 +1,27 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+
+from aoc_io.loader import iter_lines
+
+
+def read_input(path: Path) -> tuple[int, list[str]]:
+    """
+    Read and parse the input file
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (int)      : Earliest timestamp to depart
+        (list[str]): Bus IDs in service, with "x" for the others
+    """
+    lines = iter_lines(path)
+    ts = int(next(lines))
+    schedule = next(lines).split(",")
+    return ts, schedule
@@ -5,28 +5,42 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_14.utils.read_input import read_input
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    instructions = [line.split(" = ") for line in input_fp.readlines() if line]
 
-memory: dict[int, int] = {}
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
 
-mask = ""
+    Args:
+        input_path (Path): Puzzle input file
 
-for action, value in instructions:
-    if action == "mask":
-        mask = value
-    else:
-        index = int(action[4:-1])
-        binary = bin(int(value))[2:].zfill(36)
-        new_binary = "".join(b if m == "X" else m for m, b in zip(mask, binary))
-        memory[index] = int(new_binary, 2)
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    instructions = read_input(input_path)
 
-result = sum(memory.values())
+    memory: dict[int, int] = {}
 
-print(result)
-print(submit_output(2020, 14, 1, result))
\ No newline at end of file
+    mask = ""
+
+    for action, value in instructions:
+        if action == "mask":
+            mask = value
+        else:
+            index = int(action[4:-1])
+            binary = bin(int(value))[2:].zfill(36)
+            new_binary = "".join(b if m == "X" else m for m, b in zip(mask, binary))
+            memory[index] = int(new_binary, 2)
+
+    return sum(memory.values())
+
+
+if __name__ == "__main__":
+    result = level1()
+    print(result)
+    print(submit_output(2020, 14, 1, result))
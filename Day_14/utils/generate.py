@@ -0,0 +1,61 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+
+# Number of masks in a real input
+_BASE_COUNT = 100
+# Most floating bits of a mask in a real input
+_MAX_FLOATING = 9
+_BITS = 36
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Args:
+        size (float): Number of masks, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 1)
+
+    lines: list[str] = []
+    memory1: dict[int, int] = {}
+    memory2: dict[int, int] = {}
+    for _ in range(count):
+        floating = rng.sample(range(_BITS), rng.randint(1, _MAX_FLOATING))
+        mask = [rng.choice("01") for _ in range(_BITS)]
+        for bit in floating:
+            mask[bit] = "X"
+        lines.append(f"mask = {''.join(mask)}")
+
+        ones = int("".join("1" if bit == "1" else "0" for bit in mask), 2)
+        zeros = int("".join("0" if bit == "0" else "1" for bit in mask), 2)
+        # Bit values of the floating bits; index 0 is the leftmost bit
+        values = [1 << (_BITS - 1 - bit) for bit in floating]
+        for _ in range(rng.randint(1, 8)):
+            address = rng.randrange(1 << 16)
+            value = rng.randrange(1 << rng.choice((8, 16, 24, 30)))
+            lines.append(f"mem[{address}] = {value}")
+
+            memory1[address] = value & zeros | ones
+            base = (address | ones) & ~sum(values)
+            for combination in range(1 << len(values)):
+                floated = base
+                for i, bit_value in enumerate(values):
+                    if combination >> i & 1:
+                        floated |= bit_value
+                memory2[floated] = value
+
+    text = "".join(f"{line}\n" for line in lines)
+    return text, (sum(memory1.values()), sum(memory2.values()))
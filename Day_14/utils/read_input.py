@@ -0,0 +1,27 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+
+from aoc_io.loader import iter_lines
+
+
+def read_input(path: Path) -> list[tuple[str, str]]:
+    """
+    Read and parse the input file
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (list[tuple[str, str]]): Both sides of each assignment
+    """
+    instructions: list[tuple[str, str]] = []
+    for line in iter_lines(path):
+        action, value = line.split(" = ")
+        instructions.append((action, value))
+    return instructions
@@ -5,23 +5,30 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_15.utils.read_input import read_input
+from Day_15.utils.van_eck import play
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    nums = [int(num) for num in input_fp.readline().strip().split(",")]
 
-while len(nums) < 2020:
-    consideration = nums[-1]
-    if nums.count(consideration) == 1:
-        nums.append(0)
-    else:
-        gap = nums[::-1][1:].index(consideration) + 1
-        nums.append(gap)
+def level1(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
 
-result = nums[-1]
+    Args:
+        input_path (Path): Puzzle input file
 
-print(result)
-print(submit_output(2020, 15, 1, result))
\ No newline at end of file
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    nums = list(read_input(input_path))
+
+    return play(nums, 2020)
+
+
+if __name__ == "__main__":
+    result = level1()
+    print(result)
+    print(submit_output(2020, 15, 1, result))
@@ -5,26 +5,30 @@ Solution to part 2
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_15.utils.read_input import read_input
+from Day_15.utils.van_eck import play
 
 CURRENT_DIR = Path(__file__).resolve().parent
 INPUT_FILE_PATH = CURRENT_DIR / DATA_FILENAME
 
-# Read input
-with INPUT_FILE_PATH.open("r") as input_fp:
-    nums = [int(num) for num in input_fp.readline().strip().split(",")]
 
-nums_dict = {num: i + 1 for i, num in enumerate(nums[:-1])}
-consideration = nums[-1]
+def level2(input_path: Path = INPUT_FILE_PATH) -> int:
+    """
+    Level 2 solution
 
-for i in range(len(nums), 30_000_000):
-    if consideration in nums_dict:
-        new_last_num = i - nums_dict[consideration]
-    else:
-        new_last_num = 0
-    nums_dict[consideration] = i
-    consideration = new_last_num
+    Args:
+        input_path (Path): Puzzle input file
 
-result = consideration
+    Returns:
+        (int): Solution to the problem
+    """
+    # Read input
+    nums = list(read_input(input_path))
 
-print(result)
-print(submit_output(2020, 15, 2, result))
\ No newline at end of file
+    return play(nums, 30_000_000)
+
+
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 15, 2, result))
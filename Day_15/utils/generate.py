@@ -0,0 +1,60 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+
+# Number of starting numbers in a real input
+_BASE_COUNT = 7
+# Turns whose spoken numbers are asked for by both levels
+_TURNS = (2020, 30_000_000)
+
+
+def _spoken(starting: list[int], turns: int) -> int:
+    """
+    Play the memory game the way `Level 2.py` first did, with a dict, so that
+      the answers do not depend on the engine they check
+
+    Args:
+        starting (list[int]): Starting numbers
+        turns    (int)      : Number of turns to play
+
+    Returns:
+        (int): The last number spoken
+    """
+    nums_dict = {num: i + 1 for i, num in enumerate(starting[:-1])}
+    consideration = starting[-1]
+    for i in range(len(starting), turns):
+        if consideration in nums_dict:
+            new_last_num = i - nums_dict[consideration]
+        else:
+            new_last_num = 0
+        nums_dict[consideration] = i
+        consideration = new_last_num
+    return consideration
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    The number of turns is part of the puzzle, so `size` only scales the number
+      of starting numbers
+
+    Args:
+        size (float): Number of starting numbers, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = min(max(round(_BASE_COUNT * size), 1), _TURNS[0] - 1)
+
+    starting = rng.sample(range(max(3 * count, 21)), count)
+    text = f"{','.join(map(str, starting))}\n"
+    return text, (_spoken(starting, _TURNS[0]), _spoken(starting, _TURNS[1]))
@@ -0,0 +1,25 @@
+/*
+ * Van Eck sequence inner loop, for the "c" backend of `van_eck.py`
+ *
+ * Built into a shared library on first use, and called through ctypes. The
+ *   caller allocates `last_seen`, with room for every number that can be
+ *   spoken, and seeds it with the starting numbers, which it has checked to be
+ *   in range: nothing is bounds-checked here
+ */
+
+#include <stdint.h>
+
+/*
+ * Play turns `start` to `end` - 1, `num` having been spoken on turn `start`;
+ *   turns are stored from 1, so that 0 means never spoken. Returns the number
+ *   spoken on turn `end`
+ */
+uint32_t van_eck(uint32_t num, uint32_t start, uint32_t end,
+                 uint32_t *last_seen) {
+    for (uint32_t turn = start; turn < end; turn++) {
+        uint32_t seen = last_seen[num];
+        last_seen[num] = turn;
+        num = seen ? turn - seen : 0;
+    }
+    return num;
+}
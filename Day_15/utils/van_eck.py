@@ -0,0 +1,285 @@
+"""
+Module: Van Eck sequence engine
+
+The turn each number was last spoken is kept in a preallocated array indexed by
+  the number, 4 bytes per possible number, instead of a dict entry per number
+  spoken. A number spoken on turn `t` is at most `t - 1`, so the array never
+  needs more entries than turns (or than the largest starting number)
+
+The loop itself runs on one of several backends, fastest first:
+  c     : `van_eck.c`, built with the system C compiler on first use and
+          loaded through ctypes
+  numba : The Python loop, JIT-compiled, if numba is installed
+  python: The plain Python loop, always available
+
+Long games can be saved to a memory-mapped checkpoint file every so often, and
+  resume from it after being killed
+
+Public Functions:
+    available_backends: Names of the backends that can run here
+    play              : Play the memory game and get the number spoken on a
+                        given turn
+
+Public Constants:
+    BACKENDS (tuple[str, ...]): Names of all the backends, fastest first
+"""
+
+import ctypes
+import hashlib
+import os
+import shutil
+import subprocess
+import sysconfig
+from array import array
+from contextlib import ExitStack
+from functools import cache
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from aoc_io.checkpoint import Checkpoint, Progress, ProgressCallback, open_checkpoint
+from aoc_io.instrument import count, span
+
+# Number spoken on the first turn, first turn, end turn, last-seen table ->
+#   number spoken on the end turn
+_Engine = Callable[[int, int, int, array], int]
+
+# Largest turn number the array can store
+_MAX_TURNS = 2**32 - 1
+
+# Turns played between progress reports and checkpoints
+CHUNK_TURNS = 1 << 22
+
+_C_SOURCE_PATH = Path(__file__).resolve().with_name("van_eck.c")
+_BUILD_DIR = _C_SOURCE_PATH.parent / "build"
+
+
+def _python_engine(num: int, start: int, end: int, last_seen: array) -> int:
+    """
+    The plain Python loop
+
+    Args:
+        num       (int)  : The number spoken on turn `start`
+        start     (int)  : First turn to play
+        end       (int)  : The turn whose number is wanted
+        last_seen (array): Turn-last-spoken array, up to turn `start` - 1
+
+    Returns:
+        (int): The number spoken on turn `end`
+    """
+    for turn in range(start, end):
+        seen = last_seen[num]
+        last_seen[num] = turn
+        num = turn - seen if seen else 0
+    return num
+
+
+def _load_python() -> Optional[_Engine]:
+    """
+    Load the plain Python backend
+
+    Returns:
+        (Optional[_Engine]): The engine
+    """
+    return _python_engine
+
+
+def _load_numba() -> Optional[_Engine]:
+    """
+    Load the numba backend, compiling the Python loop
+
+    Returns:
+        (Optional[_Engine]): The engine, or None if numba is not installed
+    """
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return None
+
+    # Compiled on the first call, then cached in `__pycache__`
+    jitted = numba.njit(cache=True)(_python_engine)
+
+    def engine(num: int, start: int, end: int, last_seen: array) -> int:
+        return int(jitted(num, start, end, np.frombuffer(last_seen, dtype=np.uint32)))
+
+    return engine
+
+
+def _build_c() -> Optional[Path]:
+    """
+    Build `van_eck.c` into a shared library, unless already built
+
+    Libraries are named after the hash of the source, so editing it triggers a
+      rebuild. The compiler is `$CC`, or `cc`
+
+    Returns:
+        (Optional[Path]): The library, or None if it cannot be built
+    """
+    digest = hashlib.sha256(_C_SOURCE_PATH.read_bytes()).hexdigest()[:16]
+    suffix = sysconfig.get_config_var("SHLIB_SUFFIX") or ".so"
+    library = _BUILD_DIR / f"van_eck_{digest}{suffix}"
+    if library.exists():
+        return library
+    compiler = os.environ.get("CC", "cc")
+    if shutil.which(compiler) is None:
+        return None
+    _BUILD_DIR.mkdir(exist_ok=True)
+    # Build then rename, so that parallel solvers never load half a library
+    tmp_library = library.with_name(f"{library.name}.{os.getpid()}.tmp")
+    try:
+        subprocess.run(
+            [compiler, "-O2", "-shared", "-fPIC", "-o", tmp_library, _C_SOURCE_PATH],
+            check=True,
+            capture_output=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        tmp_library.unlink(missing_ok=True)
+        return None
+    os.replace(tmp_library, library)
+    return library
+
+
+def _load_c() -> Optional[_Engine]:
+    """
+    Load the C backend, building it if needed
+
+    Returns:
+        (Optional[_Engine]): The engine, or None if it cannot be built or
+                             loaded
+    """
+    if (library := _build_c()) is None:
+        return None
+    try:
+        van_eck = ctypes.CDLL(str(library)).van_eck
+    except (OSError, AttributeError):
+        return None
+    uint32 = ctypes.c_uint32
+    van_eck.argtypes = (uint32, uint32, uint32, ctypes.POINTER(uint32))
+    van_eck.restype = uint32
+
+    def engine(num: int, start: int, end: int, last_seen: array) -> int:
+        table = (uint32 * len(last_seen)).from_buffer(last_seen)
+        return van_eck(num, start, end, table)
+
+    return engine
+
+
+_LOADERS: dict[str, Callable[[], Optional[_Engine]]] = {
+    "c": _load_c,
+    "numba": _load_numba,
+    "python": _load_python,
+}
+BACKENDS = tuple(_LOADERS)
+
+
+@cache
+def _get_engine(backend: str) -> Optional[_Engine]:
+    """
+    Load a backend, once
+
+    Args:
+        backend (str): Name of the backend
+
+    Returns:
+        (Optional[_Engine]): The engine, or None if the backend cannot run here
+    """
+    return _LOADERS[backend]()
+
+
+def available_backends() -> list[str]:
+    """
+    Names of the backends that can run here, loading them all
+
+    Returns:
+        (list[str]): The backends, fastest first
+    """
+    return [backend for backend in BACKENDS if _get_engine(backend) is not None]
+
+
+def play(
+    starting: Sequence[int],
+    turns: int,
+    backend: Optional[str] = None,
+    checkpoint: Optional[Path] = None,
+    progress: Optional[ProgressCallback] = None,
+    chunk: int = CHUNK_TURNS,
+) -> int:
+    """
+    Play the memory game and get the number spoken on a given turn
+
+    Args:
+        starting   (Sequence[int])           : Starting numbers; must not be
+                                               empty
+        turns      (int)                     : The turn whose number is
+                                               wanted, from 1
+        backend    (Optional[str])           : One of `BACKENDS`; defaults to
+                                               the fastest that can run here
+        checkpoint (Optional[Path])          : File to save the game to, at
+                                               most every `SAVE_INTERVAL`
+                                               seconds, and resume from if it
+                                               holds this game
+        progress   (Optional[ProgressCallback]): Called every `chunk` turns
+                                                 with the turns played, the
+                                                 total and the ETA
+        chunk      (int)                     : Turns between progress
+                                               reports and checkpoints
+
+    Returns:
+        (int): The number spoken on that turn
+
+    Raises:
+        ValueError: When there are no starting numbers, no turns, negative
+                    numbers, numbers or turns too large for the array to
+                    store, or the backend cannot run
+    """
+    if not starting:
+        raise ValueError("No starting numbers")
+    if turns < 1:
+        raise ValueError(f"{turns=} is not a turn; turns start from 1")
+    if turns > _MAX_TURNS or max(starting) > _MAX_TURNS:
+        raise ValueError(f"Turns and numbers must be at most {_MAX_TURNS}")
+    # They index `last_seen`, which the C loop does not bounds-check
+    if min(starting) < 0:
+        raise ValueError(f"Starting numbers must not be negative: {min(starting)}")
+    if turns <= len(starting):
+        return starting[turns - 1]
+
+    if backend is None:
+        # The python backend is always available
+        backend = next(name for name in BACKENDS if _get_engine(name) is not None)
+    elif backend not in _LOADERS:
+        raise ValueError(f"Unknown backend: {backend}")
+    if (engine := _get_engine(backend)) is None:
+        raise ValueError(f"The {backend} backend cannot run here")
+
+    size = max(turns, max(starting) + 1)
+    last_seen = array("I", [0]) * size
+    turn = num = 0
+    with ExitStack() as stack:
+        state: Optional[Checkpoint] = None
+        if checkpoint is not None:
+            key = f"van_eck {list(starting)} {turns}"
+            state = stack.enter_context(open_checkpoint(checkpoint, key, size))
+            if state.resumed:
+                state.restore(last_seen)
+                turn, num = state.step, state.state
+        if not turn:
+            # Turns are stored from 1, so that 0 means never spoken
+            for turn, num in enumerate(starting[:-1], 1):
+                last_seen[num] = turn
+            turn, num = len(starting), starting[-1]
+
+        first_turn = turn
+        tracker = Progress(turns, turn, progress)
+        # Unless checkpointed or reported, the game runs in one go
+        step = chunk if state is not None or progress is not None else turns
+        with span(f"van_eck.{backend}"):
+            while turn < turns:
+                end = min(turn + step, turns)
+                num = engine(num, turn, end, last_seen)
+                turn = end
+                if state is not None:
+                    state.save(turn, num, last_seen, force=turn == turns)
+                tracker.update(turn)
+    count("turns", turns - first_turn)
+    return num
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Optional
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_16.utils.read_input import read_input
 
 _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
@@ -239,44 +240,29 @@ class _RuleColumnMap:
         return bool(added_cols)
 
 
-def _read_input() -> tuple[dict[str, _Rule], list[int], dict[int, _Column]]:
+def _organize(
+    rules: dict[str, frozenset[int]], nearby_tickets: list[list[int]]
+) -> tuple[dict[str, _Rule], dict[int, _Column]]:
     """
-    Read and parse the input file
+    Build the rules, and the columns of the valid nearby tickets
+
+    Args:
+        rules          (dict[str, frozenset[int]]): Rule name-valid values
+                                                    mapping
+        nearby_tickets (list[list[int]])          : Nearby tickets, valid or not
 
     Returns:
-        (dict[str, _Rule]): Rule name-valid values mapping
-        (list[int])       : Your ticket
-        (list[_Column])   : List of nearby valid tickets, organized by column
+        (dict[str, _Rule])  : Rule name-rule mapping
+        (dict[int, _Column]): List of nearby valid tickets, organized by column
     """
-    with _INPUT_FILE_PATH.open("r") as fp:
-        # Rules
-        rule_nums = set()
-        rules: dict[str, _Rule] = {}
-        while (line := fp.readline().strip()) :
-            name, rules_str = line.split(": ")
-            ranges: set[int] = set()
-            for rule in rules_str.split(" or "):
-                start, end = rule.split("-")
-                ranges |= set(range(int(start), int(end) + 1))
-            rule = _Rule(name, frozenset(ranges))
-            rules[rule.name] = rule
-            rule_nums |= rule.ranges
-        # Your ticket
-        fp.readline()
-        your_ticket = [int(n) for n in fp.readline().strip().split(",")]
-        # Nearby tickets
-        for _ in range(2):
-            fp.readline()
-        nearby_tickets: list[list[int]] = []
-        for line in fp:
-            ticket = [int(n) for n in line.strip().split(",")]
-            if all(num in rule_nums for num in ticket):
-                nearby_tickets.append(ticket)
-        ticket_cols = {
-            i: _Column(i, frozenset(col)) for i, col in enumerate(zip(*nearby_tickets))
-        }
-
-    return rules, your_ticket, ticket_cols
+    rule_nums: set[int] = set().union(*rules.values())
+    valid_tickets = [
+        ticket for ticket in nearby_tickets if all(num in rule_nums for num in ticket)
+    ]
+    ticket_cols = {
+        i: _Column(i, frozenset(col)) for i, col in enumerate(zip(*valid_tickets))
+    }
+    return {name: _Rule(name, ranges) for name, ranges in rules.items()}, ticket_cols
 
 
 def _initialize(rules: dict[str, _Rule], cols: dict[int, _Column]) -> None:
@@ -292,14 +278,18 @@ def _initialize(rules: dict[str, _Rule], cols: dict[int, _Column]) -> None:
         rule.add_valid(col)
 
 
-def level2() -> int:
+def level2(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 2 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    rules, your_ticket, cols = _read_input()
+    rule_ranges, your_ticket, nearby_tickets = read_input(input_path)
+    rules, cols = _organize(rule_ranges, nearby_tickets)
 
     _initialize(rules, cols)
 
@@ -325,7 +315,7 @@ def level2() -> int:
     return prod(your_ticket[i] for i in indices)
 
 
-result = level2()
-
-print(result)
-print(submit_output(2020, 16, 2, result))
\ No newline at end of file
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 16, 2, result))
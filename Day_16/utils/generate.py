@@ -0,0 +1,148 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from math import prod, sqrt
+from random import Random
+
+# Number of fields and nearby tickets in a real input
+_BASE_FIELDS = 20
+_BASE_TICKETS = 240
+# Fields whose values are multiplied by level 2
+_DEPARTURES = 6
+_NAMES = [
+    "arrival location",
+    "arrival station",
+    "arrival platform",
+    "arrival track",
+    "class",
+    "duration",
+    "price",
+    "route",
+    "row",
+    "seat",
+    "train",
+    "type",
+    "wagon",
+    "zone",
+]
+_DEPARTURE_NAMES = ["location", "station", "platform", "track", "date", "time"]
+
+
+def _pick(rng: Random, ranges: tuple[int, int, int, int]) -> int:
+    """
+    Pick a value that satisfies a rule
+
+    Args:
+        rng    (Random)                    : Random number generator
+        ranges (tuple[int, int, int, int]): Bounds of both ranges of the rule
+
+    Returns:
+        (int): A valid value
+    """
+    lo, a, b, hi = ranges
+    value = rng.randint(lo, hi - (b - a - 1))
+    return value if value <= a else value + (b - a - 1)
+
+
+def _ticket(
+    rng: Random, ranges: list[tuple[int, int, int, int]], columns: list[int]
+) -> list[int]:
+    """
+    Generate a valid ticket
+
+    Args:
+        rng     (Random)                          : Random number generator
+        ranges  (list[tuple[int, int, int, int]]): Rules of the fields
+        columns (list[int])                       : Column of each field
+
+    Returns:
+        (list[int]): Values of the ticket, by column
+    """
+    values = [0] * len(columns)
+    for field, column in enumerate(columns):
+        values[column] = _pick(rng, ranges[field])
+    return values
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    The valid values of the fields are nested, each field having a few values
+      that no later field accepts. Only the last field then fits a single
+      column, and fields can be matched one at a time from the last one, like
+      in real inputs
+
+    Args:
+        size (float): Number of fields and of nearby tickets, each relative to a
+                        real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    scale = sqrt(size)
+    fields = max(round(_BASE_FIELDS * scale), _DEPARTURES)
+    tickets = max(round(_BASE_TICKETS * scale), 1)
+
+    # `lo-a or b-hi` for every field; each field accepts a subset of the values
+    #   of the previous one, minus at least the top of the lower range
+    lo = rng.randint(25, 50)
+    hi = 50 * fields + rng.randint(100, 150)
+    a = (lo + hi) // 2 + rng.randint(-5, 5)
+    b = a + rng.randint(2, 10)
+    ranges: list[tuple[int, int, int, int]] = []
+    for _ in range(fields):
+        ranges.append((lo, a, b, hi))
+        lo += rng.randint(0, 1)
+        a -= rng.randint(1, 15)
+        b += rng.randint(1, 15)
+        hi -= rng.randint(0, 2)
+
+    names = [f"departure {name}" for name in _DEPARTURE_NAMES]
+    names += _NAMES[: fields - _DEPARTURES]
+    names += [f"extra {i}" for i in range(len(names), fields)]
+    rng.shuffle(names)
+    columns = list(range(fields))
+    rng.shuffle(columns)
+
+    nearby = [_ticket(rng, ranges, columns) for _ in range(tickets)]
+    # Values that rule out the next field for each column
+    for field, column in enumerate(columns[:-1]):
+        a_next = ranges[field + 1][1]
+        rng.choice(nearby)[column] = rng.randint(a_next + 1, ranges[field][1])
+    # Invalid tickets are mixed in afterwards, so that the values above stay
+    #   on valid tickets; their invalid value is outside of every field
+    error_rate = 0
+    lowest, *_, highest = ranges[0]
+    for _ in range(tickets // 4):
+        values = _ticket(rng, ranges, columns)
+        invalid = rng.choice(
+            (rng.randint(0, lowest - 1), rng.randint(highest + 1, highest + 30))
+        )
+        values[rng.randrange(fields)] = invalid
+        nearby.insert(rng.randint(0, len(nearby)), values)
+        error_rate += invalid
+
+    yours = _ticket(rng, ranges, columns)
+    departure = prod(
+        yours[column]
+        for field, column in enumerate(columns)
+        if names[field].startswith("departure")
+    )
+
+    lines = [
+        f"{name}: {r[0]}-{r[1]} or {r[2]}-{r[3]}" for name, r in zip(names, ranges)
+    ]
+    order = list(range(fields))
+    rng.shuffle(order)
+    text = "".join(f"{lines[i]}\n" for i in order)
+    text += f"\nyour ticket:\n{','.join(map(str, yours))}\n\nnearby tickets:\n"
+    text += "".join(f"{','.join(map(str, values))}\n" for values in nearby)
+    return text, (error_rate, departure)
@@ -0,0 +1,44 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+
+from aoc_io.loader import iter_records
+from aoc_io.parse_cache import cached_parse
+
+
+@cached_parse(version=1)
+def read_input(
+    path: Path,
+) -> tuple[dict[str, frozenset[int]], list[int], list[list[int]]]:
+    """
+    Read and parse the input file
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (dict[str, frozenset[int]]): Rule name-valid values mapping
+        (list[int])                : Your ticket
+        (list[list[int]])          : Nearby tickets, valid or not
+    """
+    # The other records start with a header line
+    rule_lines, (_, your_line), (_, *nearby_lines) = iter_records(path)
+    # Rules
+    rules: dict[str, frozenset[int]] = {}
+    for line in rule_lines:
+        name, ranges_str = line.split(": ")
+        ranges: set[int] = set()
+        for r in ranges_str.split(" or "):
+            start, end = r.split("-")
+            ranges |= set(range(int(start), int(end) + 1))
+        rules[name] = frozenset(ranges)
+    # Your ticket
+    your_ticket = [int(n) for n in your_line.split(",")]
+    # Nearby tickets
+    nearby_tickets = [[int(n) for n in line.split(",")] for line in nearby_lines]
+    return rules, your_ticket, nearby_tickets
@@ -0,0 +1,67 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from collections import Counter
+from itertools import product
+from math import sqrt
+from random import Random
+
+# Side of the initial slice in a real input
+_BASE_SIDE = 8
+_CYCLES = 6
+
+
+def _boot(active: set[tuple[int, int]], dimensions: int) -> int:
+    """
+    Run the boot process of the pocket dimension
+
+    Args:
+        active     (set[tuple[int, int]]): Active cubes of the initial slice
+        dimensions (int)                 : Number of dimensions
+
+    Returns:
+        (int): Number of active cubes after the boot process
+    """
+    cubes = {(x, y, *(0,) * (dimensions - 2)) for x, y in active}
+    offsets = [
+        offset for offset in product((-1, 0, 1), repeat=dimensions) if any(offset)
+    ]
+    for _ in range(_CYCLES):
+        counts = Counter(
+            tuple(c + d for c, d in zip(cube, offset))
+            for cube in cubes
+            for offset in offsets
+        )
+        cubes = {
+            cube
+            for cube, count in counts.items()
+            if count == 3 or (count == 2 and cube in cubes)
+        }
+    return len(cubes)
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Args:
+        size (float): Area of the initial slice, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    side = max(round(_BASE_SIDE * sqrt(size)), 1)
+
+    grid = [[rng.random() < 0.5 for _ in range(side)] for _ in range(side)]
+    active = {
+        (x, y) for x, row in enumerate(grid) for y, cell in enumerate(row) if cell
+    }
+    text = "".join("".join("#" if cell else "." for cell in row) + "\n" for row in grid)
+    return text, (_boot(active, 3), _boot(active, 4))
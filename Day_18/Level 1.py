@@ -8,22 +8,23 @@ from operator import add, mul
 from typing import Callable
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from aoc_io.loader import iter_lines
 
 _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def _read_input() -> list[str]:
+def _read_input(path: Path) -> list[str]:
     """
     Read and parse the input file
 
+    Args:
+        path (Path): Input file path
+
     Returns:
         (list[str]): Puzzle input
     """
-    with _INPUT_FILE_PATH.open("r") as fp:
-        lines = [line for l in fp if (line := l.strip())]
-
-    return lines
+    return list(iter_lines(path))
 
 
 def _solve_simple(formula: str) -> int:
@@ -68,18 +69,21 @@ def _solve_line(line: str) -> int:
     return _solve_simple(line)
 
 
-def level1() -> int:
+def level1(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 1 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    lines = _read_input()
+    lines = _read_input(input_path)
     return sum(_solve_line(line) for line in lines)
 
 
-result = level1()
-
-print(result)
-print(submit_output(2020, 18, 1, result))
+if __name__ == "__main__":
+    result = level1()
+    print(result)
+    print(submit_output(2020, 18, 1, result))
@@ -8,38 +8,47 @@ from pathlib import Path
 from forbiddenfruit import curse
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from aoc_io.loader import iter_lines
 
 _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def _read_input() -> list[str]:
+def _read_input(path: Path) -> list[str]:
     """
     Read and parse the input file
 
+    Args:
+        path (Path): Input file path
+
     Returns:
         (list[list[bool]]): Puzzle input
     """
-    with _INPUT_FILE_PATH.open("r") as fp:
-        lines = [line for l in fp if (line := l.strip())]
-
-    return lines
+    return list(iter_lines(path))
 
 
-def level2() -> int:
+def level2(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 2 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    lines = _read_input()
-    return sum(eval(line.replace("+", "**")) for line in lines)
-
-
-curse(int, "__pow__", lambda self, other: self + other)  # type: ignore
-
-result = level2()
-
-print(result)
-print(submit_output(2020, 18, 2, result))
+    lines = _read_input(input_path)
+    # Only swap the operator while evaluating, so importing this module
+    #   leaves `int` untouched
+    original = int.__pow__
+    curse(int, "__pow__", lambda self, other: self + other)  # type: ignore
+    try:
+        return sum(eval(line.replace("+", "**")) for line in lines)
+    finally:
+        curse(int, "__pow__", original)
+
+
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 18, 2, result))
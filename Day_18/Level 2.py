@@ -6,22 +6,23 @@ import re
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from aoc_io.loader import iter_lines
 
 _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def _read_input() -> list[str]:
+def _read_input(path: Path) -> list[str]:
     """
     Read and parse the input file
 
+    Args:
+        path (Path): Input file path
+
     Returns:
         (list[str]): Puzzle input
     """
-    with _INPUT_FILE_PATH.open("r") as fp:
-        lines = [line for l in fp if (line := l.strip())]
-
-    return lines
+    return list(iter_lines(path))
 
 
 def _solve_simple(formula: str) -> int:
@@ -66,18 +67,21 @@ def _solve_line(line: str) -> int:
     return _solve_simple(line)
 
 
-def level2() -> int:
+def level2(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 2 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    lines = _read_input()
+    lines = _read_input(input_path)
     return sum(_solve_line(line) for line in lines)
 
 
-result = level2()
-
-print(result)
-print(submit_output(2020, 18, 2, result))
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 18, 2, result))
@@ -0,0 +1,79 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from math import prod
+from random import Random
+
+# Number of expressions in a real input
+_BASE_COUNT = 380
+# Deepest nesting of parentheses in a real input
+_MAX_DEPTH = 2
+
+
+def _expression(rng: Random, depth: int) -> tuple[str, int, int]:
+    """
+    Generate an expression, along with its values under both sets of rules
+
+    Args:
+        rng   (Random): Random number generator
+        depth (int)   : Number of parentheses the expression is nested in
+
+    Returns:
+        (str): The expression
+        (int): Its value when evaluating from left to right
+        (int): Its value when evaluating additions before multiplications
+    """
+    operand_count = rng.randint(2, 6)
+    terms: list[str] = []
+    value1 = 0
+    # Level 2 multiplies sums together
+    sums = [0]
+    for i in range(operand_count):
+        if depth < _MAX_DEPTH and rng.random() < 0.25:
+            text, operand1, operand2 = _expression(rng, depth + 1)
+            text = f"({text})"
+        else:
+            operand1 = operand2 = rng.randint(2, 9)
+            text = str(operand1)
+        if not i:
+            value1 = operand1
+            sums[-1] = operand2
+        elif rng.random() < 0.5:
+            terms.append("+")
+            value1 += operand1
+            sums[-1] += operand2
+        else:
+            terms.append("*")
+            value1 *= operand1
+            sums.append(operand2)
+        terms.append(text)
+    return " ".join(terms), value1, prod(sums)
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Args:
+        size (float): Number of expressions, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 1)
+
+    lines: list[str] = []
+    total1 = total2 = 0
+    for _ in range(count):
+        text, value1, value2 = _expression(rng, 0)
+        lines.append(text)
+        total1 += value1
+        total2 += value2
+    return "".join(f"{line}\n" for line in lines), (total1, total2)
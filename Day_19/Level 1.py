@@ -6,56 +6,62 @@ import re
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_19.utils.read_input import read_input
 
 _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
+# The stored input carries the part 2 replacements of rules 8 and 11, which
+#   loop forever when expanded below; part 1 uses the original rules
+_PART_1_RULES = {"8": "42", "11": "42 31"}
 
-def _read_input() -> tuple[dict[str, list[str]], list[str]]:
-    """
-    Read and parse the input file
 
-    Returns:
-        (dict[str, list[str]]): All the rules
-        (list[str])           : All the texts
+def _to_regex(rules: dict[str, str]) -> str:
     """
-    rules = {}
-    with _INPUT_FILE_PATH.open("r") as fp:
-        while (line := fp.readline().strip()) :
-            id_, pattern = line.split(": ")
-            rules[id_] = ["("] + pattern.split() + [")"]
-
-        texts = [line for l in fp if (line := l.strip())]
-
-    return rules, texts
-
+    Expand rule 0 into a regex
 
-def level1() -> int:
-    """
-    Level 1 solution
+    Args:
+        rules (dict[str, str]): Rule ID-pattern mapping
 
     Returns:
-        (int): Solution to the problem
+        (str): Regex pattern of rule 0
     """
-    rules, texts = _read_input()
+    tokens = {id_: ["("] + pattern.split() + [")"] for id_, pattern in rules.items()}
+
+    # Substitute rule references until only literals are left
     while True:
         changed = False
-        for id_, pattern_li in rules.items():
+        for id_, pattern_li in tokens.items():
             new_pattern_li = []
             for pattern in pattern_li:
                 if pattern in {"|", "(", ")"} or pattern[0] == '"':
                     new_pattern_li.append(pattern)
                 else:
                     changed = True
-                    new_pattern_li += rules[pattern]
-            rules[id_] = new_pattern_li
+                    new_pattern_li += tokens[pattern]
+            tokens[id_] = new_pattern_li
         if not changed:
             break
-    rule = re.compile("".join(rules["0"]).replace('"', ""))
-    return sum(bool(rule.fullmatch(text)) for text in texts)
 
+    return "".join(tokens["0"]).replace('"', "")
+
+
+def level1(input_path: Path = _INPUT_FILE_PATH) -> int:
+    """
+    Level 1 solution
+
+    Args:
+        input_path (Path): Puzzle input file
+
+    Returns:
+        (int): Solution to the problem
+    """
+    rules, texts = read_input(input_path)
+    rule = re.compile(_to_regex({**rules, **_PART_1_RULES}))
+    return sum(bool(rule.fullmatch(text)) for text in texts)
 
-result = level1()
 
-print(result)
-print(submit_output(2020, 19, 1, result))
+if __name__ == "__main__":
+    result = level1()
+    print(result)
+    print(submit_output(2020, 19, 1, result))
@@ -7,46 +7,43 @@ from pathlib import Path
 from lark import Lark, LarkError
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_19.utils.read_input import read_input
 
 _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def _read_input() -> tuple[str, list[str]]:
+def _to_grammar(rules: dict[str, str]) -> str:
     """
-    Read and parse the input file
+    Convert the rules into a Lark grammar
+
+    Args:
+        rules (dict[str, str]): Rule ID-pattern mapping
 
     Returns:
-        (str)      : All the rules, newline-separated
-        (list[str]): All the texts
+        (str): All the rules, newline-separated
     """
-    with _INPUT_FILE_PATH.open("r") as fp:
-        rules, messages = fp.read().split("\n\n")
-
-    # 8 special case
-    rules = rules.replace("8: 42", "8: 42 | 42 8")
-
-    # 11 special case
-    rules = rules.replace("11: 42 31", "11: 42 31 | 42 11 31")
+    # 8 and 11 special cases
+    rules = {**rules, "8": "42 | 42 8", "11": "42 31 | 42 11 31"}
+    grammar = "\n".join(f"{id_}: {pattern}" for id_, pattern in rules.items())
 
     # Convert all the numbers to letters
-    rules = rules.translate(str.maketrans("123456789", "cdefghijk"))
-    rules = rules.replace("0", "start")
-
-    texts = [line.strip() for l in messages.splitlines() if (line := l.strip())]
+    grammar = grammar.translate(str.maketrans("123456789", "cdefghijk"))
+    return grammar.replace("0", "start")
 
-    return rules, texts
 
-
-def level2() -> int:
+def level2(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 2 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    rules, texts = _read_input()
-    parser = Lark(rules)
+    rules, texts = read_input(input_path)
+    parser = Lark(_to_grammar(rules))
 
     result = 0
     for text in texts:
@@ -60,7 +57,7 @@ def level2() -> int:
     return result
 
 
-result = level2()
-
-print(result)
-print(submit_output(2020, 19, 2, result))
\ No newline at end of file
+if __name__ == "__main__":
+    result = level2()
+    print(result)
+    print(submit_output(2020, 19, 2, result))
@@ -0,0 +1,114 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from random import Random
+
+# Number of messages in a real input
+_BASE_COUNT = 454
+# Length of the messages matched by rules 42 and 31
+_CHUNK = 8
+# Rule IDs that the puzzle refers to
+_FIXED_IDS = {0, 8, 11, 31, 42}
+
+
+def _rules(rng: Random) -> list[str]:
+    """
+    Generate the rules
+
+    Rule 42 matches chunks with an even number of "b", and rule 31 matches the
+      ones with an odd number of "b"; both are built from chunks one letter
+      shorter at a time
+
+    Args:
+        rng (Random): Random number generator
+
+    Returns:
+        (list[str]): Lines of rules, in a random order
+    """
+    ids = iter(
+        rng.sample([i for i in range(1, 134) if i not in _FIXED_IDS], 2 * _CHUNK)
+    )
+    a = next(ids)
+    b = next(ids)
+    lines = [f'{a}: "a"', f'{b}: "b"', "0: 8 11", "8: 42", "11: 42 31"]
+    # IDs of the rules matching even and odd chunks of the current length
+    even = a
+    odd = b
+    for length in range(2, _CHUNK + 1):
+        if length < _CHUNK:
+            new_even, new_odd = next(ids), next(ids)
+        else:
+            new_even, new_odd = 42, 31
+        lines.append(f"{new_even}: {a} {even} | {b} {odd}")
+        lines.append(f"{new_odd}: {a} {odd} | {b} {even}")
+        even, odd = new_even, new_odd
+    rng.shuffle(lines)
+    return lines
+
+
+def _chunk(rng: Random, even: bool) -> str:
+    """
+    Generate a chunk matched by rule 42 or 31
+
+    Args:
+        rng  (Random): Random number generator
+        even (bool)  : Whether to match rule 42, rather than rule 31
+
+    Returns:
+        (str): The chunk
+    """
+    letters = [rng.choice("ab") for _ in range(_CHUNK - 1)]
+    letters.append("b" if (letters.count("b") % 2 == 0) != even else "a")
+    return "".join(letters)
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Messages are made of chunks matched by rule 42 or 31. Level 1 matches
+      messages made of 42 42 31, and level 2 messages made of `a` times 42 then
+      `b` times 31, with a > b >= 1
+
+    Args:
+        size (float): Number of messages, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 1)
+
+    messages: list[str] = []
+    matches1 = matches2 = 0
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.25:
+            evens = [True, True, False]
+        elif kind < 0.6:
+            odd_count = rng.randint(1, 4)
+            even_count = rng.randint(odd_count + 1, 6)
+            evens = [True] * even_count + [False] * odd_count
+        else:
+            evens = [rng.random() < 0.5 for _ in range(rng.randint(1, 10))]
+        message = "".join(_chunk(rng, even) for even in evens)
+        # Drop or add a letter, which matches nothing
+        if rng.random() < 0.1:
+            message = message[:-1] if rng.random() < 0.5 else message + rng.choice("ab")
+            evens = []
+        messages.append(message)
+
+        matches1 += evens == [True, True, False]
+        even_count = evens.index(False) if False in evens else len(evens)
+        odd_count = len(evens) - even_count
+        matches2 += even_count > odd_count >= 1 and not any(evens[even_count:])
+
+    text = "".join(f"{line}\n" for line in _rules(rng))
+    text += "\n" + "".join(f"{message}\n" for message in messages)
+    return text, (matches1, matches2)
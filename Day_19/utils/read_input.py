@@ -0,0 +1,31 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+from pathlib import Path
+
+from aoc_io.loader import iter_records
+from aoc_io.parse_cache import cached_parse
+
+
+@cached_parse(version=1)
+def read_input(path: Path) -> tuple[dict[str, str], list[str]]:
+    """
+    Read and parse the input file
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (dict[str, str]): Rule ID-pattern mapping, in order of the input
+        (list[str])     : All the texts
+    """
+    rule_lines, texts = iter_records(path)
+    rules: dict[str, str] = {}
+    for line in rule_lines:
+        id_, pattern = line.split(": ")
+        rules[id_] = pattern
+    return rules, texts
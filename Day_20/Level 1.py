@@ -2,51 +2,17 @@
 """
 Solution to part 1
 """
-import re
 from math import prod
 from pathlib import Path
-from typing import Optional
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
 from Day_20.utils.image import ImagePiece
+from Day_20.utils.read_input import read_input
 
 _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def _read_input() -> dict[int, ImagePiece]:
-    """
-    Read and parse the input file
-
-    Returns:
-        (dict[int, ImagePiece]): All the image pieces
-    """
-    tile_re = re.compile(r"Tile (\d+):")
-    images: dict[int, ImagePiece] = {}
-
-    id_: Optional[int] = None
-    data: list[str] = []
-
-    with _INPUT_FILE_PATH.open("r") as fp:
-        for l in fp:
-            line = l.strip()
-            if not line:
-                assert id_ and data
-                images[id_] = ImagePiece(data)
-                id_ = None
-                data = []
-            elif (match := tile_re.fullmatch(line)) is not None:
-                id_ = int(match[1])
-            else:
-                data.append(line)
-        if id_ and data:
-            images[id_] = ImagePiece(data)
-            id_ = None
-            data = []
-
-    return images
-
-
 def _get_corners(images: dict[int, ImagePiece]) -> set[int]:
     """
     Get corners of the map
@@ -85,14 +51,17 @@ def _get_corners(images: dict[int, ImagePiece]) -> set[int]:
     return corners
 
 
-def level1() -> int:
+def level1(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 1 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    images = _read_input()
+    images = read_input(input_path)
     corners = _get_corners(images)
     if len(corners) != 4:
         raise ValueError(corners)
@@ -2,12 +2,12 @@
 """
 Solution to part 2
 """
-import re
 from pathlib import Path
 from typing import Optional
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
 from Day_20.utils.image import ImagePiece, concat_images
+from Day_20.utils.read_input import read_input
 from Day_20.utils.corners import allocate_corners
 from Day_20.utils.sides import allocate_sides, gen_side_coords
 from Day_20.utils.rest import allocate_rest, gen_rest_coords
@@ -17,39 +17,6 @@ _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def _read_input() -> dict[int, ImagePiece]:
-    """
-    Read and parse the input file
-
-    Returns:
-        (dict[int, ImagePiece]): ID-image mapping of all images
-    """
-    tile_re = re.compile(r"Tile (\d+):")
-    images: dict[int, ImagePiece] = {}
-
-    id_: Optional[int] = None
-    data: list[str] = []
-
-    with _INPUT_FILE_PATH.open("r") as fp:
-        for l in fp:
-            line = l.strip()
-            if not line:
-                assert id_ and data
-                images[id_] = ImagePiece(data)
-                id_ = None
-                data = []
-            elif (match := tile_re.fullmatch(line)) is not None:
-                id_ = int(match[1])
-            else:
-                data.append(line)
-        if id_ and data:
-            images[id_] = ImagePiece(data)
-            id_ = None
-            data = []
-
-    return images
-
-
 def _get_corners_sides(images: dict[int, ImagePiece]) -> tuple[set[int], set[int]]:
     """
     Get corners and sides of the map
@@ -158,14 +125,17 @@ def _solve_map(
     return None
 
 
-def level2() -> int:
+def level2(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 2 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    all_images = _read_input()
+    all_images = read_input(input_path)
     corners, sides = _get_corners_sides(all_images)
     solution_map = _solve_map(all_images, corners, sides)
     if not solution_map:
@@ -0,0 +1,244 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from math import prod, sqrt
+from random import Random
+
+# Tiles on each side of a real image
+_BASE_TILES = 12
+# Fraction of "#" in a real image
+_DENSITY = 0.38
+# Sea monsters per tile
+_MONSTER_RATE = 0.3
+_SEA_MONSTER = [
+    "                  # ",
+    "#    ##    ##    ###",
+    " #  #  #  #  #  #   ",
+]
+
+
+def _rotate(rows: list[str]) -> list[str]:
+    """
+    Rotate a square clockwise
+
+    Args:
+        rows (list[str]): The square, by rows
+
+    Returns:
+        (list[str]): Rotated square
+    """
+    return ["".join(row[i] for row in reversed(rows)) for i in range(len(rows[0]))]
+
+
+def _orient(rows: list[str], orientation: int) -> list[str]:
+    """
+    Rotate and flip a square
+
+    Args:
+        rows        (list[str]): The square, by rows
+        orientation (int)      : One of the 8 orientations, 0-7 inclusive
+
+    Returns:
+        (list[str]): Oriented square
+    """
+    for _ in range(orientation % 4):
+        rows = _rotate(rows)
+    return [row[::-1] for row in rows] if orientation >= 4 else rows
+
+
+def _monster_patterns() -> list[list[tuple[int, int]]]:
+    """
+    Cells of the sea monster in all 8 orientations, the first one being the
+      original orientation
+
+    Returns:
+        (list[list[tuple[int, int]]]): Row-column offsets for each orientation
+    """
+    patterns: list[list[tuple[int, int]]] = []
+    width = len(_SEA_MONSTER[0])
+    square = [row.ljust(width) for row in _SEA_MONSTER] + [" " * width] * (
+        width - len(_SEA_MONSTER)
+    )
+    for orientation in range(8):
+        rows = _orient(square, orientation)
+        cells = [
+            (r, c) for r, row in enumerate(rows) for c, v in enumerate(row) if v == "#"
+        ]
+        top = min(r for r, _ in cells)
+        left = min(c for _, c in cells)
+        patterns.append([(r - top, c - left) for r, c in cells])
+    return patterns
+
+
+def _picture(rng: Random, side: int) -> tuple[list[list[str]], int]:
+    """
+    Generate the picture without borders, with sea monsters in the original
+      orientation only
+
+    Args:
+        rng  (Random): Random number generator
+        side (int)   : Side of the picture
+
+    Returns:
+        (list[list[str]]): The picture
+        (int)            : Number of sea monsters in it
+    """
+    picture = [
+        ["#" if rng.random() < _DENSITY else "." for _ in range(side)]
+        for _ in range(side)
+    ]
+    patterns = _monster_patterns()
+    height = max(r for r, _ in patterns[0]) + 1
+    width = max(c for _, c in patterns[0]) + 1
+
+    planted: set[tuple[int, int]] = set()
+    monsters: set[tuple[int, int]] = set()
+    for _ in range(round(_MONSTER_RATE * side * side / 64)):
+        if side < width:
+            break
+        row = rng.randrange(side - height + 1)
+        col = rng.randrange(side - width + 1)
+        cells = {(row + r, col + c) for r, c in patterns[0]}
+        if cells & planted:
+            continue
+        planted |= cells
+        monsters.add((row, col))
+        for r, c in cells:
+            picture[r][c] = "#"
+
+    # Break every other match by clearing one of its cells; clearing cells
+    #   never creates new matches
+    for orientation, pattern in enumerate(patterns):
+        height = max(r for r, _ in pattern) + 1
+        width = max(c for _, c in pattern) + 1
+        for row in range(side - height + 1):
+            for col in range(side - width + 1):
+                if orientation == 0 and (row, col) in monsters:
+                    continue
+                cells = [(row + r, col + c) for r, c in pattern]
+                if all(picture[r][c] == "#" for r, c in cells):
+                    r, c = rng.choice([cell for cell in cells if cell not in planted])
+                    picture[r][c] = "."
+    return picture, len(monsters)
+
+
+def _edge(rng: Random, used: set[str], length: int, start: str, end: str) -> str:
+    """
+    Generate a border that differs from all the used ones, even when flipped
+
+    Args:
+        rng    (Random)  : Random number generator
+        used   (set[str]): Borders used so far, both ways; updated in place
+        length (int)     : Length of the border
+        start  (str)     : First pixel
+        end    (str)     : Last pixel
+
+    Returns:
+        (str): The border
+
+    Raises:
+        ValueError: When no unused border is found after many tries
+    """
+    for _ in range(100):
+        border = start + "".join(rng.choice("#.") for _ in range(length - 2)) + end
+        if border != border[::-1] and border not in used:
+            used.add(border)
+            used.add(border[::-1])
+            return border
+    raise ValueError("Out of borders")
+
+
+def _edges(rng: Random, count: int, length: int) -> list[list[str]]:
+    """
+    Generate distinct borders shared by neighboring tiles
+
+    Args:
+        rng    (Random): Random number generator
+        count  (int)   : Number of tiles on each side
+        length (int)   : Side of a tile
+
+    Returns:
+        (list[list[str]]): Horizontal borders by row and column, then vertical
+                             borders by row and column; each read from left to
+                             right, or from top to bottom
+    """
+    while True:
+        # Pixels on the corners of tiles, shared by up to 4 tiles
+        corners = [
+            [rng.choice("#.") for _ in range(count + 1)] for _ in range(count + 1)
+        ]
+        used: set[str] = set()
+
+        try:
+            horizontal = [
+                [
+                    _edge(rng, used, length, corners[r][c], corners[r][c + 1])
+                    for c in range(count)
+                ]
+                for r in range(count + 1)
+            ]
+            vertical = [
+                [
+                    _edge(rng, used, length, corners[r][c], corners[r + 1][c])
+                    for c in range(count + 1)
+                ]
+                for r in range(count)
+            ]
+        except ValueError:
+            # Unlucky corners; start over
+            continue
+        return horizontal + vertical
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    All borders are distinct, even when flipped, so that tiles only fit their
+      neighbors. Tiles grow with the number of borders, from the real 10x10
+
+    Args:
+        size (float): Number of tiles, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_TILES * sqrt(size)), 2)
+    length = max(10, (2 * count * (count + 1)).bit_length() + 1)
+    inner = length - 2
+
+    picture, monsters = _picture(rng, count * inner)
+    edges = _edges(rng, count, length)
+    horizontal = edges[: count + 1]
+    vertical = edges[count + 1 :]
+
+    ids = rng.sample(range(1000, max(10000, 10 * count * count)), count * count)
+    tiles: list[tuple[int, list[str]]] = []
+    for r in range(count):
+        for c in range(count):
+            rows = [horizontal[r][c]]
+            for i in range(inner):
+                row = "".join(picture[r * inner + i][c * inner : (c + 1) * inner])
+                rows.append(vertical[r][c][i + 1] + row + vertical[r][c + 1][i + 1])
+            rows.append(horizontal[r + 1][c])
+            tiles.append((ids[r * count + c], _orient(rows, rng.randrange(8))))
+    corners = prod(
+        ids[i] for i in (0, count - 1, count * (count - 1), count * count - 1)
+    )
+    rng.shuffle(tiles)
+
+    text = "".join(
+        f"Tile {id_}:\n" + "".join(f"{row}\n" for row in rows) + "\n"
+        for id_, rows in tiles
+    )
+    roughness = sum(row.count("#") for row in picture) - monsters * sum(
+        row.count("#") for row in _SEA_MONSTER
+    )
+    return text, (corners, roughness)
@@ -0,0 +1,37 @@
+"""
+Module: Read and parse input file
+
+Public Functions:
+    read_input: Read and parse input file
+"""
+
+import re
+from pathlib import Path
+
+from aoc_io.loader import iter_records
+from aoc_io.parse_cache import cached_parse
+
+from .image import ImagePiece
+
+_TILE_RE = re.compile(r"Tile (\d+):")
+
+
+@cached_parse(version=1)
+def read_input(path: Path) -> dict[int, ImagePiece]:
+    """
+    Read and parse input file
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (dict[int, ImagePiece]): ID-image mapping of all images
+    """
+    images: dict[int, ImagePiece] = {}
+
+    for header, *data in iter_records(path):
+        if (match := _TILE_RE.fullmatch(header)) is None:
+            raise ValueError(header)
+        images[int(match[1])] = ImagePiece(data)
+
+    return images
@@ -13,14 +13,17 @@ _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def level1() -> int:
+def level1(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 1 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    foods = read_input(_INPUT_FILE_PATH)
+    foods = read_input(input_path)
     food_ingredients = [set(food.ingredients) for food in foods]
     allergen_ai = AllergenAI(foods)
     allergen_ai.calculate_all_new_knowledge()
@@ -13,14 +13,17 @@ _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def level2() -> str:
+def level2(input_path: Path = _INPUT_FILE_PATH) -> str:
     """
     Level 2 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (str): Solution to the problem
     """
-    foods = read_input(_INPUT_FILE_PATH)
+    foods = read_input(input_path)
     allergen_ai = AllergenAI(foods)
     allergen_ai.calculate_all_new_knowledge()
     assert not allergen_ai.knowledge and not allergen_ai.dangers.group_map
@@ -80,8 +80,12 @@ class AllergenAI:
     def calculate_new_knowledge(self) -> bool:
         """
         Try to get new knowledge from current knowledge base
+
+        Returns:
+            (bool): Whether any sentence is added, removed, or narrowed down
         """
         knowledge_changed = False
+        size = self._knowledge_size()
 
         for this_sentence, other_sentence in combinations(list(self.knowledge), 2):
             # No need to do the ones not present in knowledge base
@@ -115,7 +119,7 @@ class AllergenAI:
             # Same allergen. Ingredient must in both. Update one and remove the
             #   other
             if this_allergens == other_allergens:
-                this_allergens &= other_allergens
+                this_ingredients &= other_ingredients
                 self.knowledge.remove(other_sentence)
                 continue
 
@@ -152,7 +156,23 @@ class AllergenAI:
                 knowledge_changed = True
                 self.knowledge.append(Sentence(new_ingredients, new_allergens))
 
-        return knowledge_changed
+        # Sentences narrowed down in place may lead to new dangers too
+        return knowledge_changed or self._knowledge_size() != size
+
+    def _knowledge_size(self) -> tuple[int, int, int]:
+        """
+        Measure the knowledge base, to tell whether it has changed
+
+        Returns:
+            (int): Number of sentences
+            (int): Total number of ingredients in all sentences
+            (int): Total number of allergens in all sentences
+        """
+        return (
+            len(self.knowledge),
+            sum(len(sentence.ingredients) for sentence in self.knowledge),
+            sum(len(sentence.allergens) for sentence in self.knowledge),
+        )
 
     def _mark_dangers(self, ingredients: set[str], allergens: set[str]) -> None:
         """
@@ -69,7 +69,8 @@ class Dangers:
                 f"{ingredients} => {allergens}"
             )
 
-        self._add_if_not_exists(ingredients, frozenset(allergens))
+        # Copy the ingredients, as the caller keeps narrowing its set down
+        self._add_if_not_exists(set(ingredients), frozenset(allergens))
 
         # Clean up the clutter within the storage
         while self._clean_up():
@@ -92,6 +93,21 @@ class Dangers:
                 self._new_individual_map[allergen] = ingredients.pop()
 
         group_map_changed = False
+
+        # Then take the allergens already mapped individually out of the groups
+        known = {**self.individual_map, **self._new_individual_map}
+        for frozen_allergens, ingredients in list(self.group_map.items()):
+            known_allergens = frozen_allergens & known.keys()
+            if not known_allergens:
+                continue
+            group_map_changed = True
+            del self.group_map[frozen_allergens]
+            if (frozen_sub_allergens := frozen_allergens - known_allergens) :
+                known_ingredients = {known[allergen] for allergen in known_allergens}
+                self._add_if_not_exists(
+                    ingredients - known_ingredients, frozen_sub_allergens
+                )
+
         for (
             (frozen_allergens_1, ingredients_1),
             (frozen_allergens_2, ingredients_2),
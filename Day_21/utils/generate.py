@@ -0,0 +1,125 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from math import sqrt
+from random import Random
+from string import ascii_lowercase
+
+# Number of foods and allergens in a real input
+_BASE_FOODS = 46
+_BASE_ALLERGENS = 8
+# Number of safe ingredients per food
+_SAFE_PER_FOOD = (20, 60)
+_SAFE_PER_WITNESS = 10
+_ALLERGENS = [
+    "celery",
+    "corn",
+    "dairy",
+    "eggs",
+    "fish",
+    "gluten",
+    "lupin",
+    "mustard",
+    "nuts",
+    "peanuts",
+    "sesame",
+    "shellfish",
+    "soy",
+    "sulphites",
+    "wheat",
+]
+
+
+def _names(rng: Random, count: int) -> list[str]:
+    """
+    Generate distinct ingredient names
+
+    Args:
+        rng   (Random): Random number generator
+        count (int)   : Number of names
+
+    Returns:
+        (list[str]): The names
+    """
+    names: set[str] = set()
+    while len(names) < count:
+        names.add(
+            "".join(rng.choice(ascii_lowercase) for _ in range(rng.randint(3, 8)))
+        )
+    return sorted(names)
+
+
+def _food(ingredients: list[str], allergens: list[str]) -> str:
+    """
+    Format a food
+
+    Args:
+        ingredients (list[str]): Ingredients of the food
+        allergens   (list[str]): Allergens listed for the food
+
+    Returns:
+        (str): A line of the puzzle input
+    """
+    return f"{' '.join(ingredients)} (contains {', '.join(allergens)})"
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, str]]:
+    """
+    Generate a puzzle input and its answers
+
+    Each allergen has a food listing only that allergen and a food listing it
+      with another allergen, with no safe ingredients in common, so that their
+      only common ingredient is the one with the allergen. Other foods list
+      random allergens, and may contain allergens they do not list
+
+    Args:
+        size (float): Number of foods, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, str]): Answers to both levels
+    """
+    rng = Random(seed)
+    allergen_count = min(max(round(_BASE_ALLERGENS * sqrt(size)), 2), len(_ALLERGENS))
+    food_count = max(round(_BASE_FOODS * size), 2 * allergen_count)
+    safe_count = 25 * allergen_count
+
+    allergens = sorted(rng.sample(_ALLERGENS, allergen_count))
+    names = _names(rng, allergen_count + safe_count)
+    rng.shuffle(names)
+    dangerous = dict(zip(allergens, names))
+    safe = names[allergen_count:]
+
+    foods: list[tuple[list[str], list[str]]] = []
+    for allergen in allergens:
+        other = rng.choice([a for a in allergens if a != allergen])
+        shuffled = rng.sample(safe, len(safe))
+        half = len(safe) // 2
+        foods.append((shuffled[: rng.randint(*_SAFE_PER_FOOD) // 4], [allergen]))
+        foods.append(
+            (
+                shuffled[half : half + rng.randint(*_SAFE_PER_FOOD) // 4],
+                [allergen, other],
+            )
+        )
+    while len(foods) < food_count:
+        listed = rng.sample(allergens, rng.randint(1, min(3, allergen_count)))
+        foods.append((rng.sample(safe, rng.randint(*_SAFE_PER_FOOD)), listed))
+
+    lines: list[str] = []
+    safe_appearances = 0
+    for food_safe, listed in foods:
+        unlisted = [a for a in allergens if a not in listed and rng.random() < 0.3]
+        ingredients = food_safe + [dangerous[a] for a in listed + unlisted]
+        rng.shuffle(ingredients)
+        lines.append(_food(ingredients, sorted(listed)))
+        safe_appearances += len(food_safe)
+    rng.shuffle(lines)
+
+    text = "".join(f"{line}\n" for line in lines)
+    return text, (safe_appearances, ",".join(dangerous[a] for a in allergens))
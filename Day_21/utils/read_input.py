@@ -7,9 +7,13 @@ Public Functions:
 
 from pathlib import Path
 
+from aoc_io.loader import iter_lines
+from aoc_io.parse_cache import cached_parse
+
 from .sentence import Sentence
 
 
+@cached_parse(version=1)
 def read_input(path: Path) -> list[Sentence]:
     """
     Read and parse input file
@@ -20,5 +24,4 @@ def read_input(path: Path) -> list[Sentence]:
     Returns:
         (list[Sentence]): Parsed input file
     """
-    with path.open("r") as fp:
-        return [Sentence.from_input_line(line) for l in fp if (line := l.strip())]
+    return [Sentence.from_input_line(line) for line in iter_lines(path)]
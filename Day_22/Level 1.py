@@ -11,14 +11,17 @@ _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def level1() -> int:
+def level1(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 1 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    player1, player2 = read_input(_INPUT_FILE_PATH)
+    player1, player2 = read_input(input_path)
     while player1 and player2:
         p1 = player1.popleft()
         p2 = player2.popleft()
@@ -46,14 +46,17 @@ def _game(player1: deque[int], player2: deque[int]) -> tuple[bool, list[int]]:
                 player2.append(p1)
 
 
-def level2() -> int:
+def level2(input_path: Path = _INPUT_FILE_PATH) -> int:
     """
     Level 2 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (int): Solution to the problem
     """
-    player1, player2 = read_input(_INPUT_FILE_PATH)
+    player1, player2 = read_input(input_path)
     _, winning_deck = _game(player1, player2)
     return sum((i + 1) * n for i, n in enumerate(winning_deck))
 
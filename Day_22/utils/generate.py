@@ -0,0 +1,134 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from collections import deque
+from random import Random
+from typing import Optional
+
+# Number of cards in a real input
+_BASE_COUNT = 50
+
+# Both decks, from top to bottom
+_State = tuple[tuple[int, ...], tuple[int, ...]]
+
+
+def _score(deck: deque[int]) -> int:
+    """
+    Score of a winning deck
+
+    Args:
+        deck (deque[int]): The deck, from top to bottom
+
+    Returns:
+        (int): Its score
+    """
+    return sum(i * card for i, card in enumerate(reversed(deck), 1))
+
+
+def _combat(deck1: list[int], deck2: list[int]) -> Optional[int]:
+    """
+    Play a game of Combat
+
+    Args:
+        deck1 (list[int]): Deck of player 1
+        deck2 (list[int]): Deck of player 2
+
+    Returns:
+        (int | None): Score of the winner; `None` if the game never ends
+    """
+    player1 = deque(deck1)
+    player2 = deque(deck2)
+    seen: set[_State] = set()
+    while player1 and player2:
+        state = (tuple(player1), tuple(player2))
+        if state in seen:
+            return None
+        seen.add(state)
+        card1 = player1.popleft()
+        card2 = player2.popleft()
+        if card1 > card2:
+            player1.extend((card1, card2))
+        else:
+            player2.extend((card2, card1))
+    return _score(player1 or player2)
+
+
+def _recursive_combat(
+    player1: deque[int], player2: deque[int], results: dict[_State, bool]
+) -> bool:
+    """
+    Play a game of Recursive Combat; the decks are left as they are at the end
+
+    Args:
+        player1 (deque[int])        : Deck of player 1
+        player2 (deque[int])        : Deck of player 2
+        results (dict[_State, bool]): Winners of the sub-games played so far
+
+    Returns:
+        (bool): Whether player 1 wins
+    """
+    seen: set[_State] = set()
+    while player1 and player2:
+        state = (tuple(player1), tuple(player2))
+        if state in seen:
+            return True
+        seen.add(state)
+        card1 = player1.popleft()
+        card2 = player2.popleft()
+        if card1 <= len(player1) and card2 <= len(player2):
+            sub1 = deque(list(player1)[:card1])
+            sub2 = deque(list(player2)[:card2])
+            sub_state = (tuple(sub1), tuple(sub2))
+            # Player 1 always wins a sub-game where they hold the highest card,
+            #   as player 2 can never take it
+            if max(sub1) > max(sub2):
+                won = True
+            elif (won_before := results.get(sub_state)) is not None:
+                won = won_before
+            else:
+                won = results[sub_state] = _recursive_combat(sub1, sub2, results)
+        else:
+            won = card1 > card2
+        if won:
+            player1.extend((card1, card2))
+        else:
+            player2.extend((card2, card1))
+    return bool(player1)
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Recursive Combat gets slow quickly with more cards, since sub-games spawn
+      sub-games of their own
+
+    Args:
+        size (float): Number of cards, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    half = max(round(_BASE_COUNT * size / 2), 1)
+
+    while True:
+        cards = rng.sample(range(1, 2 * half + 1), 2 * half)
+        deck1 = cards[:half]
+        deck2 = cards[half:]
+        if (score := _combat(deck1, deck2)) is not None:
+            break
+
+    player1 = deque(deck1)
+    player2 = deque(deck2)
+    won = _recursive_combat(player1, player2, {})
+
+    text = "Player 1:\n" + "".join(f"{card}\n" for card in deck1)
+    text += "\nPlayer 2:\n" + "".join(f"{card}\n" for card in deck2)
+    return text, (score, _score(player1 if won else player2))
@@ -8,6 +8,8 @@ Public Functions:
 from pathlib import Path
 from collections import deque
 
+from aoc_io.loader import iter_records
+
 
 def read_input(path: Path) -> tuple[deque[int], deque[int]]:
     """
@@ -19,10 +21,10 @@ def read_input(path: Path) -> tuple[deque[int], deque[int]]:
     Returns:
         (tuple[deque[int], deque[int]]): Puzzle input
     """
-    with path.open("r") as fp:
-        player1, player2 = fp.read().split("\n\n")
+    # The first line of each record names the player
+    player1, player2 = iter_records(path)
 
     return (
-        deque(int(n) for n in player1.splitlines()[1:]),
-        deque(int(n) for n in player2.splitlines()[1:]),
+        deque(int(n) for n in player1[1:]),
+        deque(int(n) for n in player2[1:]),
     )
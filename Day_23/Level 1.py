@@ -5,41 +5,26 @@ Solution to part 1
 from pathlib import Path
 
 from aoc_io.aoc_io import DATA_FILENAME, submit_output
+from Day_23.utils.cups import labels_after, play
 from Day_23.utils.read_input import read_input
 
 _CURRENT_DIR = Path(__file__).resolve().parent
 _INPUT_FILE_PATH = _CURRENT_DIR / DATA_FILENAME
 
 
-def level1() -> str:
+def level1(input_path: Path = _INPUT_FILE_PATH) -> str:
     """
     Level 1 solution
 
+    Args:
+        input_path (Path): Puzzle input file
+
     Returns:
         (str): Solution to the problem
     """
-    cups: list[int] = read_input(_INPUT_FILE_PATH)
-    max_ = max(cups)
-    for _ in range(100):
-        # Current element
-        current = cups[0]
-        # Elements not touched this loop
-        left = cups[4:]
-        left_set = set(left)
-        # Find the next smallest value in the numbers left; wrap around to
-        #   `max_` if the value decreases to 0
-        while True:
-            current -= 1
-            if not current:
-                current = max_
-            if current in left_set:
-                break
-        # Add the 3 cups after the destination value, and then move the current
-        #   value to the end of the list
-        dest_index = cups.index(current) + 1
-        cups = cups[4:dest_index] + cups[1:4] + cups[dest_index:] + cups[:1]
-    index_1 = cups.index(1)
-    return "".join(str(n) for n in (cups[index_1 + 1 :] + cups[:index_1]))
+    cups = read_input(input_path)
+    successors = play(cups, 100)
+    return "".join(str(n) for n in labels_after(successors, 1))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+"""
+Module: Crab cups engine
+
+The circle is a successor table: `successors[label]` is the label of the cup
+  clockwise of cup `label`, in one `array("I")` of 4 bytes per cup, with no
+  object per cup. Each move relinks 3 entries, `O(1)`
+
+Long games can be saved to a memory-mapped checkpoint file every so often, and
+  resume from it after being killed
+
+Public Functions:
+    play        : Play crab cups and get the successor table of the final circle
+    labels_after: Labels of all the other cups, clockwise from a given cup
+"""
+
+from array import array
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Optional, Sequence
+
+from aoc_io.checkpoint import Checkpoint, Progress, ProgressCallback, open_checkpoint
+from aoc_io.instrument import count, span
+
+# Moves played between progress reports and checkpoints
+CHUNK_MOVES = 1 << 20
+
+
+def _link(cups: Sequence[int], total_cups: int) -> array:
+    """
+    Build the successor table of the starting circle
+
+    Args:
+        cups       (Sequence[int]): Labels of the starting cups, clockwise
+        total_cups (int)          : Number of cups; the ones past `cups` are
+                                    labelled in order after them
+
+    Returns:
+        (array): The successor table; entry 0 is unused
+    """
+    # Every cup followed by the next label, which already links the extra cups
+    successors = array("I", range(1, total_cups + 2))
+    successors[0] = 0
+    for label, next_label in zip(cups, cups[1:]):
+        successors[label] = next_label
+    if total_cups == len(cups):
+        successors[cups[-1]] = cups[0]
+    else:
+        successors[cups[-1]] = len(cups) + 1
+        successors[total_cups] = cups[0]
+    return successors
+
+
+def _play_moves(successors: array, current: int, moves: int, total: int) -> int:
+    """
+    Play moves on a successor table, in place
+
+    Args:
+        successors (array): The successor table
+        current    (int)  : Label of the current cup
+        moves      (int)  : Number of moves
+        total      (int)  : Number of cups
+
+    Returns:
+        (int): Label of the current cup after the moves
+    """
+    for _ in range(moves):
+        # Pick up the 3 cups after the current one
+        first = successors[current]
+        second = successors[first]
+        third = successors[second]
+        # Destination: the next smaller label not picked up, wrapping around to
+        #   the largest
+        dest = current - 1 or total
+        while dest == first or dest == second or dest == third:
+            dest = dest - 1 or total
+        # Relink the 3 cups after the destination, and move on
+        successors[current] = successors[third]
+        successors[third] = successors[dest]
+        successors[dest] = first
+        current = successors[current]
+    return current
+
+
+def play(
+    cups: Sequence[int],
+    moves: int,
+    total_cups: Optional[int] = None,
+    checkpoint: Optional[Path] = None,
+    progress: Optional[ProgressCallback] = None,
+    chunk: int = CHUNK_MOVES,
+) -> array:
+    """
+    Play crab cups and get the successor table of the final circle
+
+    Args:
+        cups       (Sequence[int])           : Labels of the starting cups,
+                                               clockwise; a permutation of 1 to
+                                               `len(cups)`
+        moves      (int)                     : Number of moves
+        total_cups (Optional[int])           : Number of cups; the ones past
+                                               `cups` are labelled in order
+                                               after them. Defaults to
+                                               `len(cups)`
+        checkpoint (Optional[Path])          : File to save the circle to, at
+                                               most every `SAVE_INTERVAL`
+                                               seconds, and resume from if it
+                                               holds this game
+        progress   (Optional[ProgressCallback]): Called every `chunk` moves
+                                                 with the moves played, the
+                                                 total and the ETA
+        chunk      (int)                     : Moves between progress
+                                               reports and checkpoints
+
+    Returns:
+        (array): `successors[label]` is the label of the cup clockwise of cup
+                 `label`; entry 0 is unused
+
+    Raises:
+        ValueError: When the cups are not labelled 1 to `len(cups)`, or there
+                    are fewer than 5 cups in total, too few to pick up 3 cups
+                    and still find a destination
+    """
+    total = len(cups) if total_cups is None else total_cups
+    if sorted(cups) != list(range(1, len(cups) + 1)):
+        raise ValueError(f"Cups must be labelled 1 to {len(cups)}: {cups}")
+    if total < max(len(cups), 5):
+        raise ValueError(f"Too few cups: {total}")
+
+    successors = _link(cups, total)
+    done, current = 0, cups[0]
+    with ExitStack() as stack:
+        state: Optional[Checkpoint] = None
+        if checkpoint is not None:
+            key = f"crab_cups {list(cups)} {total} {moves}"
+            state = stack.enter_context(open_checkpoint(checkpoint, key, total + 1))
+            if state.resumed:
+                state.restore(successors)
+                done, current = state.step, state.state
+
+        first_done = done
+        tracker = Progress(moves, done, progress)
+        # Unless checkpointed or reported, the game runs in one go
+        step = chunk if state is not None or progress is not None else moves
+        with span("crab_cups"):
+            while done < moves:
+                todo = min(step, moves - done)
+                current = _play_moves(successors, current, todo, total)
+                done += todo
+                if state is not None:
+                    state.save(done, current, successors, force=done == moves)
+                tracker.update(done)
+    count("moves", moves - first_done)
+    return successors
+
+
+def labels_after(successors: array, label: int = 1) -> list[int]:
+    """
+    Labels of all the other cups, clockwise from a given cup
+
+    Args:
+        successors (array): Successor table returned by `play`
+        label      (int)  : Label of the cup to start after
+
+    Returns:
+        (list[int]): Labels of the other cups, in order
+    """
+    labels: list[int] = []
+    current = successors[label]
+    while current != label:
+        labels.append(current)
+        current = successors[current]
+    return labels
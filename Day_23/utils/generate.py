@@ -0,0 +1,98 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+The answers are worked out independently of `cups.py`, so that `--check` tests
+  it: level 1 rotates a `deque`, and level 2 relinks a dict of the cup clockwise
+  of each cup
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from collections import deque
+from random import Random
+
+# Cups and moves of both levels
+_LEVELS = ((9, 100), (1_000_000, 10_000_000))
+
+
+def _rotate_play(labels: list[int], moves: int) -> str:
+    """
+    Play the crab's game with only the labeled cups, on a rotating `deque`
+
+    Args:
+        labels (list[int]): Labels of the cups, clockwise
+        moves  (int)      : Number of moves
+
+    Returns:
+        (str): Labels of the cups clockwise of cup 1
+    """
+    # The current cup is always the leftmost one
+    circle = deque(labels)
+    for _ in range(moves):
+        current = circle[0]
+        circle.rotate(-1)
+        picked = [circle.popleft() for _ in range(3)]
+        destination = current - 1 or len(labels)
+        while destination in picked:
+            destination = destination - 1 or len(labels)
+        # The current cup is now the rightmost one, so the destination, and
+        #   the picked cups after it, land before it
+        index = circle.index(destination)
+        for offset, cup in enumerate(picked, 1):
+            circle.insert(index + offset, cup)
+    circle.rotate(-circle.index(1))
+    return "".join(map(str, list(circle)[1:]))
+
+
+def _dict_play(labels: list[int], cups: int, moves: int) -> int:
+    """
+    Play the crab's game on a circle linked by a dict
+
+    Args:
+        labels (list[int]): Labels of the first cups, clockwise; the rest of
+                            the cups follow in increasing order
+        cups   (int)      : Number of cups
+        moves  (int)      : Number of moves
+
+    Returns:
+        (int): Product of the labels of the 2 cups clockwise of cup 1
+    """
+    order = labels + list(range(len(labels) + 1, cups + 1))
+    next_cup = dict(zip(order, order[1:] + order[:1]))
+    current = order[0]
+    for _ in range(moves):
+        picked = [next_cup[current]]
+        picked.append(next_cup[picked[-1]])
+        picked.append(next_cup[picked[-1]])
+        next_cup[current] = next_cup[picked[-1]]
+        destination = current - 1 or cups
+        while destination in picked:
+            destination = destination - 1 or cups
+        next_cup[picked[-1]] = next_cup[destination]
+        next_cup[destination] = picked[0]
+        current = next_cup[current]
+    return next_cup[1] * next_cup[next_cup[1]]
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[str, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    The input is always the labels of 9 cups, so `size` is ignored
+
+    Args:
+        size (float): Ignored
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[str, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    labels = rng.sample(range(1, 10), 9)
+
+    after_one = _rotate_play(labels, _LEVELS[0][1])
+    stars = _dict_play(labels, *_LEVELS[1])
+
+    return f"{''.join(map(str, labels))}\n", (after_one, stars)
@@ -7,6 +7,8 @@ Public Functions:
 
 from pathlib import Path
 
+from aoc_io.loader import iter_lines
+
 
 def read_input(path: Path) -> list[int]:
     """
@@ -18,5 +20,4 @@ def read_input(path: Path) -> list[int]:
     Returns:
         (list[int]): Puzzle input
     """
-    with path.open("r") as fp:
-        return [int(n) for n in fp.readline().strip()]
+    return [int(n) for n in next(iter_lines(path))]
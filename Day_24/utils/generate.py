@@ -0,0 +1,105 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Public Functions:
+    generate: Generate a puzzle input and its answers
+"""
+
+from collections import Counter
+from random import Random
+
+# Number of paths in a real input
+_BASE_COUNT = 474
+_DAYS = 100
+# Axial offsets of each step
+_STEPS = {
+    "e": (1, 0),
+    "w": (-1, 0),
+    "ne": (1, 1),
+    "sw": (-1, -1),
+    "nw": (0, 1),
+    "se": (0, -1),
+}
+_OPPOSITES = [("e", "w"), ("ne", "sw"), ("nw", "se")]
+
+
+def _shortest_path(q: int, r: int) -> list[str]:
+    """
+    Steps of a shortest path from the reference tile
+
+    Args:
+        q (int): East axial coordinate of the tile
+        r (int): North-west axial coordinate of the tile
+
+    Returns:
+        (list[str]): The steps
+    """
+    if (q > 0) == (r > 0):
+        # Diagonal steps cover both coordinates at once
+        diagonal = min(abs(q), abs(r))
+        path = ["ne" if q > 0 else "sw"] * diagonal
+        q -= diagonal if q > 0 else -diagonal
+        r -= diagonal if r > 0 else -diagonal
+    else:
+        path = []
+    path += ["e" if q > 0 else "w"] * abs(q)
+    path += ["nw" if r > 0 else "se"] * abs(r)
+    return path
+
+
+def _exhibit(black: set[tuple[int, int]]) -> int:
+    """
+    Flip the tiles every day for the living art exhibit
+
+    Args:
+        black (set[tuple[int, int]]): Black tiles at the start
+
+    Returns:
+        (int): Number of black tiles at the end
+    """
+    for _ in range(_DAYS):
+        counts = Counter(
+            (q + dq, r + dr) for q, r in black for dq, dr in _STEPS.values()
+        )
+        black = {
+            tile
+            for tile, count in counts.items()
+            if count == 2 or (count == 1 and tile in black)
+        }
+    return len(black)
+
+
+def generate(size: float = 1, seed: int = 0) -> tuple[str, tuple[int, int]]:
+    """
+    Generate a puzzle input and its answers
+
+    Args:
+        size (float): Number of paths, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (str)            : Puzzle input
+        (tuple[int, int]): Answers to both levels
+    """
+    rng = Random(seed)
+    count = max(round(_BASE_COUNT * size), 1)
+    # Tiles are picked close to the reference tile, so that some get flipped
+    #   more than once, like in real inputs; the area grows with the paths
+    spread = max(round(10 * size**0.5), 1)
+
+    lines: list[str] = []
+    black: set[tuple[int, int]] = set()
+    for _ in range(count):
+        q = rng.randint(-spread, spread)
+        r = rng.randint(-spread, spread)
+        path = _shortest_path(q, r)
+        # Detours that cancel out
+        for _ in range(rng.randint(2, 10)):
+            step, back = rng.choice(_OPPOSITES)
+            path += [step, back]
+        rng.shuffle(path)
+        lines.append("".join(path))
+        black ^= {(q, r)}
+
+    text = "".join(f"{line}\n" for line in lines)
+    return text, (len(black), _exhibit(black))
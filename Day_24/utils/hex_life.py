@@ -0,0 +1,133 @@
+"""
+Module: Hex-grid Game of Life
+
+Tiles are axial coordinates `(q, r)`: `q` grows to the east, `r` to the
+  north-west, and the north-east neighbor is `(q + 1, r + 1)`
+
+The dense game keeps the floor as a NumPy boolean array indexed by `(q, r)`,
+  cropped to the bounding box of the black tiles. Each round pads it by 1,
+  adds up 6 shifted slices for the neighbor counts and applies the rule as a
+  mask, at a cost in proportion to the box; the sparse game costs time in
+  proportion to the black tiles instead
+
+Public Classes:
+    HexGameOfLife     : Conway's Game of Life on a hex grid, on a set
+    DenseHexGameOfLife: Conway's Game of Life on a hex grid, on an array
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from aoc_io.instrument import count, spanned
+from aoc_io.life import Packing, SparseLife
+
+# Axial offsets of the 6 neighbors
+NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1))
+
+
+class HexGameOfLife:
+    """
+    Conway's Game of Life, but in a hex grid! (Rule H:B2/S12)
+    The underlying board is a `SparseLife` of the black tiles
+
+    Args:
+        black_tiles (Iterable[tuple[int, int]]): Axial coordinates of the black
+                                                 tiles
+
+    Instance Public Read-Only Properties:
+        black_tiles       (set[tuple[int, ...]]): Axial coordinates of the
+                                                  black tiles
+        black_tiles_count (int)                 : Number of black tile counts
+    """
+
+    def __init__(self, black_tiles: Iterable[tuple[int, int]]) -> None:
+        self._life = SparseLife(
+            Packing(2), black_tiles, NEIGHBORS, birth={2}, survival={1, 2}
+        )
+
+    @property
+    def black_tiles(self) -> set[tuple[int, ...]]:
+        return self._life.cells()
+
+    @property
+    def black_tiles_count(self) -> int:
+        return len(self._life.live)
+
+    @spanned()
+    def propagate(self) -> None:
+        """
+        Run one round of propagation
+        """
+        self._life.propagate()
+
+
+class DenseHexGameOfLife:
+    """
+    Conway's Game of Life, but in a hex grid! (Rule H:B2/S12)
+    The underlying board is a dense boolean `np.ndarray`, cropped to the black
+      tiles
+
+    Args:
+        black_tiles (Iterable[tuple[int, int]]): Axial coordinates of the black
+                                                 tiles; may be an array of
+                                                 `(q, r)` rows
+
+    Instance Public Read-Only Properties:
+        black_tiles       (set[tuple[int, ...]]): Axial coordinates of the
+                                                  black tiles
+        black_tiles_count (int)                 : Number of black tile counts
+    """
+
+    def __init__(self, black_tiles: Iterable[tuple[int, int]]) -> None:
+        if not isinstance(black_tiles, np.ndarray):
+            black_tiles = list(black_tiles)
+        tiles = np.array(black_tiles, dtype=np.int64).reshape(-1, 2)
+        # Axial coordinates of the tile at index (0, 0)
+        self._origin = tiles.min(axis=0) if len(tiles) else np.zeros(2, np.int64)
+        shape = tiles.max(axis=0) - self._origin + 1 if len(tiles) else (0, 0)
+        self._board = np.zeros(shape, dtype=bool)
+        self._board[tuple((tiles - self._origin).T)] = True
+
+    @property
+    def black_tiles(self) -> set[tuple[int, ...]]:
+        return {
+            tuple(int(c) for c in tile)
+            for tile in np.argwhere(self._board) + self._origin
+        }
+
+    @property
+    def black_tiles_count(self) -> int:
+        return int(np.count_nonzero(self._board))
+
+    @spanned()
+    def propagate(self) -> None:
+        """
+        Run one round of propagation
+        """
+        # New black tiles are at most 1 away; their neighbors 1 further
+        padded = np.pad(self._board, 2).astype(np.uint8)
+        rows, cols = padded.shape[0] - 2, padded.shape[1] - 2
+        tiles = padded[1:-1, 1:-1]
+        count("cells evaluated", tiles.size)
+        neighbors = np.zeros((rows, cols), dtype=np.uint8)
+        for dq, dr in NEIGHBORS:
+            neighbors += padded[1 + dq : 1 + dq + rows, 1 + dr : 1 + dr + cols]
+        board = (neighbors == 2) | ((neighbors == 1) & (tiles == 1))
+        self._origin = self._origin - 1
+        self._crop(board)
+
+    def _crop(self, board: np.ndarray) -> None:
+        """
+        Crop a board to the bounding box of its black tiles, and keep it
+
+        Args:
+            board (np.ndarray): Board whose index (0, 0) is `self._origin`
+        """
+        (rows,) = np.nonzero(board.any(axis=1))
+        (cols,) = np.nonzero(board.any(axis=0))
+        if not rows.size:
+            self._board = board[:0, :0]
+            return
+        self._board = board[rows[0] : rows[-1] + 1, cols[0] : cols[-1] + 1]
+        self._origin = self._origin + (rows[0], cols[0])
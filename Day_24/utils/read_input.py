@@ -1,34 +1,131 @@
 """
 Module: Read and parse input file
 
+Each path only matters through how many steps it takes in each of the 6
+  directions, so paths are resolved with NumPy, not step by step: 2-letter steps
+  are found as an `n` or `s` followed by an `e` or `w`, the steps of each kind
+  are counted per line, and the tile of each line is the dot product of its
+  counts with the axial offsets of the directions. Tiles flipped an even number
+  of times are white again, so only those that `np.unique` counts an odd
+  number of times stay black
+
+The input is resolved in blocks of about a MiB of whole lines, so that the
+  byte-sized masks over it fit in cache and their memory is reused
+
 Public Functions:
-    read_input: Read and parse input file
+    resolve_tiles   : Find the black tiles of the paths of an input
+    read_black_tiles: Read an input file and find its black tiles
 """
 
 from pathlib import Path
 
+import numpy as np
+
+# Axial offsets of each step; `q` grows to the east, `r` to the north-west
+_STEPS = {
+    "e": (1, 0),
+    "w": (-1, 0),
+    "ne": (1, 1),
+    "sw": (-1, -1),
+    "nw": (0, 1),
+    "se": (0, -1),
+}
+# Class of each byte: 0 for blanks, 1 to 4 for `n`, `s`, `e` and `w`, 5 for
+#   anything else
+_CLASSES = np.full(256, 5, dtype=np.uint8)
+_CLASSES[list(b" \t\r\n")] = 0
+_N, _S, _E, _W = 1, 2, 3, 4
+_CLASSES[list(b"nsew")] = [_N, _S, _E, _W]
+_NEWLINE = ord("\n")
+# Tiles are packed into an int64 to be counted: `q` above bit 32, and `r`
+#   offset by 2 ** 31 below it
+_R_BITS = 32
+_R_BIAS = 1 << (_R_BITS - 1)
+# Bytes resolved at once, give or take a line
+_BLOCK_SIZE = 1 << 20
+
+
+def _resolve_block(raw: np.ndarray) -> np.ndarray:
+    """
+    Find the tile at the end of each path of a block of whole lines
+
+    Args:
+        raw (np.ndarray): The block, as bytes
+
+    Returns:
+        (np.ndarray): The tiles, packed
+
+    Raises:
+        ValueError: When a path has an unknown step
+    """
+    classes = _CLASSES[raw]
+    # Class of the next byte, and whether the previous one starts a step
+    after = np.append(classes[1:], 0)
+    starts_step = (classes == _N) | (classes == _S)
+    if (classes == 5).any() or (starts_step & (after != _E) & (after != _W)).any():
+        raise ValueError("Unknown step")
+    ends_step = np.insert(starts_step[:-1], 0, False)
+
+    masks = {
+        "e": (classes == _E) & ~ends_step,
+        "w": (classes == _W) & ~ends_step,
+        "ne": (classes == _N) & (after == _E),
+        "sw": (classes == _S) & (after == _W),
+        "nw": (classes == _N) & (after == _W),
+        "se": (classes == _S) & (after == _E),
+    }
+    # Each line runs up to and including its newline, the last one maybe
+    #   without; none is empty
+    line_starts = np.flatnonzero(raw[:-1] == _NEWLINE) + 1
+    line_starts = np.insert(line_starts, 0, 0)
+    # Steps of each kind per line, one column per kind
+    steps = np.stack(
+        [np.add.reduceat(masks[step], line_starts, dtype=np.int64) for step in _STEPS],
+        axis=1,
+    )
+    # Blank lines are not paths
+    steps = steps[steps.any(axis=1)]
+    q, r = (steps @ np.array(list(_STEPS.values()))).T
+    return (q << _R_BITS) | (r + _R_BIAS)
+
+
+def resolve_tiles(data: bytes) -> np.ndarray:
+    """
+    Find the black tiles of the paths of an input
+
+    Args:
+        data (bytes): Puzzle input, a path per line
+
+    Returns:
+        (np.ndarray): Axial coordinates of the black tiles, one `(q, r)` row
+                      each, in sorted order
+
+    Raises:
+        ValueError: When a path has an unknown step
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    blocks: list[np.ndarray] = [np.zeros(0, dtype=np.int64)]
+    start = 0
+    while start < len(data):
+        # Blocks of whole lines keep the temporaries small, and reused
+        end = data.find(b"\n", start + _BLOCK_SIZE) + 1 or len(data)
+        blocks.append(_resolve_block(raw[start:end]))
+        start = end
+    packed, flips = np.unique(np.concatenate(blocks), return_counts=True)
+    black = packed[flips % 2 == 1]
+    return np.stack([black >> _R_BITS, (black & ((1 << _R_BITS) - 1)) - _R_BIAS], 1)
+
 
-def read_input(path: Path) -> list[list[str]]:
+def read_black_tiles(path: Path) -> np.ndarray:
     """
-    Read and parse the input file
+    Read an input file and find its black tiles
 
     Args:
         path (Path): Input file path
 
     Returns:
-        (list[list[str]]): Puzzle input
+        (np.ndarray): Axial coordinates of the black tiles, one `(q, r)` row
+                      each, in sorted order
     """
-    instructions: list[list[str]] = []
-    with path.open("r") as fp:
-        for l in fp:
-            if (line := l.strip()) :
-                steps: list[str] = []
-                step = ""
-                for char in line:
-                    if char in {"s", "n"}:
-                        step = char
-                    else:
-                        steps.append(step + char)
-                        step = ""
-                instructions.append(steps)
-    return instructions
+    # Read whole, as the masks over it take several times its size anyway
+    return resolve_tiles(path.read_bytes())
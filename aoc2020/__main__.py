@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Run the solutions of many days in a single process
+
+Usage:
+    python -m aoc2020 run [days] [levels] [--no-submit] [--json] [--time]
+                          [--jobs [N]] [--instrument FILE] [--flamegraph FILE]
+                          [--profile {cprofile,pyinstrument}] [--memory]
+                          [--memory-budget SIZE] [--memory-abort]
+                          [--trace-memory [N]]
+    python -m aoc2020 bench [days] [levels] [--runs N] [--threshold R]
+                            [--min-delta S] [--rss-threshold R]
+                            [--min-rss-delta SIZE] [--save-baseline] [--json]
+    python -m aoc2020 generate [days] [--size S] [--seed N] [--check]
+"""
+
+import argparse
+import json
+import os
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+from time import perf_counter
+from typing import Optional
+
+from aoc_io.bulk import parse_range
+from aoc_io.instrument import PROFILERS
+
+from . import bench, generate
+from .memory import MemoryLimits, MemoryReport, parse_size
+from .runner import Result, run_solvers, run_solvers_parallel
+from .solvers import DAYS, LEVELS, discover
+from .timings import load_timings, record_timings
+
+
+def _run(args: argparse.Namespace) -> int:
+    if args.profile == "pyinstrument" and find_spec("pyinstrument") is None:
+        print("pyinstrument is not installed", file=sys.stderr)
+        return 2
+    solvers = discover(args.days, args.levels)
+    instrument = args.instrument is not None or args.flamegraph is not None
+    memory = _memory_limits(args)
+    if args.jobs is None:
+        runs = run_solvers(
+            solvers,
+            submit=args.submit,
+            instrument=instrument,
+            profiler=args.profile,
+            memory=memory,
+        )
+    else:
+        runs = run_solvers_parallel(
+            solvers,
+            submit=args.submit,
+            max_workers=args.jobs,
+            timings=load_timings(),
+            instrument=instrument,
+            profiler=args.profile,
+            memory=memory,
+        )
+    results = []
+    start = perf_counter()
+    for result in runs:
+        results.append(result)
+        if args.json:
+            continue
+        line = f"Day {result.day:02} Level {result.level}: "
+        line += str(result.answer) if result.ok else "error"
+        if args.time:
+            line += f" ({result.elapsed:.3f}s)"
+        print(line, flush=True)
+        if result.error is not None:
+            print(result.error, file=sys.stderr)
+        if result.verdict is not None:
+            print(result.verdict, flush=True)
+        if result.memory is not None:
+            _print_memory(result.memory)
+        if result.recorder is not None and args.instrument is None:
+            if result.recorder.profile is not None:
+                print(result.recorder.profile, file=sys.stderr)
+    wall_time = perf_counter() - start
+    # Instrumented, profiled or traced runs are slower than usual, and would
+    #   skew the timings `--jobs` schedules by
+    if not (instrument or args.profile is not None or args.trace_memory is not None):
+        record_timings(results)
+    results.sort(key=lambda result: (result.day, result.level))
+    _write_instrumentation(results, args.instrument, args.flamegraph)
+    if args.json:
+        json.dump([result.to_dict() for result in results], sys.stdout, indent=2)
+        print()
+    elif args.time:
+        cpu_time = sum(result.elapsed for result in results)
+        print(f"Total: {cpu_time:.3f}s solving, {wall_time:.3f}s wall time")
+    return 0 if all(result.ok for result in results) else 1
+
+
+def _memory_limits(args: argparse.Namespace) -> Optional[MemoryLimits]:
+    """
+    Memory tracking asked for on the command line
+
+    Args:
+        args (argparse.Namespace): Parsed arguments of `run`
+
+    Returns:
+        (Optional[MemoryLimits]): What to track, or None not to track memory
+    """
+    trace = args.trace_memory is not None
+    if not (args.memory or trace or args.memory_budget is not None):
+        return None
+    return MemoryLimits(
+        args.memory_budget, args.memory_abort, trace, args.trace_memory or 0
+    )
+
+
+def _print_memory(report: MemoryReport) -> None:
+    """
+    Print the memory used by a solver, warning about an exceeded budget
+
+    Args:
+        report (MemoryReport): Memory used by the solver
+    """
+    line = "  memory:"
+    if report.peak_rss is not None:
+        line += f" RSS +{report.peak_rss / 1024:.1f}MiB"
+    if report.peak_traced is not None:
+        line += f", traced peak {report.peak_traced / 1024:.1f}MiB"
+    print(line, flush=True)
+    for site, size, count in report.top_sites:
+        print(f"    {size / 1024:8.1f}MiB {count:>9} blocks  {site}", flush=True)
+    if report.exceeded:
+        print("  memory budget exceeded", file=sys.stderr, flush=True)
+
+
+def _write_instrumentation(
+    results: list[Result], json_path: Optional[Path], flamegraph_path: Optional[Path]
+) -> None:
+    """
+    Write the recorded instrumentation of the results
+
+    Args:
+        results         (list[Result])  : Results of the run
+        json_path       (Optional[Path]): Where to write them as JSON
+        flamegraph_path (Optional[Path]): Where to write them as collapsed
+                                          stacks
+    """
+    recorded = [result for result in results if result.recorder is not None]
+    if json_path is not None:
+        report = [
+            {"day": result.day, "level": result.level, **result.recorder.to_dict()}
+            for result in recorded
+        ]
+        json_path.write_text(json.dumps(report, indent=2) + "\n")
+    if flamegraph_path is not None:
+        stacks = [
+            line for result in recorded for line in result.recorder.collapsed_stacks()
+        ]
+        flamegraph_path.write_text("".join(f"{line}\n" for line in stacks))
+
+
+def _bench(args: argparse.Namespace) -> int:
+    solvers = discover(args.days, args.levels)
+    results = []
+    for result in bench.bench_solvers(solvers, args.runs):
+        results.append(result)
+        if args.json:
+            continue
+        if not result.ok:
+            print(f"Day {result.day:02} Level {result.level}: error", flush=True)
+            print(result.error, file=sys.stderr)
+            continue
+        rss = "?" if result.peak_rss is None else f"{result.peak_rss / 1024:.1f}MiB"
+        print(
+            f"Day {result.day:02} Level {result.level}: min {result.min:.4f}s"
+            f" median {result.median:.4f}s p95 {result.p95:.4f}s rss {rss}",
+            flush=True,
+        )
+    bench.append_history(results)
+    baseline = bench.load_baseline()
+    regressions = bench.find_regressions(
+        results, baseline, args.threshold, args.min_delta
+    )
+    memory_regressions = bench.find_memory_regressions(
+        results, baseline, args.rss_threshold, args.min_rss_delta
+    )
+    if args.save_baseline:
+        bench.save_baseline(results)
+    if args.json:
+        json.dump([result.to_dict() for result in results], sys.stdout, indent=2)
+        print()
+    for result, reference in regressions:
+        print(
+            f"Day {result.day:02} Level {result.level} regressed: median"
+            f" {result.median:.4f}s vs {reference:.4f}s baseline",
+            file=sys.stderr,
+        )
+    for result, reference in memory_regressions:
+        print(
+            f"Day {result.day:02} Level {result.level} regressed: peak RSS"
+            f" {result.peak_rss / 1024:.1f}MiB vs {reference / 1024:.1f}MiB baseline",
+            file=sys.stderr,
+        )
+    failed = not all(result.ok for result in results)
+    return 1 if failed or regressions or memory_regressions else 0
+
+
+def _generate(args: argparse.Namespace) -> int:
+    failed = False
+    for day in generate.available(args.days):
+        start = perf_counter()
+        path, answers = generate.write_puzzle(day, args.size, args.seed)
+        print(
+            f"Day {day:02}: {path} ({perf_counter() - start:.3f}s)"
+            f" answers {answers[1]} / {answers[2]}",
+            flush=True,
+        )
+        if not args.check:
+            continue
+        for result in run_solvers(discover([day]), input_path=path):
+            expected = answers[result.level]
+            if result.ok and result.answer == expected:
+                print(f"  Level {result.level}: ok ({result.elapsed:.3f}s)")
+                continue
+            failed = True
+            print(
+                f"  Level {result.level}: got {result.answer}, expected {expected}",
+                file=sys.stderr,
+            )
+            if result.error is not None:
+                print(result.error, file=sys.stderr)
+    return 1 if failed else 0
+
+
+def _add_selection(parser: argparse.ArgumentParser, verb: str) -> None:
+    """
+    Add the positional day and level selection arguments
+
+    Args:
+        parser (argparse.ArgumentParser): The subcommand parser
+        verb   (str)                    : What is done to the selected days
+    """
+    parser.add_argument(
+        "days",
+        nargs="?",
+        type=parse_range,
+        default=list(DAYS),
+        help=f'days to {verb}, e.g. "1-5,7" (default: all)',
+    )
+    parser.add_argument(
+        "levels",
+        nargs="?",
+        type=parse_range,
+        default=list(LEVELS),
+        help=f'levels to {verb}, e.g. "1" (default: both)',
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc2020", description="Advent of Code 2020 solutions"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run solutions in one process")
+    _add_selection(run_parser, "run")
+    run_parser.add_argument(
+        "--no-submit",
+        dest="submit",
+        action="store_false",
+        help="do not submit the answers",
+    )
+    run_parser.add_argument(
+        "--json", action="store_true", help="print the results as JSON"
+    )
+    run_parser.add_argument(
+        "--time", action="store_true", help="print the wall time of each solution"
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=os.cpu_count(),
+        help="run in N processes, slowest solutions first (default: one process;"
+        " N defaults to the number of CPUs)",
+    )
+    run_parser.add_argument(
+        "--instrument",
+        type=Path,
+        metavar="FILE",
+        help="record the spans and counters of the solutions into a JSON file",
+    )
+    run_parser.add_argument(
+        "--flamegraph",
+        type=Path,
+        metavar="FILE",
+        help="record the spans of the solutions as flamegraph collapsed stacks",
+    )
+    run_parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        help="profile each solution; the report goes into the --instrument file,"
+        " or to stderr without one",
+    )
+    run_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="report how much the RSS grows during each solution",
+    )
+    run_parser.add_argument(
+        "--memory-budget",
+        type=parse_size,
+        metavar="SIZE",
+        help='flag solutions whose RSS grows by more than SIZE, e.g. "512M";'
+        " implies --memory",
+    )
+    run_parser.add_argument(
+        "--memory-abort",
+        action="store_true",
+        help="interrupt solutions over the memory budget, failing them",
+    )
+    run_parser.add_argument(
+        "--trace-memory",
+        type=int,
+        nargs="?",
+        const=5,
+        metavar="N",
+        help="trace Python allocations and report the N largest allocation sites"
+        " (default: %(const)s); slow, implies --memory",
+    )
+    run_parser.set_defaults(handler=_run)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="time solutions and compare them with the baseline"
+    )
+    _add_selection(bench_parser, "benchmark")
+    bench_parser.add_argument(
+        "-n", "--runs", type=int, default=bench.DEFAULT_RUNS, help="runs per solution"
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=bench.DEFAULT_THRESHOLD,
+        help="tolerated relative slowdown of the median (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=bench.DEFAULT_MIN_DELTA,
+        help="tolerated absolute slowdown of the median, in seconds"
+        " (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--rss-threshold",
+        type=float,
+        default=bench.DEFAULT_RSS_THRESHOLD,
+        help="tolerated relative growth of the peak RSS (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--min-rss-delta",
+        type=parse_size,
+        default=bench.DEFAULT_MIN_RSS_DELTA,
+        metavar="SIZE",
+        help='tolerated absolute growth of the peak RSS, e.g. "4M"'
+        " (default: %(default)sKiB)",
+    )
+    bench_parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store these results as the new baseline",
+    )
+    bench_parser.add_argument(
+        "--json", action="store_true", help="print the results as JSON"
+    )
+    bench_parser.set_defaults(handler=_bench)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="generate inputs of any size, with known answers"
+    )
+    generate_parser.add_argument(
+        "days",
+        nargs="?",
+        type=parse_range,
+        default=list(DAYS),
+        help='days to generate, e.g. "1-5,7" (default: all)',
+    )
+    generate_parser.add_argument(
+        "--size",
+        type=float,
+        default=1,
+        help="size of the puzzles, relative to a real input (default: 1)",
+    )
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="run the solutions and compare them with the known answers",
+    )
+    generate_parser.set_defaults(handler=_generate)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
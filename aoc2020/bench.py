@@ -0,0 +1,392 @@
+"""
+Module: Benchmark the solvers and gate regressions against a baseline
+
+Each solver is benchmarked in a fresh process, so that its peak RSS is its
+  own and not that of whatever ran before it
+
+Public Classes:
+    BenchResult: Timing statistics of a single solver
+
+Public Functions:
+    percentile             : Nearest-rank percentile of some samples
+    bench_solver           : Time a solver over many runs in the current process
+    bench_solvers          : Benchmark each solver in a fresh process
+    append_history         : Append the results of a benchmark to the history
+                             file
+    load_baseline          : Load the stored baseline
+    save_baseline          : Store results as the new baseline
+    find_regressions       : Compare the times of results with the baseline
+    find_memory_regressions: Compare the peak RSS of results with the baseline
+"""
+
+import json
+import math
+import multiprocessing
+import statistics
+import subprocess
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, Iterator, Optional
+
+from .solvers import ROOT_DIR, Answer, Solver
+
+HISTORY_PATH = ROOT_DIR / "aoc2020" / ".bench_history.jsonl"
+BASELINE_PATH = ROOT_DIR / "aoc2020" / ".bench_baseline.json"
+
+DEFAULT_RUNS = 5
+# A solver regresses when its median is this much slower than the baseline...
+DEFAULT_THRESHOLD = 0.1
+# ... and slower by at least this many seconds, to ignore jitter in fast ones
+DEFAULT_MIN_DELTA = 0.005
+# Likewise for the peak RSS, in KiB; it jitters by a few MiB between runs
+DEFAULT_RSS_THRESHOLD = 0.1
+DEFAULT_MIN_RSS_DELTA = 4096
+
+Baseline = dict[tuple[int, int], dict[str, float]]
+
+
+class BenchResult:
+    """
+    Timing statistics of a single solver
+
+    Args:
+        day      (int)          : The day of AOC
+        level    (int)          : Part 1 or 2
+        answer   (Optional[Answer]): Answer of the solver, if it succeeded
+        times    (list[float])  : Wall time of each run, in seconds
+        peak_rss (Optional[int]): Peak resident set size of the process, in
+                                  KiB, if the platform reports it
+        error    (Optional[str]): The exception raised, if the solver failed
+
+    Public Attributes:
+        day      (int)          : The day of AOC
+        level    (int)          : Part 1 or 2
+        answer   (Optional[Answer]): Answer of the solver, if it succeeded
+        times    (list[float])  : Wall time of each run, in seconds
+        peak_rss (Optional[int]): Peak resident set size, in KiB
+        error    (Optional[str]): The exception raised, if the solver failed
+        ok       (bool)         : Whether the solver succeeded
+        min      (float)        : Fastest run; only if `ok`
+        median   (float)        : Median run; only if `ok`
+        p95      (float)        : 95th percentile run; only if `ok`
+
+    Public Methods:
+        to_dict() -> dict[str, object]: JSON-serializable form of the result
+    """
+
+    def __init__(
+        self,
+        day: int,
+        level: int,
+        answer: Optional[Answer],
+        times: list[float],
+        peak_rss: Optional[int],
+        error: Optional[str] = None,
+    ) -> None:
+        self.day = day
+        self.level = level
+        self.answer = answer
+        self.times = times
+        self.peak_rss = peak_rss
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def min(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.times, 95)
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        JSON-serializable form of the result
+
+        Returns:
+            (dict[str, object]): The result
+        """
+        return {
+            "day": self.day,
+            "level": self.level,
+            "answer": self.answer,
+            "runs": len(self.times),
+            "min": self.min if self.ok else None,
+            "median": self.median if self.ok else None,
+            "p95": self.p95 if self.ok else None,
+            "peak_rss": self.peak_rss,
+            "error": self.error,
+        }
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of some samples
+
+    Args:
+        samples (list[float]): The samples; must not be empty
+        percent (float)      : Which percentile, between 0 and 100
+
+    Returns:
+        (float): The smallest sample that at least `percent`% of the samples
+                 are less than or equal to
+    """
+    ordered = sorted(samples)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _peak_rss() -> Optional[int]:
+    """
+    Peak resident set size of the current process
+
+    Returns:
+        (Optional[int]): Peak RSS in KiB, or None if the platform does not
+                         report it
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux and the BSDs report it in KiB, but macOS in bytes
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    return peak_rss
+
+
+def bench_solver(solver: Solver, runs: int = DEFAULT_RUNS) -> BenchResult:
+    """
+    Time a solver over many runs in the current process
+
+    The solver is imported before the first run, so import time is not
+      counted
+
+    Args:
+        solver (Solver): The solver to benchmark
+        runs   (int)   : How many times to run it
+
+    Returns:
+        (BenchResult): Its statistics
+    """
+    func = solver.load()
+    times: list[float] = []
+    answer: Answer = 0
+    for _ in range(runs):
+        start = perf_counter()
+        answer = func(solver.input_path)
+        times.append(perf_counter() - start)
+    return BenchResult(solver.day, solver.level, answer, times, _peak_rss())
+
+
+def _bench_in_worker(day: int, level: int, root: Path, runs: int) -> BenchResult:
+    """
+    Entry point of the worker processes
+
+    Args:
+        day   (int) : The day of AOC
+        level (int) : Part 1 or 2
+        root  (Path): Directory containing the `Day_XX` directories
+        runs  (int) : How many times to run the solver
+
+    Returns:
+        (BenchResult): Statistics of the solver
+    """
+    return bench_solver(Solver(day, level, root), runs)
+
+
+def bench_solvers(
+    solvers: Iterable[Solver], runs: int = DEFAULT_RUNS
+) -> Iterator[BenchResult]:
+    """
+    Benchmark each solver in a fresh process, one solver at a time
+
+    Processes are spawned rather than forked, so the peak RSS does not include
+      memory inherited from this process. A solver that raises, or kills its
+      process, gets a failed result, and the others are still benchmarked
+
+    Args:
+        solvers (Iterable[Solver]): Solvers to benchmark
+        runs    (int)             : How many times to run each solver
+
+    Yields:
+        (BenchResult): Statistics of each solver, in order
+    """
+    context = multiprocessing.get_context("spawn")
+    for solver in solvers:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            future = executor.submit(
+                _bench_in_worker, solver.day, solver.level, solver.root, runs
+            )
+            try:
+                result = future.result()
+            except Exception:
+                # Including the traceback from the worker, chained as the cause
+                error = traceback.format_exc()
+                result = BenchResult(solver.day, solver.level, None, [], None, error)
+        yield result
+
+
+def _git_revision() -> Optional[str]:
+    """
+    Current commit of the repository
+
+    Returns:
+        (Optional[str]): Abbreviated commit hash, or None outside a git checkout
+    """
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.strip()
+
+
+def append_history(results: Iterable[BenchResult], path: Path = HISTORY_PATH) -> None:
+    """
+    Append the results of a benchmark to the history file, one JSON line per
+      benchmark
+
+    Args:
+        results (Iterable[BenchResult]): Results of the benchmark
+        path    (Path)                 : The history file
+    """
+    entry = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "results": [result.to_dict() for result in results],
+    }
+    with path.open("a") as fp:
+        fp.write(json.dumps(entry) + "\n")
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Baseline:
+    """
+    Load the stored baseline
+
+    Args:
+        path (Path): The baseline file
+
+    Returns:
+        (Baseline): (day, level)-statistics mapping; empty if there is none
+    """
+    try:
+        raw: dict[str, dict[str, float]] = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    baseline: Baseline = {}
+    for key, stats in raw.items():
+        day, _, level = key.partition(".")
+        baseline[(int(day), int(level))] = stats
+    return baseline
+
+
+def save_baseline(results: Iterable[BenchResult], path: Path = BASELINE_PATH) -> None:
+    """
+    Store results as the new baseline, keeping that of other solvers and of
+      failed ones
+
+    Args:
+        results (Iterable[BenchResult]): Results of the benchmark
+        path    (Path)                 : The baseline file
+    """
+    baseline = load_baseline(path)
+    for result in results:
+        if not result.ok:
+            continue
+        baseline[(result.day, result.level)] = {
+            "min": result.min,
+            "median": result.median,
+            "p95": result.p95,
+        }
+        if result.peak_rss is not None:
+            baseline[(result.day, result.level)]["peak_rss"] = result.peak_rss
+    raw = {f"{day}.{level}": stats for (day, level), stats in sorted(baseline.items())}
+    path.write_text(json.dumps(raw, indent=2) + "\n")
+
+
+def find_regressions(
+    results: Iterable[BenchResult],
+    baseline: Baseline,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> list[tuple[BenchResult, float]]:
+    """
+    Compare the median of each result with that of the baseline
+
+    Solvers without a baseline, and failed ones, are never regressions
+
+    Args:
+        results   (Iterable[BenchResult]): Results of the benchmark
+        baseline  (Baseline)             : Statistics to compare with
+        threshold (float)                : Tolerated relative slowdown
+        min_delta (float)                : Tolerated absolute slowdown, in
+                                           seconds
+
+    Returns:
+        (list[tuple[BenchResult, float]]): Each regressed result, with its
+                                           baseline median
+    """
+    regressions: list[tuple[BenchResult, float]] = []
+    for result in results:
+        if not result.ok:
+            continue
+        if (stats := baseline.get((result.day, result.level))) is None:
+            continue
+        reference = stats["median"]
+        if (
+            result.median > reference * (1 + threshold)
+            and result.median - reference > min_delta
+        ):
+            regressions.append((result, reference))
+    return regressions
+
+
+def find_memory_regressions(
+    results: Iterable[BenchResult],
+    baseline: Baseline,
+    threshold: float = DEFAULT_RSS_THRESHOLD,
+    min_delta: int = DEFAULT_MIN_RSS_DELTA,
+) -> list[tuple[BenchResult, int]]:
+    """
+    Compare the peak RSS of each result with that of the baseline
+
+    Solvers without a baseline peak RSS are never regressions
+
+    Args:
+        results   (Iterable[BenchResult]): Results of the benchmark
+        baseline  (Baseline)             : Statistics to compare with
+        threshold (float)                : Tolerated relative growth
+        min_delta (int)                  : Tolerated absolute growth, in KiB
+
+    Returns:
+        (list[tuple[BenchResult, int]]): Each regressed result, with its
+                                         baseline peak RSS
+    """
+    regressions: list[tuple[BenchResult, int]] = []
+    for result in results:
+        stats = baseline.get((result.day, result.level), {})
+        if result.peak_rss is None or (reference := stats.get("peak_rss")) is None:
+            continue
+        if (
+            result.peak_rss > reference * (1 + threshold)
+            and result.peak_rss - reference > min_delta
+        ):
+            regressions.append((result, int(reference)))
+    return regressions
@@ -0,0 +1,105 @@
+"""
+Module: Generate puzzle inputs of any size, with known answers
+
+Each day provides `generate(size, seed)` in `Day_XX/utils/generate.py`. It
+  returns the text of a valid puzzle input and the answers to both levels,
+  known by construction or from a straightforward reference computation. A
+  `size` of 1 is about as large as a real input; the same size and seed always
+  give the same puzzle
+
+Public Functions:
+    available    : Find the days that have an input generator
+    get_generator: Import the input generator of a day
+    puzzle_path  : Where a generated puzzle is stored
+    write_puzzle : Generate a puzzle, unless it already exists, and store it
+"""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import Callable, Iterable
+
+from .solvers import DAYS, ROOT_DIR, Answer
+
+GENERATED_DIR = ROOT_DIR / "generated"
+
+Generator = Callable[[float, int], tuple[str, tuple[Answer, Answer]]]
+
+
+def available(days: Iterable[int] = DAYS) -> list[int]:
+    """
+    Find the days that have an input generator
+
+    Args:
+        days (Iterable[int]): Days to look for
+
+    Returns:
+        (list[int]): The days with a `utils/generate.py`, in order
+    """
+    return [
+        day
+        for day in sorted(set(days))
+        if (ROOT_DIR / f"Day_{day:02}" / "utils" / "generate.py").is_file()
+    ]
+
+
+def get_generator(day: int) -> Generator:
+    """
+    Import the input generator of a day
+
+    Args:
+        day (int): The day of AOC
+
+    Returns:
+        (Generator): Its `generate(size, seed)` function
+    """
+    root = str(ROOT_DIR)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    module = importlib.import_module(f"Day_{day:02}.utils.generate")
+    return module.generate
+
+
+def puzzle_path(day: int, size: float, seed: int) -> Path:
+    """
+    Where a generated puzzle is stored; its answers are stored next to it,
+      with a `.json` suffix
+
+    Args:
+        day  (int)  : The day of AOC
+        size (float): Size of the puzzle, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (Path): Path of the puzzle input
+    """
+    return GENERATED_DIR / f"Day_{day:02}" / f"size_{size:g}_seed_{seed}.txt"
+
+
+def write_puzzle(
+    day: int, size: float = 1, seed: int = 0
+) -> tuple[Path, dict[int, Answer]]:
+    """
+    Generate a puzzle, unless it already exists, and store it with its answers
+
+    Args:
+        day  (int)  : The day of AOC
+        size (float): Size of the puzzle, relative to a real input
+        seed (int)  : Seed of the generator
+
+    Returns:
+        (Path)             : Path of the puzzle input
+        (dict[int, Answer]): Level-answer mapping
+    """
+    path = puzzle_path(day, size, seed)
+    answers_path = path.with_suffix(".json")
+    if path.exists() and answers_path.exists():
+        raw: dict[str, Answer] = json.loads(answers_path.read_text())
+        return path, {int(level): answer for level, answer in raw.items()}
+    text, (answer1, answer2) = get_generator(day)(size, seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    answers = {1: answer1, 2: answer2}
+    answers_path.write_text(json.dumps(answers) + "\n")
+    return path, answers
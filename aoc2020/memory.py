@@ -0,0 +1,329 @@
+"""
+Module: Track the memory of solvers and enforce a budget
+
+A sampling thread watches the resident set size while a solver runs, and,
+  when asked, tracemalloc snapshots the Python allocations as they grow, so the
+  allocation sites responsible for the peak can be reported. A solver going
+  over its budget is either reported or interrupted
+
+Public Classes:
+    MemoryBudgetExceeded: Raised in a solver that goes over its memory budget
+    MemoryLimits        : What to track and how much memory to allow
+    MemoryReport        : Memory used by a single solver
+
+Public Functions:
+    parse_size  : Parse a human-readable size into KiB
+    track_memory: Track the memory used by a block of code
+"""
+
+import _thread
+import re
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from mmap import PAGESIZE
+from pathlib import Path
+from time import monotonic, sleep
+from typing import Iterator, Optional
+
+# How often the sampling thread wakes up, in seconds
+_SAMPLE_INTERVAL = 0.005
+# Python allocations must grow this much past the last snapshot to take another
+#   one; snapshots cost time in proportion to the number of live blocks
+_SNAPSHOT_GROWTH = 1.25
+# How long to wait for an interrupt sent just as the block ended, in seconds
+_INTERRUPT_WAIT = 1.0
+# Bytes per KiB
+_KIB = 1024
+
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([KMG]?)i?B?", re.IGNORECASE)
+_SIZE_UNITS = {"": 1024, "K": 1, "M": 1024, "G": 1024 * 1024}
+
+_STATM_PATH = Path("/proc/self/statm")
+
+
+class MemoryBudgetExceeded(MemoryError):
+    """
+    Raised in a solver that goes over its memory budget
+    """
+
+
+class MemoryLimits:
+    """
+    What to track and how much memory to allow
+
+    Args:
+        budget (Optional[int]): Allowed growth of the RSS, in KiB, if any
+        abort  (bool)         : Whether to interrupt a solver that goes over the
+                                budget, rather than only flag it
+        trace  (bool)         : Whether to trace Python allocations to find
+                                where the memory goes
+        top    (int)          : Number of allocation sites to report
+
+    Public Attributes:
+        budget (Optional[int]): Allowed growth of the RSS, in KiB, if any
+        abort  (bool)         : Whether to interrupt a solver over the budget
+        trace  (bool)         : Whether to trace Python allocations
+        top    (int)          : Number of allocation sites to report
+    """
+
+    def __init__(
+        self,
+        budget: Optional[int] = None,
+        abort: bool = False,
+        trace: bool = False,
+        top: int = 5,
+    ) -> None:
+        self.budget = budget
+        self.abort = abort
+        self.trace = trace
+        self.top = top
+
+
+class MemoryReport:
+    """
+    Memory used by a single solver
+
+    Public Attributes:
+        peak_rss    (Optional[int])          : Peak growth of the RSS over the
+                                               start, in KiB, if the platform
+                                               reports it
+        peak_traced (Optional[int])          : Peak of the traced Python
+                                               allocations, in KiB, if traced
+        top_sites   (list[tuple[str, int, int]]):
+            File:line, KiB and number of blocks of the largest allocation
+              sites, close to the peak
+        exceeded    (bool)                   : Whether the budget was exceeded
+
+    Public Methods:
+        to_dict() -> dict[str, object]: JSON-serializable form of the report
+    """
+
+    def __init__(self) -> None:
+        self.peak_rss: Optional[int] = None
+        self.peak_traced: Optional[int] = None
+        self.top_sites: list[tuple[str, int, int]] = []
+        self.exceeded = False
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        JSON-serializable form of the report
+
+        Returns:
+            (dict[str, object]): The report
+        """
+        return {
+            "peak_rss": self.peak_rss,
+            "peak_traced": self.peak_traced,
+            "top_sites": [
+                {"site": site, "size": size, "count": count}
+                for site, size, count in self.top_sites
+            ],
+            "exceeded": self.exceeded,
+        }
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a human-readable size, e.g. "512M" or "1.5GiB", into KiB; plain
+      numbers are in MiB
+
+    Args:
+        text (str): The size
+
+    Returns:
+        (int): The size, in KiB
+
+    Raises:
+        ValueError: When the size cannot be parsed
+    """
+    if (match := _SIZE_RE.fullmatch(text.strip())) is None:
+        raise ValueError(f"Invalid size: {text}")
+    return round(float(match[1]) * _SIZE_UNITS[match[2].upper()])
+
+
+def _current_rss() -> Optional[int]:
+    """
+    Current resident set size of the process
+
+    Returns:
+        (Optional[int]): RSS in KiB, or None if the platform does not report it
+    """
+    try:
+        pages = int(_STATM_PATH.read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * PAGESIZE // _KIB
+
+
+class _Sampler(threading.Thread):
+    """
+    Thread sampling the memory of the process until stopped
+
+    Interrupts are sent, and `close` stops them, under a lock, so once the
+      block is closed no new interrupt can be on its way
+
+    Args:
+        limits (MemoryLimits): What to track and how much memory to allow
+        report (MemoryReport): Where the findings are stored
+    """
+
+    def __init__(self, limits: MemoryLimits, report: MemoryReport) -> None:
+        super().__init__(name="memory-sampler", daemon=True)
+        self._limits = limits
+        self._report = report
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._interrupted = False
+        self._start_rss = _current_rss()
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._snapshot_size = 0
+        # Interrupting works only when the solver runs in the main thread
+        self._can_abort = threading.current_thread() is threading.main_thread()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(_SAMPLE_INTERVAL):
+            self.sample()
+
+    def sample(self, final: bool = False) -> None:
+        """
+        Take one sample, and deal with an exceeded budget
+
+        Args:
+            final (bool): Whether the block is over, so nothing is interrupted
+        """
+        if self._start_rss is not None and (rss := _current_rss()) is not None:
+            growth = max(rss - self._start_rss, 0)
+            self._report.peak_rss = max(self._report.peak_rss or 0, growth)
+        if self._limits.trace and tracemalloc.is_tracing():
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self._snapshot_size * _SNAPSHOT_GROWTH:
+                self._snapshot = tracemalloc.take_snapshot()
+                self._snapshot_size = current
+        budget = self._limits.budget
+        if (
+            budget is not None
+            and not self._report.exceeded
+            and (self._report.peak_rss or 0) > budget
+        ):
+            self._report.exceeded = True
+            if self._limits.abort and self._can_abort and not final:
+                with self._lock:
+                    if not self._closed:
+                        self._interrupted = True
+                        _thread.interrupt_main()
+
+    def close(self) -> bool:
+        """
+        Stop sending interrupts; may be called more than once
+
+        Returns:
+            (bool): Whether an interrupt was sent
+        """
+        with self._lock:
+            self._closed = True
+            return self._interrupted
+
+    def stop(self) -> None:
+        """
+        Stop sampling, and fill in the rest of the report
+        """
+        self.close()
+        self._stop_event.set()
+        self.join()
+        self.sample(final=True)
+        if not self._limits.trace:
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        self._report.peak_traced = peak // _KIB
+        if self._snapshot is None:
+            return
+        snapshot = self._snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        self._report.top_sites = [
+            (str(stat.traceback[0]), stat.size // _KIB, stat.count)
+            for stat in snapshot.statistics("lineno")[: self._limits.top]
+        ]
+
+
+@contextmanager
+def track_memory(limits: MemoryLimits) -> Iterator[MemoryReport]:
+    """
+    Track the memory used by a block of code
+
+    The RSS is that of the whole process, so only its growth over the start of
+      the block is reported and checked against the budget. Tracing Python
+      allocations slows the code down severalfold. An interrupt sent just as
+      the block ends is waited for, so that it cannot land after the block
+
+    Args:
+        limits (MemoryLimits): What to track and how much memory to allow
+
+    Yields:
+        (MemoryReport): The report, complete once the block exits
+
+    Raises:
+        MemoryBudgetExceeded: When the block goes over the budget and
+                              `limits.abort` is set
+    """
+    report = MemoryReport()
+    started_tracing = limits.trace and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    sampler = _Sampler(limits, report)
+    sampler.start()
+    try:
+        try:
+            yield report
+        except Exception:
+            # The block may have failed on its own just as an interrupt was sent
+            if sampler.close():
+                _await_interrupt()
+            raise
+        if sampler.close():
+            # Sent just as the block ended, the interrupt is still on its way;
+            #   it must land here rather than in whatever runs next
+            _await_interrupt()
+    except KeyboardInterrupt:
+        # Wherever it landed, the interrupt was the sampler's if it sent one
+        if not sampler.close():
+            raise
+        raise _budget_exceeded(limits, report) from None
+    finally:
+        sampler.stop()
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def _await_interrupt() -> None:
+    """
+    Wait for an interrupt sent to the main thread to land, for a while
+    """
+    # Interrupts land between bytecodes, not in the middle of a sleep
+    deadline = monotonic() + _INTERRUPT_WAIT
+    while monotonic() < deadline:
+        sleep(_SAMPLE_INTERVAL)
+
+
+def _budget_exceeded(
+    limits: MemoryLimits, report: MemoryReport
+) -> MemoryBudgetExceeded:
+    """
+    Build the error of a block interrupted for going over its budget
+
+    Args:
+        limits (MemoryLimits): What was tracked and how much memory was allowed
+        report (MemoryReport): Memory used by the block
+
+    Returns:
+        (MemoryBudgetExceeded): The error
+    """
+    return MemoryBudgetExceeded(
+        f"RSS grew by {report.peak_rss} KiB, over the budget of {limits.budget} KiB"
+    )
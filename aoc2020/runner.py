@@ -0,0 +1,289 @@
+"""
+Module: Run many solvers in a single process
+
+Public Classes:
+    Result: Outcome of running a single solver
+
+Public Functions:
+    run_solvers         : Run solvers one after another, yielding each result
+    run_solvers_parallel: Run solvers in a process pool, slowest first
+"""
+
+import re
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, Iterator, Mapping, Optional
+
+from aoc_io.aoc_io import submit_output
+from aoc_io.instrument import Recorder, recording
+
+from .memory import MemoryLimits, MemoryReport, track_memory
+from .solvers import YEAR, Answer, Solver
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class Result:
+    """
+    Outcome of running a single solver
+
+    Args:
+        solver   (Solver)          : The solver that was run
+        answer   (Optional[Answer]): Its answer, if it succeeded
+        elapsed  (float)           : Wall time of the solver, in seconds
+        error    (Optional[str])   : The exception raised, if it failed
+        recorder (Optional[Recorder]): Its instrumentation, if it was recorded
+        memory   (Optional[MemoryReport]): Its memory use, if it was tracked
+
+    Public Attributes:
+        day      (int)             : The day of AOC
+        level    (int)             : Part 1 or 2
+        answer   (Optional[Answer]): The answer, if the solver succeeded
+        elapsed  (float)           : Wall time of the solver, in seconds
+        error    (Optional[str])   : The exception raised, if the solver failed
+        verdict  (Optional[str])   : Submission verdict, if it was submitted
+        recorder (Optional[Recorder]): Spans, counters and profile of the
+                                       solver, if they were recorded
+        memory   (Optional[MemoryReport]): Memory used by the solver, if it was
+                                           tracked
+
+    Public Methods:
+        to_dict() -> dict[str, object]: JSON-serializable form of the result
+    """
+
+    def __init__(
+        self,
+        solver: Solver,
+        answer: Optional[Answer],
+        elapsed: float,
+        error: Optional[str] = None,
+        recorder: Optional[Recorder] = None,
+        memory: Optional[MemoryReport] = None,
+    ) -> None:
+        self.day = solver.day
+        self.level = solver.level
+        self.answer = answer
+        self.elapsed = elapsed
+        self.error = error
+        self.verdict: Optional[str] = None
+        self.recorder = recorder
+        self.memory = memory
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        JSON-serializable form of the result; verdicts lose their coloring
+
+        Returns:
+            (dict[str, object]): The result
+        """
+        return {
+            "day": self.day,
+            "level": self.level,
+            "answer": self.answer,
+            "elapsed": self.elapsed,
+            "error": self.error,
+            "verdict": None if self.verdict is None else _ANSI_RE.sub("", self.verdict),
+            "instrumentation": (
+                None if self.recorder is None else self.recorder.to_dict()
+            ),
+            "memory": None if self.memory is None else self.memory.to_dict(),
+        }
+
+
+def _time_solver(
+    solver: Solver,
+    input_path: Optional[Path] = None,
+    instrument: bool = False,
+    profiler: Optional[str] = None,
+    memory: Optional[MemoryLimits] = None,
+) -> Result:
+    """
+    Run a solver, timing it and catching whatever it raises
+
+    Args:
+        solver     (Solver)                : The solver to run
+        input_path (Optional[Path])        : Puzzle input; defaults to the
+                                             day's `input.txt`
+        instrument (bool)                  : Whether to record its spans and
+                                             counters
+        profiler   (Optional[str])         : Profiler to run it under, implying
+                                             `instrument`
+        memory     (Optional[MemoryLimits]): How to track its memory, if at all
+
+    Returns:
+        (Result): Outcome of the solver, without verdict
+    """
+    start = perf_counter()
+    try:
+        # Imported first, so that the import is neither timed, recorded nor
+        #   tracked
+        solver.load()
+    except Exception:
+        return Result(solver, None, perf_counter() - start, traceback.format_exc())
+    if not instrument and profiler is None and memory is None:
+        start = perf_counter()
+        try:
+            answer = solver.solve(input_path)
+        except Exception:
+            return Result(solver, None, perf_counter() - start, traceback.format_exc())
+        return Result(solver, answer, perf_counter() - start)
+    root = f"day_{solver.day:02}.level_{solver.level}"
+    solved: Optional[Answer] = None
+    error: Optional[str] = None
+    recorder: Optional[Recorder] = None
+    report: Optional[MemoryReport] = None
+    start = perf_counter()
+    try:
+        with ExitStack() as stack:
+            if memory is not None:
+                report = stack.enter_context(track_memory(memory))
+            if instrument or profiler is not None:
+                recorder = stack.enter_context(recording(root, profiler))
+            solved = solver.solve(input_path)
+    except Exception:
+        # Including going over the memory budget
+        error = traceback.format_exc()
+    return Result(solver, solved, perf_counter() - start, error, recorder, report)
+
+
+def _submit(solver: Solver, result: Result) -> None:
+    """
+    Submit the answer of a successful result, storing the verdict in it
+
+    Args:
+        solver (Solver): The solver that produced the result
+        result (Result): Its result
+    """
+    if result.ok:
+        result.verdict = submit_output(
+            YEAR, solver.day, solver.level, result.answer  # type: ignore
+        )
+
+
+def _time_in_worker(
+    day: int,
+    level: int,
+    root: Path,
+    instrument: bool = False,
+    profiler: Optional[str] = None,
+    memory: Optional[MemoryLimits] = None,
+) -> Result:
+    """
+    Entry point of the worker processes; solvers are rebuilt from their day
+      and level rather than pickled
+
+    Args:
+        day        (int)                   : The day of AOC
+        level      (int)                   : Part 1 or 2
+        root       (Path)                  : Directory containing the `Day_XX`
+                                             directories
+        instrument (bool)                  : Whether to record its spans and
+                                             counters
+        profiler   (Optional[str])         : Profiler to run it under
+        memory     (Optional[MemoryLimits]): How to track its memory, if at all
+
+    Returns:
+        (Result): Outcome of the solver, without verdict
+    """
+    return _time_solver(Solver(day, level, root), None, instrument, profiler, memory)
+
+
+def run_solvers(
+    solvers: Iterable[Solver],
+    submit: bool = False,
+    input_path: Optional[Path] = None,
+    instrument: bool = False,
+    profiler: Optional[str] = None,
+    memory: Optional[MemoryLimits] = None,
+) -> Iterator[Result]:
+    """
+    Run solvers one after another, yielding each result
+
+    A solver that raises does not stop the run; the exception is recorded in
+      its result instead
+
+    Args:
+        solvers    (Iterable[Solver]): Solvers to run
+        submit     (bool)            : Whether to submit each answer
+        input_path (Optional[Path])  : Puzzle input for all the solvers;
+                                       defaults to each day's `input.txt`
+        instrument (bool)            : Whether to record spans and counters
+        profiler   (Optional[str])   : Profiler to run each solver under
+        memory     (Optional[MemoryLimits]):
+            How to track the memory of each solver, if at all
+
+    Yields:
+        (Result): Outcome of each solver, in order
+    """
+    for solver in solvers:
+        result = _time_solver(solver, input_path, instrument, profiler, memory)
+        if submit:
+            _submit(solver, result)
+        yield result
+
+
+def run_solvers_parallel(
+    solvers: Iterable[Solver],
+    submit: bool = False,
+    max_workers: Optional[int] = None,
+    timings: Optional[Mapping[tuple[int, int], float]] = None,
+    instrument: bool = False,
+    profiler: Optional[str] = None,
+    memory: Optional[MemoryLimits] = None,
+) -> Iterator[Result]:
+    """
+    Run solvers in a process pool, yielding each result as it finishes
+
+    Solvers are queued longest first according to `timings`, and solvers
+      without history go before all of them, so that the slowest solver starts
+      right away and the total wall time approaches its own. Answers are
+      submitted from this process, one at a time
+
+    Args:
+        solvers     (Iterable[Solver])    : Solvers to run
+        submit      (bool)                : Whether to submit each answer
+        max_workers (Optional[int])       : Number of processes; defaults to
+                                            the number of CPUs
+        timings     (Optional[Mapping[tuple[int, int], float]]):
+            (day, level)-seconds mapping of previous runs
+        instrument  (bool)                : Whether to record spans and counters
+        profiler    (Optional[str])       : Profiler to run each solver under
+        memory      (Optional[MemoryLimits]):
+            How to track the memory of each solver, if at all
+
+    Yields:
+        (Result): Outcome of each solver, in order of completion
+    """
+    history = timings or {}
+    queue = sorted(
+        solvers,
+        key=lambda solver: -history.get((solver.day, solver.level), float("inf")),
+    )
+    if not queue:
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _time_in_worker,
+                solver.day,
+                solver.level,
+                solver.root,
+                instrument,
+                profiler,
+                memory,
+            ): solver
+            for solver in queue
+        }
+        for future in as_completed(futures):
+            solver = futures[future]
+            result = future.result()
+            if submit:
+                _submit(solver, result)
+            yield result
@@ -0,0 +1,146 @@
+"""
+Module: Discover and load the solution of each day
+
+The `Day_XX/Level N.py` scripts are not importable by name, so each one is
+  loaded from its path and registered as `Day_XX.level_N`
+
+Public Classes:
+    Solver: A single `Day_XX/Level N.py` solution
+
+Public Functions:
+    discover: Find the solvers of the requested days and levels
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterable, Optional, Union
+
+from aoc_io.aoc_io import DATA_FILENAME
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+YEAR = 2020
+DAYS = range(1, 26)
+LEVELS = (1, 2)
+
+Answer = Union[int, str]
+
+
+class Solver:
+    """
+    A single `Day_XX/Level N.py` solution; the script is only imported when
+      the solver is first used
+
+    Args:
+        day   (int) : The day of AOC
+        level (int) : Part 1 or 2
+        root  (Path): Directory containing the `Day_XX` directories
+
+    Public Attributes:
+        day         (int) : The day of AOC
+        level       (int) : Part 1 or 2
+        root        (Path): Directory containing the `Day_XX` directories
+        path        (Path): The solution script
+        input_path  (Path): The default puzzle input
+        module_name (str) : Name the script is registered under
+
+    Public Methods:
+        load() -> Callable[[Path], Answer]: Import the script and return its
+                                             `levelN` function
+        solve(Optional[Path]) -> Answer   : Solve the puzzle
+    """
+
+    def __init__(self, day: int, level: int, root: Path = ROOT_DIR) -> None:
+        self.day = day
+        self.level = level
+        self.root = root
+        self.path = root / f"Day_{day:02}" / f"Level {level}.py"
+        self.input_path = self.path.parent / DATA_FILENAME
+        self.module_name = f"Day_{day:02}.level_{level}"
+        self._func: Optional[Callable[[Path], Answer]] = None
+
+    def __repr__(self) -> str:
+        return f"Solver(day={self.day}, level={self.level})"
+
+    def load(self) -> Callable[[Path], Answer]:
+        """
+        Import the script and return its `levelN` function
+
+        Returns:
+            (Callable[[Path], Answer]): The solution function
+        """
+        if self._func is None:
+            module = _import_path(self.module_name, self.path)
+            self._func = getattr(module, f"level{self.level}")
+        return self._func
+
+    def solve(self, input_path: Optional[Path] = None) -> Answer:
+        """
+        Solve the puzzle
+
+        Args:
+            input_path (Optional[Path]): Puzzle input; defaults to the day's
+                                         `input.txt`
+
+        Returns:
+            (Answer): Solution to the problem
+        """
+        return self.load()(input_path or self.input_path)
+
+
+def _import_path(name: str, path: Path) -> ModuleType:
+    """
+    Import a module from a path that is not a valid module name
+
+    Args:
+        name (str) : Name to register the module under
+        path (Path): The source file
+
+    Returns:
+        (ModuleType): The imported module
+    """
+    if (module := sys.modules.get(name)) is not None:
+        return module
+    # The scripts import their helpers as `Day_XX.utils...`
+    root = str(path.parent.parent)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {path}", name=name, path=str(path))
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing so that classes defined in the script can be
+    #   found by name, e.g. by `pickle`
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def discover(
+    days: Iterable[int] = DAYS, levels: Iterable[int] = LEVELS, root: Path = ROOT_DIR
+) -> list[Solver]:
+    """
+    Find the solvers of the requested days and levels
+
+    Days or levels without a solution script are skipped
+
+    Args:
+        days   (Iterable[int]): Days to look for
+        levels (Iterable[int]): Levels to look for
+        root   (Path)         : Directory containing the `Day_XX` directories
+
+    Returns:
+        (list[Solver]): The solvers, ordered by day then level
+    """
+    solvers = [
+        Solver(day, level, root)
+        for day in sorted(set(days))
+        for level in sorted(set(levels))
+    ]
+    return [solver for solver in solvers if solver.path.is_file()]
@@ -0,0 +1,60 @@
+"""
+Module: Wall times of previous runs, used to schedule the slowest solvers first
+
+Public Functions:
+    load_timings  : Load the last recorded wall time of each solver
+    record_timings: Store the wall times of successful results
+"""
+
+import json
+from pathlib import Path
+from typing import Iterable
+
+from .solvers import ROOT_DIR
+from .runner import Result
+
+TIMINGS_FILENAME = ".timings.json"
+TIMINGS_PATH = ROOT_DIR / "aoc2020" / TIMINGS_FILENAME
+
+Timings = dict[tuple[int, int], float]
+
+
+def load_timings(path: Path = TIMINGS_PATH) -> Timings:
+    """
+    Load the last recorded wall time of each solver
+
+    A missing or unreadable file is treated as an empty history
+
+    Args:
+        path (Path): The timings file
+
+    Returns:
+        (Timings): (day, level)-seconds mapping
+    """
+    try:
+        raw: dict[str, float] = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    timings: Timings = {}
+    for key, elapsed in raw.items():
+        day, _, level = key.partition(".")
+        timings[(int(day), int(level))] = float(elapsed)
+    return timings
+
+
+def record_timings(results: Iterable[Result], path: Path = TIMINGS_PATH) -> None:
+    """
+    Store the wall times of successful results, keeping those of other solvers
+
+    Args:
+        results (Iterable[Result]): Results of the latest run
+        path    (Path)            : The timings file
+    """
+    timings = load_timings(path)
+    for result in results:
+        if result.ok:
+            timings[(result.day, result.level)] = result.elapsed
+    raw = {
+        f"{day}.{level}": elapsed for (day, level), elapsed in sorted(timings.items())
+    }
+    path.write_text(json.dumps(raw, indent=2) + "\n")
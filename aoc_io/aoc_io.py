@@ -1,85 +1,440 @@
 #!/usr/bin/env python3
 """
 Get input from and submit answer to AOC
+
+Importing this module is cheap: the token is read, colorama is initialized and
+  `requests`/`bs4` are imported only when the network is first used, so
+  solvers that only need `DATA_FILENAME` (or run offline) pay none of it
 """
 
 # pyright: reportUnknownMemberType=false
 # pyright: reportMissingTypeStubs=false
 # pyright: reportOptionalMemberAccess=false
 
+from __future__ import annotations
+
+import os
 from time import sleep
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta
 from string import Template
 from pathlib import Path
-from typing import Literal, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Literal, Optional, Union
 
-import requests
-from bs4 import BeautifulSoup
-from colorama import Fore, init
+from .rate_limit import RateLimiter
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
 
-init(autoreset=True)
+if TYPE_CHECKING:
+    import requests
+    from colorama.ansi import AnsiFore
 
 DATA_FILENAME = "input.txt"
 TOKEN_FILENAME = "token.txt"
 TOKEN_PATH = Path(__file__).parent / TOKEN_FILENAME
 
-DATA_URL = Template("https://adventofcode.com/${year}/day/${day}/input")
-ANSWER_URL = Template("https://adventofcode.com/${year}/day/${day}/answer")
+BASE_URL = "https://adventofcode.com"
+DATA_URL = Template("${base}/${year}/day/${day}/input")
+ANSWER_URL = Template("${base}/${year}/day/${day}/answer")
+
+# What the AOC website made of a submission, plus "refused" for answers the
+#   answer ledger knows are wrong and "failed" for submissions that never got
+#   through
+Verdict = Literal["right", "wrong", "solved", "too_soon", "refused", "failed"]
+
+# Connection pool size per host and (connect, read) timeout in seconds
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (5.0, 30.0)
+
+# Session cookie, read from `TOKEN_PATH` on first use
+_cookies: Optional[dict[str, str]] = None
+# colorama's `Fore`, imported and initialized on first use
+_fore: Optional[AnsiFore] = None
+
+# Chunk size the answer page is streamed into the verdict parser with
+_VERDICT_CHUNK_SIZE = 1024
 
-with TOKEN_PATH.open("r") as token_fp:
-    token_value = token_fp.readline().strip()
+# Shared keep-alive session, created on first use
+_session: Optional[requests.Session] = None
+_pool_size = DEFAULT_POOL_SIZE
+_timeout: tuple[float, float] = DEFAULT_TIMEOUT
 
-COOKIES = {"session": token_value}
+
+def get_cookies() -> dict[str, str]:
+    """
+    Get the cookies authenticating requests, reading the token on first use
+
+    Returns:
+        (dict[str, str]): Cookie name-value mapping
+    """
+    global _cookies
+    if _cookies is None:
+        with TOKEN_PATH.open("r") as token_fp:
+            _cookies = {"session": token_fp.readline().strip()}
+    return _cookies
+
+
+def get_fore() -> AnsiFore:
+    """
+    Get colorama's `Fore`, initializing colorama on first use
+
+    Returns:
+        (colorama.ansi.AnsiFore): Foreground color codes
+    """
+    global _fore
+    if _fore is None:
+        from colorama import Fore, init
+
+        init(autoreset=True)
+        _fore = Fore
+    return _fore
+
+
+def configure_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+) -> requests.Session:
+    """
+    (Re)create the shared HTTP session used by `get_input` and `submit_output`
+
+    Connections in the pool are kept alive and reused across requests, so a
+      batch of downloads/submissions only pays for the TCP+TLS handshake once
+      per pooled connection instead of once per request
+
+    Args:
+        pool_size (int)               : Max number of pooled connections per
+                                        host
+        timeout   (tuple[float, float]): (connect, read) timeout in seconds,
+                                        applied to every request
+
+    Returns:
+        (requests.Session): The new shared session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    global _session, _pool_size, _timeout
+    if _session is not None:
+        _session.close()
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.cookies.update(get_cookies())
+    _session = session
+    _pool_size = pool_size
+    _timeout = timeout
+    return session
+
+
+def get_session(min_pool_size: int = 0) -> requests.Session:
+    """
+    Get the shared HTTP session, creating it with default settings if needed
+
+    Args:
+        min_pool_size (int): Recreate the session with a larger pool if it
+                             holds fewer connections than this
+
+    Returns:
+        (requests.Session): The shared session
+    """
+    if _session is None:
+        return configure_session(max(min_pool_size, DEFAULT_POOL_SIZE))
+    if _pool_size < min_pool_size:
+        return configure_session(min_pool_size, _timeout)
+    return _session
+
+
+def unlock_time(year: int, day: int) -> datetime:
+    """
+    Local time at which a puzzle opens (with half a second of head start)
+
+    Args:
+        year (int)   : The year of AOC
+        day  (1..25) : The day of AOC
+
+    Returns:
+        (datetime): Naive local datetime the puzzle unlocks at
+    """
+    from zoneinfo import ZoneInfo
+
+    if day not in range(1, 26):
+        raise ValueError(f"{day=} is not in range 1..25")
+    target_time_est = datetime(year, 12, day, tzinfo=ZoneInfo("EST")) - timedelta(
+        milliseconds=500
+    )
+    return datetime.fromtimestamp(target_time_est.timestamp())
+
+
+def fetch_input(
+    year: int,
+    day: int,
+    verbose: bool = True,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> Optional[bytes]:
+    """
+    Download input from AOC website, without waiting for the puzzle to open
+
+    Args:
+        year         (int)                : The year of AOC
+        day          (1..25)              : The day of AOC
+        verbose      (bool)               : Whether to print progress
+        rate_limiter (RateLimiter | None) : Limiter to wait on before each try
+        retry_policy (RetryPolicy)        : When and how often to retry
+
+    Returns:
+        (bytes | None): Puzzle input; `None` if all tries failed
+    """
+    import requests
+    from urllib.parse import urlsplit
+
+    fore = get_fore()
+    url = DATA_URL.substitute(base=BASE_URL, year=year, day=day)
+    budget = retry_policy.start()
+    while True:
+        if verbose:
+            print(f"Try #{budget.attempts}")
+        if rate_limiter is not None:
+            rate_limiter.wait(urlsplit(url).netloc)
+        retry_after: Optional[str] = None
+        try:
+            response = get_session().get(url, timeout=_timeout)
+        except requests.Timeout as err:
+            if verbose:
+                print(fore.RED + f"Timed out: {err}")
+        except requests.ConnectionError as err:
+            # Refused or reset, as when the site is down
+            if verbose:
+                print(fore.RED + f"Connection failed: {err}")
+        else:
+            with response:
+                if response.ok:
+                    return response.content
+                if verbose:
+                    print(fore.RED + response.content.decode("utf-8").strip())
+                retry_after = response.headers.get("Retry-After")
+        if (delay := budget.next_delay(retry_after)) is None:
+            return None
+        sleep(delay)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file by writing a temporary sibling and renaming it into place, so
+      readers never see a partially written file
+
+    Args:
+        path (pathlib.Path): Path of file to write
+        data (bytes)       : File content
+    """
+    from tempfile import mkstemp
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_fp:
+            tmp_fp.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
 def get_input(
     year: int,
     day: int,
     input_path: Path,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
 ) -> None:
     """
     Download input from AOC website
 
     Args:
-        year       (int)         : The year of AOC
-        day        (1..25)       : The day of AOC
-        input_path (pathlib.Path): Path of file to write input to
+        year         (int)         : The year of AOC
+        day          (1..25)       : The day of AOC
+        input_path   (pathlib.Path): Path of file to write input to
+        retry_policy (RetryPolicy) : When and how often to retry
     """
-    if day not in range(1, 26):
-        raise ValueError(f"{day=} is not in range 1..25")
-    target_time_est = datetime(
-        year, 12, day - 1, 23, 59, 59, 500_000, tzinfo=ZoneInfo("EST")
-    )
-    target_time_local = datetime.fromtimestamp(target_time_est.timestamp())
+    fore = get_fore()
+    target_time_local = unlock_time(year, day)
     while (now := datetime.now()) < target_time_local:
         diff = target_time_local - now
         seconds = diff.days * 86400 + diff.seconds
         print(f"{seconds} seconds until problem opens. Waiting...")
         sleep(max(diff.seconds - 1, 1))
     print("Downloading...")
-    for i in range(3):
-        print(f"Try #{i}")
-        with requests.get(
-            DATA_URL.substitute(year=year, day=day),
-            cookies=COOKIES,
-        ) as response:
-            if not response.ok:
-                print(Fore.RED + response.content.decode("utf-8").strip())
-                sleep(1)
-                continue
-            response_bytes = response.content
-            break
-    else:
+    response_bytes = fetch_input(year, day, retry_policy=retry_policy)
+    if response_bytes is None:
         print("Download failed!")
         return
     print(
-        Fore.GREEN
+        fore.GREEN
         + f"Got input with {len(response_bytes)} characters"
         + f" and {len(response_bytes.splitlines())} lines"
     )
-    with input_path.open("wb") as input_fp:
-        input_fp.write(response_bytes)
+    write_atomic(input_path, response_bytes)
+
+
+def check_submission(day: int, level: int) -> None:
+    """
+    Validate the day and level of a submission
+
+    Args:
+        day   (1..25): The day of AOC
+        level (1, 2) : Whether the submission is for part 1 or 2
+    """
+    if day not in range(1, 26):
+        raise ValueError(f"{day=} is not in range 1..25")
+    if level not in (1, 2):
+        raise ValueError(f"{level=} is not in choices (1, 2)")
+
+
+def extract_verdict(chunks: Iterable[bytes]) -> str:
+    """
+    Extract the verdict text from an answer page
+
+    The page is parsed as it streams in, stopping at the first paragraph of
+      the article. BeautifulSoup, if installed, is only used as a fallback for
+      pages the streaming parser finds no verdict in
+
+    Args:
+        chunks (Iterable[bytes]): HTML of the page returned for a submission,
+                                  in any chunking
+
+    Returns:
+        (str): Text of the verdict paragraph
+    """
+    from .verdict import stream_verdict
+
+    received: list[bytes] = []
+
+    def record_chunks() -> Iterator[bytes]:
+        for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+
+    if (response_text := stream_verdict(record_chunks())) is not None:
+        return response_text
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        raise ValueError("No verdict in the answer page") from None
+    html = BeautifulSoup(b"".join(received), "html.parser")
+    if html.article is None or html.article.p is None:
+        raise ValueError("No verdict in the answer page")
+    return html.article.p.text
+
+
+def classify_verdict(response_text: str) -> Verdict:
+    """
+    Classify the text of a verdict
+
+    Args:
+        response_text (str): Text of the verdict paragraph
+
+    Returns:
+        (Verdict): Kind of verdict
+    """
+    if response_text.startswith("You don't"):
+        return "solved"
+    elif response_text.startswith("That's the"):
+        return "right"
+    elif response_text.startswith("That's not"):
+        return "wrong"
+    elif response_text.startswith("You gave"):
+        return "too_soon"
+    else:
+        raise ValueError(f"Unknown response text: {response_text}")
+
+
+def color_verdict(verdict: Verdict, response_text: str) -> str:
+    """
+    Color the text of a verdict according to its kind
+
+    Args:
+        verdict       (Verdict): Kind of verdict
+        response_text (str)    : Text to color
+
+    Returns:
+        (str): Success/failure string, with coloring
+    """
+    fore = get_fore()
+    if verdict == "right":
+        return fore.GREEN + response_text
+    elif verdict == "solved":
+        return fore.YELLOW + response_text
+    else:
+        return fore.RED + response_text
+
+
+def format_verdict(content: bytes) -> str:
+    """
+    Extract the verdict from an answer page and color it
+
+    Args:
+        content (bytes): HTML of the page returned for a submission
+
+    Returns:
+        (str): Success/failure string, with coloring
+    """
+    response_text = extract_verdict((content,))
+    return color_verdict(classify_verdict(response_text), response_text)
+
+
+def known_verdict(
+    year: int, day: int, level: int, answer: Union[str, int], use_ledger: bool
+) -> Optional[str]:
+    """
+    Look an answer up in the answer ledger, to avoid submitting it again
+
+    Args:
+        year       (int)      : The year of AOC
+        day        (1..25)    : The day of AOC
+        level      (1, 2)     : Whether the submission is for part 1 or 2
+        answer     (str | int): Answer to be submitted
+        use_ledger (bool)     : Whether the ledger is in use at all
+
+    Returns:
+        (str | None): Cached or refusal verdict, with coloring; `None` if the
+                      answer has to be submitted
+    """
+    if not use_ledger:
+        return None
+    from .ledger import get_ledger
+
+    known = get_ledger().lookup(year, day, level, answer)
+    return None if known is None else color_verdict(*known)
+
+
+def settle_verdict(
+    year: int,
+    day: int,
+    level: int,
+    answer: Union[str, int],
+    chunks: Iterable[bytes],
+    use_ledger: bool,
+) -> str:
+    """
+    Extract the verdict from an answer page and record it in the answer ledger
+
+    Args:
+        year       (int)            : The year of AOC
+        day        (1..25)          : The day of AOC
+        level      (1, 2)           : Whether the submission is for part 1 or 2
+        answer     (str | int)      : The submitted answer
+        chunks     (Iterable[bytes]): HTML of the page returned for the
+                                      submission, in any chunking
+        use_ledger (bool)           : Whether the ledger is in use at all
+
+    Returns:
+        (str): Success/failure string, with coloring
+    """
+    response_text = extract_verdict(chunks)
+    verdict = classify_verdict(response_text)
+    if use_ledger:
+        from .ledger import get_ledger
+
+        get_ledger().record(year, day, level, answer, verdict, response_text)
+    return color_verdict(verdict, response_text)
 
 
 def submit_output(
@@ -87,42 +442,61 @@ def submit_output(
     day: int,
     level: Literal[1, 2],
     answer: Union[str, int],
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    use_ledger: bool = True,
 ) -> str:
     """
     Upload solution to AOC website
 
+    Answers whose verdict is already in the answer ledger are not submitted
+      again: the cached verdict is returned instead, and answers known to be
+      wrong are refused
+
     Args:
-        year   (int)      : The year of AOC
-        day    (1..25)    : The day of AOC
-        level  (1, 2)     : Whether the submission is for part 1 or 2
-        answer (str | int): Answer to be submitted
+        year         (int)        : The year of AOC
+        day          (1..25)      : The day of AOC
+        level        (1, 2)       : Whether the submission is for part 1 or 2
+        answer       (str | int)  : Answer to be submitted
+        retry_policy (RetryPolicy): When and how often to retry
+        use_ledger   (bool)       : Whether to consult and update the ledger
 
     Returns:
         (str): Success/failure string, with coloring
     """
-    if day not in range(1, 26):
-        raise ValueError(f"{day=} is not in range 1..25")
-    if level not in (1, 2):
-        raise ValueError(f"{level=} is not in choices (1, 2)")
+    import requests
+
+    check_submission(day, level)
+    if (known := known_verdict(year, day, level, answer, use_ledger)) is not None:
+        return known
+    budget = retry_policy.start()
     while True:
-        with requests.post(
-            ANSWER_URL.substitute(year=year, day=day),
-            {"level": level, "answer": answer},
-            cookies=COOKIES,
-        ) as response:
-            if not response.ok:
-                sleep(1)
-                continue
-            html = BeautifulSoup(response.content, "html.parser")
-            break
-    response_text: str = html.article.p.text
-    if response_text.startswith("You don't"):
-        return Fore.YELLOW + response_text
-    elif response_text.startswith("That's the"):
-        return Fore.GREEN + response_text
-    elif response_text.startswith("That's not"):
-        return Fore.RED + response_text
-    elif response_text.startswith("You gave"):
-        return Fore.RED + response_text
-    else:
-        raise ValueError(f"Unknown response text: {response_text}")
+        retry_after: Optional[str] = None
+        try:
+            response = get_session().post(
+                ANSWER_URL.substitute(base=BASE_URL, year=year, day=day),
+                {"level": level, "answer": answer},
+                timeout=_timeout,
+                stream=True,
+            )
+        except requests.Timeout:
+            status = "timed out"
+        except requests.ConnectionError:
+            status = "connection failed"
+        else:
+            with response:
+                if response.ok:
+                    return settle_verdict(
+                        year,
+                        day,
+                        level,
+                        answer,
+                        response.iter_content(_VERDICT_CHUNK_SIZE),
+                        use_ledger,
+                    )
+                status = f"HTTP {response.status_code}"
+                retry_after = response.headers.get("Retry-After")
+        if (delay := budget.next_delay(retry_after)) is None:
+            return color_verdict(
+                "failed", f"Submission failed after {budget.attempts} tries: {status}"
+            )
+        sleep(delay)
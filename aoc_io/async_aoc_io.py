@@ -0,0 +1,198 @@
+"""
+Module: asyncio variant of `aoc_io`
+
+Mirrors `get_input` and `submit_output` as coroutines, so any number of
+  downloads, submissions and "waiting for the puzzle to open" countdowns can
+  share one event loop:
+
+    async with async_session() as session:
+        await asyncio.gather(
+            *(async_get_input(2020, day, path, session) for day, path in ...)
+        )
+
+Public Functions:
+    async_session      : Create a pooled keep-alive `aiohttp.ClientSession`
+    async_get_input    : Download input from AOC website
+    async_submit_output: Upload solution to AOC website
+"""
+
+# pyright: reportUnknownMemberType=false
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Literal, Optional, Union
+
+import aiohttp
+
+from . import aoc_io
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+
+
+def async_session(
+    pool_size: int = aoc_io.DEFAULT_POOL_SIZE,
+    timeout: tuple[float, float] = aoc_io.DEFAULT_TIMEOUT,
+) -> aiohttp.ClientSession:
+    """
+    Create a pooled keep-alive `aiohttp.ClientSession`
+
+    Must be called while the event loop is running. Use it as an async context
+      manager so the pooled connections are closed at the end
+
+    Args:
+        pool_size (int)                : Max number of pooled connections per
+                                         host
+        timeout   (tuple[float, float]): (connect, read) timeout in seconds
+
+    Returns:
+        (aiohttp.ClientSession): The new session
+    """
+    connect, read = timeout
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=pool_size, limit_per_host=pool_size),
+        cookies=aoc_io.get_cookies(),
+        timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+    )
+
+
+@asynccontextmanager
+async def _use_session(
+    session: Optional[aiohttp.ClientSession],
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Use the given session, or a temporary one if none is given
+
+    Args:
+        session (aiohttp.ClientSession | None): Session passed by the caller
+
+    Yields:
+        (aiohttp.ClientSession): Session to make requests with
+    """
+    if session is not None:
+        yield session
+    else:
+        async with async_session() as temp_session:
+            yield temp_session
+
+
+async def async_get_input(
+    year: int,
+    day: int,
+    input_path: Path,
+    session: Optional[aiohttp.ClientSession] = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> None:
+    """
+    Download input from AOC website
+
+    Args:
+        year         (int)                         : The year of AOC
+        day          (1..25)                       : The day of AOC
+        input_path   (pathlib.Path)                : Path of file to write
+                                                     input to
+        session      (aiohttp.ClientSession | None): Session to share; a
+                                                     temporary one is used if
+                                                     not given
+        retry_policy (RetryPolicy)                 : When and how often to
+                                                     retry
+    """
+    fore = aoc_io.get_fore()
+    target_time_local = aoc_io.unlock_time(year, day)
+    while (now := datetime.now()) < target_time_local:
+        diff = target_time_local - now
+        print(f"Day {day}: {diff.total_seconds():.0f} seconds until problem opens")
+        await asyncio.sleep(max(diff.total_seconds() - 1, 0.1))
+    url = aoc_io.DATA_URL.substitute(base=aoc_io.BASE_URL, year=year, day=day)
+    budget = retry_policy.start()
+    async with _use_session(session) as session_:
+        while True:
+            retry_after: Optional[str] = None
+            try:
+                async with session_.get(url) as response:
+                    content = await response.read()
+            except asyncio.TimeoutError:
+                print(fore.RED + f"Day {day}: try #{budget.attempts} timed out")
+            except aiohttp.ClientConnectionError as err:
+                # Refused or reset, as when the site is down
+                print(fore.RED + f"Day {day}: try #{budget.attempts} failed: {err}")
+            else:
+                if response.ok:
+                    break
+                print(fore.RED + f"Day {day}: {content.decode('utf-8').strip()}")
+                retry_after = response.headers.get("Retry-After")
+            if (delay := budget.next_delay(retry_after)) is None:
+                print(f"Day {day}: download failed!")
+                return
+            await asyncio.sleep(delay)
+    print(
+        fore.GREEN
+        + f"Day {day}: got input with {len(content)} characters"
+        + f" and {len(content.splitlines())} lines"
+    )
+    aoc_io.write_atomic(input_path, content)
+
+
+async def async_submit_output(
+    year: int,
+    day: int,
+    level: Literal[1, 2],
+    answer: Union[str, int],
+    session: Optional[aiohttp.ClientSession] = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    use_ledger: bool = True,
+) -> str:
+    """
+    Upload solution to AOC website
+
+    Like `submit_output`, answers already in the answer ledger are answered
+      from it instead of being submitted again
+
+    Args:
+        year         (int)                         : The year of AOC
+        day          (1..25)                       : The day of AOC
+        level        (1, 2)                        : Whether the submission is
+                                                     for part 1 or 2
+        answer       (str | int)                   : Answer to be submitted
+        session      (aiohttp.ClientSession | None): Session to share; a
+                                                     temporary one is used if
+                                                     not given
+        retry_policy (RetryPolicy)                 : When and how often to
+                                                     retry
+        use_ledger   (bool)                        : Whether to consult and
+                                                     update the ledger
+
+    Returns:
+        (str): Success/failure string, with coloring
+    """
+    aoc_io.check_submission(day, level)
+    known = aoc_io.known_verdict(year, day, level, answer, use_ledger)
+    if known is not None:
+        return known
+    url = aoc_io.ANSWER_URL.substitute(base=aoc_io.BASE_URL, year=year, day=day)
+    budget = retry_policy.start()
+    async with _use_session(session) as session_:
+        while True:
+            retry_after: Optional[str] = None
+            try:
+                async with session_.post(
+                    url, data={"level": str(level), "answer": str(answer)}
+                ) as response:
+                    content = await response.read()
+            except asyncio.TimeoutError:
+                status = "timed out"
+            except aiohttp.ClientConnectionError:
+                status = "connection failed"
+            else:
+                if response.ok:
+                    return aoc_io.settle_verdict(
+                        year, day, level, answer, (content,), use_ledger
+                    )
+                status = f"HTTP {response.status}"
+                retry_after = response.headers.get("Retry-After")
+            if (delay := budget.next_delay(retry_after)) is None:
+                return aoc_io.color_verdict(
+                    "failed",
+                    f"Submission failed after {budget.attempts} tries: {status}",
+                )
+            await asyncio.sleep(delay)
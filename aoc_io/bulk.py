@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Module: Download many inputs concurrently
+
+Public Functions:
+    parse_range: Parse a "1-5,7" style range of numbers
+    input_paths: Map (year, day) pairs to their `input.txt` paths
+    get_inputs : Download all missing inputs concurrently
+
+Usage:
+    python -m aoc_io.bulk [--years 2020 ...] [--days 1-25] [--workers N]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, Literal, Optional
+
+from .aoc_io import DATA_FILENAME, fetch_input, get_session, unlock_time, write_atomic
+from .rate_limit import RateLimiter
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Directory of each day's input, relative to the root directory
+DEFAULT_LAYOUT = "Day_{day:02}"
+
+DEFAULT_MAX_WORKERS = 25
+# At most 20 requests/s to the AOC website
+DEFAULT_MIN_INTERVAL = 0.05
+
+Status = Literal["skipped", "locked", "downloaded", "failed"]
+
+
+def parse_range(spec: str) -> list[int]:
+    """
+    Parse a "1-5,7" style range of numbers
+
+    Args:
+        spec (str): Comma-separated numbers and inclusive `start-end` ranges
+
+    Returns:
+        (list[int]): The numbers, in order of appearance
+    """
+    nums: list[int] = []
+    for part in spec.split(","):
+        start, _, end = part.partition("-")
+        nums += range(int(start), int(end or start) + 1)
+    return nums
+
+
+def input_paths(
+    pairs: Iterable[tuple[int, int]],
+    root: Path = ROOT_DIR,
+    layout: str = DEFAULT_LAYOUT,
+) -> dict[tuple[int, int], Path]:
+    """
+    Map (year, day) pairs to their `input.txt` paths
+
+    Args:
+        pairs  (Iterable[tuple[int, int]]): (year, day) pairs
+        root   (pathlib.Path)             : Directory the layout is relative to
+        layout (str)                      : Directory of each input, formatted
+                                            with `year` and `day`
+
+    Returns:
+        (dict[tuple[int, int], Path]): (year, day)-path mapping
+    """
+    paths: dict[tuple[int, int], Path] = {}
+    seen: dict[Path, tuple[int, int]] = {}
+    for year, day in pairs:
+        path = root / layout.format(year=year, day=day) / DATA_FILENAME
+        if (other := seen.setdefault(path, (year, day))) != (year, day):
+            raise ValueError(f"{other} and {(year, day)} both map to {path}")
+        paths[(year, day)] = path
+    return paths
+
+
+def get_inputs(
+    paths: dict[tuple[int, int], Path],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    min_interval: float = DEFAULT_MIN_INTERVAL,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    errors: Optional[dict[tuple[int, int], Exception]] = None,
+) -> dict[tuple[int, int], Status]:
+    """
+    Download all missing inputs concurrently
+
+    Inputs that already exist are skipped, and so are puzzles that are not
+      open yet. Each file is written atomically, so an interrupted run never
+      leaves a truncated `input.txt` behind to be skipped next time. A download
+      that raises is marked as failed, and does not stop the others
+
+    Args:
+        paths        (dict[tuple[int, int], Path]): (year, day)-path mapping
+        max_workers  (int)        : Maximum number of concurrent downloads
+        min_interval (float)      : Minimum seconds between two requests to
+                                    the host
+        retry_policy (RetryPolicy): When and how often to retry each download
+        errors       (dict[tuple[int, int], Exception] | None): Filled with
+                                    the error of each download that raised
+
+    Returns:
+        (dict[tuple[int, int], Status]): What happened to each (year, day)
+    """
+    statuses: dict[tuple[int, int], Status] = {}
+    now = datetime.now()
+    todo: list[tuple[int, int]] = []
+    for (year, day), path in paths.items():
+        if path.exists():
+            statuses[(year, day)] = "skipped"
+        elif unlock_time(year, day) > now:
+            statuses[(year, day)] = "locked"
+        else:
+            todo.append((year, day))
+    if not todo:
+        return statuses
+
+    # Make sure every worker gets its own pooled connection
+    get_session(min_pool_size=max_workers)
+    rate_limiter = RateLimiter(min_interval)
+
+    def download(year: int, day: int) -> Status:
+        data = fetch_input(
+            year,
+            day,
+            verbose=False,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+        )
+        if data is None:
+            return "failed"
+        write_atomic(paths[(year, day)], data)
+        return "downloaded"
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(todo))) as executor:
+        futures = {pair: executor.submit(download, *pair) for pair in todo}
+        for pair, future in futures.items():
+            try:
+                statuses[pair] = future.result()
+            except Exception as err:
+                statuses[pair] = "failed"
+                if errors is not None:
+                    errors[pair] = err
+    return statuses
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Download many inputs concurrently")
+    parser.add_argument("--years", type=int, nargs="+", default=[2020])
+    parser.add_argument("--days", type=parse_range, default=parse_range("1-25"))
+    parser.add_argument("--root", type=Path, default=ROOT_DIR)
+    parser.add_argument(
+        "--layout",
+        default=None,
+        help=f'input directory per day (default "{DEFAULT_LAYOUT}" for a single'
+        ' year, "{year}/' + DEFAULT_LAYOUT + '" otherwise)',
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS)
+    parser.add_argument("--min-interval", type=float, default=DEFAULT_MIN_INTERVAL)
+    args = parser.parse_args(argv)
+
+    layout = args.layout or (
+        DEFAULT_LAYOUT if len(args.years) == 1 else "{year}/" + DEFAULT_LAYOUT
+    )
+    pairs = [(year, day) for year in args.years for day in args.days]
+    paths = input_paths(pairs, args.root, layout)
+    start = perf_counter()
+    errors: dict[tuple[int, int], Exception] = {}
+    statuses = get_inputs(paths, args.workers, args.min_interval, errors=errors)
+    elapsed = perf_counter() - start
+    for (year, day), status in sorted(statuses.items()):
+        if (err := errors.get((year, day))) is not None:
+            print(f"{year} day {day:2}: {status} ({type(err).__name__}: {err})")
+        else:
+            print(f"{year} day {day:2}: {status}")
+    counts = {
+        s: list(statuses.values()).count(s) for s in sorted(set(statuses.values()))
+    }
+    print(f"{counts} in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Module: Memory-mapped checkpoints of long-running simulations
+
+An engine whose state is a table of unsigned 32-bit integers plus a couple of
+  counters saves them to a memory-mapped file every so often, and a killed run
+  resumes from the last save. The engine plays on its own copy of the table,
+  as writes to a shared mapping would reach the file ahead of the counters
+
+A checkpoint is keyed by a description of the simulation, e.g. its starting
+  state and length, so that a file left over from another simulation is
+  started over rather than resumed
+
+Public Classes:
+    Checkpoint: The state of a simulation, mapped from a file
+    Progress  : Report progress of a simulation, with an ETA
+
+Public Functions:
+    open_checkpoint: Open the checkpoint of a simulation, creating it if needed
+    print_progress : Print progress to stderr
+"""
+
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterator, Optional, Union
+
+# Magic, SHA-256 of the key, table length; then step, state
+_PREFIX = struct.Struct("<8s32sQ")
+_COUNTERS = struct.Struct("<QQ")
+_HEADER_SIZE = _PREFIX.size + _COUNTERS.size
+_MAGIC = b"AOCCKPT1"
+_ITEM_SIZE = 4
+
+# Seconds between saves
+SAVE_INTERVAL = 10.0
+
+# A table of unsigned 32-bit integers
+Table = Union[array, memoryview]
+# Done, total, ETA in seconds if known
+ProgressCallback = Callable[[int, int, Optional[float]], None]
+
+
+class Checkpoint:
+    """
+    The state of a simulation, mapped from a file
+
+    Args:
+        mapped   (mmap.mmap): The mapped file
+        length   (int)      : Number of entries of the table
+        resumed  (bool)     : Whether the file held a checkpoint of this
+                              simulation
+        interval (float)    : Seconds between saves
+
+    Public Attributes:
+        step    (int) : Steps done at the last save
+        state   (int) : Engine-specific state at the last save
+        resumed (bool): Whether the simulation is resumed, rather than started
+                        over
+
+    Public Methods:
+        restore(Table) -> None           : Copy the saved table into a table
+        save(int, int, Table, bool) -> bool: Save the step, state and table,
+                                             if it is time to
+    """
+
+    def __init__(
+        self, mapped: mmap.mmap, length: int, resumed: bool, interval: float
+    ) -> None:
+        self._mapped = mapped
+        view = memoryview(mapped)
+        self._table = view[_HEADER_SIZE : _HEADER_SIZE + length * _ITEM_SIZE].cast("I")
+        self._view = view
+        self.step, self.state = _COUNTERS.unpack_from(mapped, _PREFIX.size)
+        self.resumed = resumed
+        self._interval = interval
+        self._saved_at = perf_counter()
+
+    def restore(self, table: Table) -> None:
+        """
+        Copy the saved table into a table of the same length
+
+        Args:
+            table (Table): The engine's table
+        """
+        memoryview(table)[:] = self._table
+
+    def save(self, step: int, state: int, table: Table, force: bool = False) -> bool:
+        """
+        Save the step, state and table, if the interval has passed since the
+          last save
+
+        Args:
+            step  (int)  : Steps done
+            state (int)  : Engine-specific state
+            table (Table): The engine's table
+            force (bool) : Whether to save even if the interval has not passed
+
+        Returns:
+            (bool): Whether it saved
+        """
+        if not force and perf_counter() - self._saved_at < self._interval:
+            return False
+        # Step 0 starts over, should the run be killed while copying
+        _COUNTERS.pack_into(self._mapped, _PREFIX.size, 0, 0)
+        self._mapped.flush()
+        self._table[:] = memoryview(table)
+        _COUNTERS.pack_into(self._mapped, _PREFIX.size, step, state)
+        self._mapped.flush()
+        self.step = step
+        self.state = state
+        self._saved_at = perf_counter()
+        return True
+
+    def _release(self) -> None:
+        """
+        Release the views, so that the file can be unmapped
+        """
+        self._table.release()
+        self._view.release()
+
+
+@contextmanager
+def open_checkpoint(
+    path: Path, key: str, length: int, interval: float = SAVE_INTERVAL
+) -> Iterator[Checkpoint]:
+    """
+    Open the checkpoint of a simulation, creating it if needed
+
+    A new checkpoint has a zero-filled table, and step and state 0
+
+    Args:
+        path     (Path) : The checkpoint file
+        key      (str)  : Description of the simulation
+        length   (int)  : Number of entries of the table
+        interval (float): Seconds between saves
+
+    Yields:
+        (Checkpoint): The checkpoint, unmapped when the block exits
+    """
+    digest = hashlib.sha256(key.encode()).digest()
+    size = _HEADER_SIZE + length * _ITEM_SIZE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    with path.open("r+b") as fp:
+        resumed = False
+        prefix = fp.read(_PREFIX.size)
+        if len(prefix) == _PREFIX.size and path.stat().st_size == size:
+            resumed = _PREFIX.unpack(prefix) == (_MAGIC, digest, length)
+            resumed = resumed and _COUNTERS.unpack(fp.read(_COUNTERS.size))[0] > 0
+        if not resumed:
+            # Zero-filled, and sparse where the file system allows
+            fp.truncate(0)
+            fp.truncate(size)
+            fp.seek(0)
+            fp.write(_PREFIX.pack(_MAGIC, digest, length))
+            fp.flush()
+        with mmap.mmap(fp.fileno(), size) as mapped:
+            checkpoint = Checkpoint(mapped, length, resumed, interval)
+            try:
+                yield checkpoint
+            finally:
+                checkpoint._release()
+
+
+class Progress:
+    """
+    Report progress of a simulation, with an ETA
+
+    The ETA extrapolates the rate of the steps done since the start of this
+      run, which excludes those done before a resume
+
+    Args:
+        total    (int)                      : Steps of the whole simulation
+        done     (int)                      : Steps already done
+        callback (Optional[ProgressCallback]): Called with the steps done, the
+                                               total and the ETA in seconds
+
+    Public Methods:
+        update(int) -> None: Report the steps done so far
+    """
+
+    def __init__(
+        self, total: int, done: int = 0, callback: Optional[ProgressCallback] = None
+    ) -> None:
+        self._total = total
+        self._first = done
+        self._start = perf_counter()
+        self._callback = callback
+
+    def update(self, done: int) -> None:
+        """
+        Report the steps done so far
+
+        Args:
+            done (int): Steps done
+        """
+        if self._callback is None:
+            return
+        elapsed = perf_counter() - self._start
+        eta: Optional[float] = None
+        if done > self._first and elapsed > 0:
+            eta = (self._total - done) * elapsed / (done - self._first)
+        self._callback(done, self._total, eta)
+
+
+def print_progress(done: int, total: int, eta: Optional[float]) -> None:
+    """
+    Print progress to stderr, as a percentage and an ETA
+
+    Args:
+        done  (int)            : Steps done
+        total (int)            : Steps of the whole simulation
+        eta   (Optional[float]): Seconds left, if known
+    """
+    eta_str = "?" if eta is None else f"{eta:.1f}s"
+    percent = 100 * done / total if total else 100
+    print(f"{done}/{total} ({percent:.1f}%), ETA {eta_str}", file=sys.stderr)
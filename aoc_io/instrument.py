@@ -0,0 +1,248 @@
+"""
+Module: Opt-in instrumentation of solvers
+
+Solvers mark their hot paths with named spans and counters. Nothing is
+  recorded unless a `recording` is active, in which case span times are
+  aggregated by call stack and counters are summed. When none is active, a span
+  costs a global lookup and a no-op context manager, and a counter a global
+  lookup, so hot loops should count in bulk rather than once per iteration
+
+Public Classes:
+    Recorder: Aggregated spans, counters and profiler report of a recording
+
+Public Functions:
+    recording: Record spans and counters, and optionally profile, for a while
+    span     : Time a block of code as a named span
+    spanned  : Decorate a function to time each call as a span
+    count    : Add to a named counter
+
+Public Constants:
+    PROFILERS (tuple[str, ...]): Names of the supported profilers
+"""
+
+import cProfile
+import io
+import pstats
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from time import perf_counter
+from typing import Callable, ContextManager, Iterator, Optional, TypeVar
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+# Number of entries of the cProfile report
+_PROFILE_ENTRIES = 30
+
+_F = TypeVar("_F", bound=Callable)
+
+
+class Recorder:
+    """
+    Aggregated spans, counters and profiler report of a recording
+
+    Public Attributes:
+        spans    (dict[tuple[str, ...], list]): Call stack of span names-
+                                                [calls, total seconds] mapping
+        counters (defaultdict[str, int])      : Counter name-total mapping
+        profile  (Optional[str])              : Text report of the profiler,
+                                                if one was used
+
+    Public Methods:
+        to_dict() -> dict[str, object]: JSON-serializable form of the recording
+        collapsed_stacks() -> list[str]:
+            Self times of the spans, as flamegraph collapsed stacks
+    """
+
+    def __init__(self) -> None:
+        self.spans: dict[tuple[str, ...], list] = {}
+        self.counters: defaultdict[str, int] = defaultdict(int)
+        self.profile: Optional[str] = None
+        self._stack: list[str] = []
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        JSON-serializable form of the recording
+
+        Returns:
+            (dict[str, object]): The recording
+        """
+        return {
+            "spans": [
+                {"stack": list(stack), "calls": calls, "elapsed": elapsed}
+                for stack, (calls, elapsed) in self.spans.items()
+            ],
+            "counters": dict(self.counters),
+            "profile": self.profile,
+        }
+
+    def collapsed_stacks(self) -> list[str]:
+        """
+        Self times of the spans, as collapsed stacks that `flamegraph.pl`,
+          speedscope and inferno read
+
+        The time of a span minus that of the spans nested right inside it is
+          its self time, in whole microseconds
+
+        Returns:
+            (list[str]): Lines of `name;name;name microseconds`
+        """
+        self_times = {stack: elapsed for stack, (_, elapsed) in self.spans.items()}
+        for stack, (_, elapsed) in self.spans.items():
+            if stack[:-1] in self_times:
+                self_times[stack[:-1]] -= elapsed
+        return [
+            f"{';'.join(stack)} {max(round(elapsed * 1e6), 0)}"
+            for stack, elapsed in self_times.items()
+        ]
+
+
+class _Span:
+    """
+    Context manager timing a span of an active recording
+
+    Args:
+        recorder (Recorder): The active recording
+        name     (str)     : Name of the span
+    """
+
+    __slots__ = ("_recorder", "_name", "_start")
+
+    def __init__(self, recorder: Recorder, name: str) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._recorder._stack.append(self._name)
+        self._start = perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = perf_counter() - self._start
+        stack = self._recorder._stack
+        key = tuple(stack)
+        stack.pop()
+        if (entry := self._recorder.spans.get(key)) is None:
+            self._recorder.spans[key] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+
+
+# The active recording, if any
+_recorder: Optional[Recorder] = None
+_NULL_SPAN = nullcontext()
+
+
+def span(name: str) -> ContextManager[None]:
+    """
+    Time a block of code as a named span, if a recording is active
+
+    Args:
+        name (str): Name of the span
+
+    Returns:
+        (ContextManager[None]): The span
+    """
+    if _recorder is None:
+        return _NULL_SPAN
+    return _Span(_recorder, name)
+
+
+def spanned(name: Optional[str] = None) -> Callable[[_F], _F]:
+    """
+    Decorate a function to time each call as a span, if a recording is active
+
+    Args:
+        name (Optional[str]): Name of the span; defaults to the qualified name
+                              of the function
+
+    Returns:
+        (Callable[[_F], _F]): The decorator
+    """
+
+    def decorator(func: _F) -> _F:
+        span_name = func.__qualname__ if name is None else name
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return func(*args, **kwargs)
+            with _Span(_recorder, span_name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def count(name: str, amount: int = 1) -> None:
+    """
+    Add to a named counter, if a recording is active
+
+    Args:
+        name   (str): Name of the counter
+        amount (int): Amount to add
+    """
+    if _recorder is not None:
+        _recorder.counters[name] += amount
+
+
+@contextmanager
+def _profiling(profiler: Optional[str], recorder: Recorder) -> Iterator[None]:
+    """
+    Run a profiler for a while, storing its text report in the recorder
+
+    Args:
+        profiler (Optional[str]): One of `PROFILERS`, or None not to profile
+        recorder (Recorder)     : Where the report is stored
+
+    Raises:
+        ValueError : When the profiler is unknown
+        ImportError: When pyinstrument is not installed
+    """
+    if profiler is None:
+        yield
+    elif profiler == "cprofile":
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            report = io.StringIO()
+            stats = pstats.Stats(profile, stream=report)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(_PROFILE_ENTRIES)
+            recorder.profile = report.getvalue()
+    elif profiler == "pyinstrument":
+        from pyinstrument import Profiler
+
+        with Profiler() as profile:
+            yield
+        recorder.profile = profile.output_text()
+    else:
+        raise ValueError(f"Unknown profiler: {profiler}")
+
+
+@contextmanager
+def recording(root: str, profiler: Optional[str] = None) -> Iterator[Recorder]:
+    """
+    Record spans and counters, and optionally profile, for a while
+
+    Recordings nest; the outer one resumes when the inner one ends
+
+    Args:
+        root     (str)          : Name of the span enclosing the whole recording
+        profiler (Optional[str]): One of `PROFILERS`, or None not to profile
+
+    Yields:
+        (Recorder): The recording, complete once the block exits
+    """
+    global _recorder
+    recorder = Recorder()
+    previous, _recorder = _recorder, recorder
+    try:
+        with _profiling(profiler, recorder), _Span(recorder, root):
+            yield recorder
+    finally:
+        _recorder = previous
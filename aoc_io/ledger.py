@@ -0,0 +1,215 @@
+"""
+Module: Persistent ledger of submitted answers and their verdicts
+
+Answers are keyed by (year, day, level, answer), so re-running a solver that
+  produces an already-judged answer costs no network round trip, and cannot
+  trigger the "You gave an answer too recently" lockout. Levels found to be
+  solved already are recorded on their own, keyed by (year, day, level), and
+  no answer to them is submitted again
+
+Public Classes:
+    AnswerLedger: SQLite-backed store of submitted answers and verdicts
+
+Public Functions:
+    get_ledger: Get the default ledger, stored next to the token
+"""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from time import time
+from typing import Optional, Union
+
+from .aoc_io import Verdict
+
+LEDGER_FILENAME = "answers.sqlite3"
+LEDGER_PATH = Path(__file__).parent / LEDGER_FILENAME
+
+# Verdicts that say something lasting about an answer; "solved" is about the
+#   level, and says nothing about whether the answer was right
+_RECORDED_VERDICTS = ("right", "wrong")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solved_levels (
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    response_text TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (year, day, level)
+);
+CREATE TABLE IF NOT EXISTS answers (
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    answer TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    response_text TEXT NOT NULL,
+    submitted_at REAL NOT NULL,
+    PRIMARY KEY (year, day, level, answer)
+)
+"""
+
+
+class AnswerLedger:
+    """
+    SQLite-backed store of submitted answers and verdicts
+
+    Args:
+        path (pathlib.Path): Database file; created on first use
+
+    Public Attributes:
+        path (pathlib.Path): Database file
+
+    Public Methods:
+        lookup: Get the verdict an answer is known to get, if any
+        record: Record the verdict an answer got
+    """
+
+    def __init__(self, path: Path = LEDGER_PATH) -> None:
+        self.path = path
+
+    def lookup(
+        self, year: int, day: int, level: int, answer: Union[str, int]
+    ) -> Optional[tuple[Verdict, str]]:
+        """
+        Get the verdict an answer is known to get, if any
+
+        Besides answers that were submitted before, an answer is known to be
+          wrong if the right answer for the level is already recorded, or if
+          it lies beyond an earlier wrong answer that was "too high"/"too low".
+          Any other answer to a level recorded as solved gets that verdict
+
+        Args:
+            year   (int)      : The year of AOC
+            day    (1..25)    : The day of AOC
+            level  (1, 2)     : Whether the submission is for part 1 or 2
+            answer (str | int): Answer to be submitted
+
+        Returns:
+            (tuple[Verdict, str] | None): Verdict and its text; `None` if
+                                          nothing is known about the answer
+        """
+        answer = str(answer)
+        with closing(self._connect()) as conn:
+            rows: list[tuple[str, Verdict, str]] = conn.execute(
+                "SELECT answer, verdict, response_text FROM answers"
+                " WHERE year = ? AND day = ? AND level = ?",
+                (year, day, level),
+            ).fetchall()
+            solved: Optional[tuple[str]] = conn.execute(
+                "SELECT response_text FROM solved_levels"
+                " WHERE year = ? AND day = ? AND level = ?",
+                (year, day, level),
+            ).fetchone()
+        # Older ledgers recorded solved levels as verdicts of the answer
+        solved_texts = [text for _, verdict, text in rows if verdict == "solved"]
+        if solved is None and solved_texts:
+            solved = (solved_texts[0],)
+        rows = [row for row in rows if row[1] in _RECORDED_VERDICTS]
+        for known_answer, verdict, response_text in rows:
+            if known_answer == answer:
+                return verdict, f"(cached) {response_text}"
+        if solved is not None:
+            return "solved", f"(cached) {solved[0]}"
+        for known_answer, verdict, _ in rows:
+            if verdict == "right":
+                return (
+                    "refused",
+                    f"Not submitting {answer}: the right answer is {known_answer}",
+                )
+        if not _is_int(answer):
+            return None
+        for known_answer, verdict, response_text in rows:
+            if verdict != "wrong" or not _is_int(known_answer):
+                continue
+            if "too high" in response_text and int(answer) >= int(known_answer):
+                return (
+                    "refused",
+                    f"Not submitting {answer}: {known_answer} was already too high",
+                )
+            if "too low" in response_text and int(answer) <= int(known_answer):
+                return (
+                    "refused",
+                    f"Not submitting {answer}: {known_answer} was already too low",
+                )
+        return None
+
+    def record(
+        self,
+        year: int,
+        day: int,
+        level: int,
+        answer: Union[str, int],
+        verdict: Verdict,
+        response_text: str,
+    ) -> None:
+        """
+        Record the verdict an answer got
+
+        A "solved" verdict is recorded for the level rather than the answer;
+          other verdicts that say nothing about the answer itself (e.g. "You
+          gave an answer too recently") are not recorded
+
+        Args:
+            year          (int)      : The year of AOC
+            day           (1..25)    : The day of AOC
+            level         (1, 2)     : Whether the submission is for part 1 or 2
+            answer        (str | int): The submitted answer
+            verdict       (Verdict)  : Kind of verdict
+            response_text (str)      : Text of the verdict
+        """
+        if verdict == "solved":
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO solved_levels VALUES (?, ?, ?, ?, ?)",
+                    (year, day, level, response_text, time()),
+                )
+            return
+        if verdict not in _RECORDED_VERDICTS:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (year, day, level, str(answer), verdict, response_text, time()),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database, creating the tables if needed
+
+        Returns:
+            (sqlite3.Connection): Open connection
+        """
+        conn = sqlite3.connect(self.path)
+        conn.executescript(_SCHEMA)
+        return conn
+
+
+def _is_int(answer: str) -> bool:
+    """
+    Check if an answer is an integer
+
+    Args:
+        answer (str): The answer
+
+    Returns:
+        (bool): Whether `int(answer)` works
+    """
+    return answer.lstrip("-").isdigit()
+
+
+_ledger: Optional[AnswerLedger] = None
+
+
+def get_ledger() -> AnswerLedger:
+    """
+    Get the default ledger, stored next to the token
+
+    Returns:
+        (AnswerLedger): The default ledger
+    """
+    global _ledger
+    if _ledger is None:
+        _ledger = AnswerLedger()
+    return _ledger
@@ -0,0 +1,223 @@
+"""
+Module: Sparse cellular automaton engine
+
+Live cells are a set of ints, each packing a coordinate: a field per axis,
+  offset so that it is never negative. Moving a cell by an offset is then a
+  single addition of the packed offset, with no tuple or complex number
+  allocated per neighbor
+
+Each generation makes one pass over the live cells, adding 1 to the neighbor
+  count of each of their neighbors in a `Counter`. Cells with no live neighbor
+  never enter the count, so the rule decides the fate of only the cells that
+  got one
+
+A field that overflows would silently carry into the next axis, so the live
+  cells are kept clear of the edges of their fields: when they may have
+  spread too far, their actual extent is measured, and they are repacked with
+  twice the bits per axis if they take up more than half of it
+
+Public Classes:
+    Packing   : Pack N-dimensional integer coordinates into single ints
+    SparseLife: Life-like cellular automaton on a set of packed cells
+"""
+
+from collections import Counter
+from itertools import chain
+from typing import Iterable, Optional, Sequence
+
+from aoc_io.instrument import count
+
+# Packed coordinates are kept within two of CPython's 30-bit int digits, which
+#   keeps adding and hashing them cheap
+_WORD_BITS = 60
+
+
+class Packing:
+    """
+    Pack N-dimensional integer coordinates into single ints
+
+    Packed offsets may be added to packed coordinates as long as every axis of
+      the result stays in range
+
+    Args:
+        dimensions (int)          : Number of dimensions
+        bits       (Optional[int]): Bits per axis; coordinates must lie within
+                                    +/- 2 ** (bits - 1). Defaults to an equal
+                                    share of 60 bits, e.g. 15 bits in 4D
+
+    Public Instance Attributes:
+        limit (int): Largest absolute value that fits in every axis
+
+    Public Instance Methods:
+        pack(Iterable[int]) -> int       : Pack a coordinate
+        unpack(int) -> tuple[int, ...]   : Unpack a coordinate
+        offset(Iterable[int]) -> int     : Pack an offset between coordinates
+        widened() -> Packing             : The same packing, with twice the
+                                           bits per axis
+    """
+
+    def __init__(self, dimensions: int, bits: Optional[int] = None) -> None:
+        if bits is None:
+            bits = _WORD_BITS // dimensions
+        self._dimensions = dimensions
+        self._bits = bits
+        self._mask = (1 << bits) - 1
+        self._bias = 1 << (bits - 1)
+        self.limit = self._bias - 1
+        # The bias added to every axis at once
+        self._packed_bias = sum(self._bias << (bits * i) for i in range(dimensions))
+
+    def pack(self, coord: Iterable[int]) -> int:
+        """
+        Pack a coordinate
+
+        Args:
+            coord (Iterable[int]): The coordinate, one int per axis
+
+        Returns:
+            (int): The packed coordinate
+
+        Raises:
+            ValueError: When an axis is out of range
+        """
+        coord = tuple(coord)
+        if any(not -self._bias <= c < self._bias for c in coord):
+            raise ValueError(f"{coord} does not fit in {self._bits} bits per axis")
+        return self.offset(coord) + self._packed_bias
+
+    def unpack(self, packed: int) -> tuple[int, ...]:
+        """
+        Unpack a coordinate
+
+        Args:
+            packed (int): The packed coordinate
+
+        Returns:
+            (tuple[int, ...]): The coordinate
+        """
+        return tuple(
+            ((packed >> (self._bits * i)) & self._mask) - self._bias
+            for i in range(self._dimensions)
+        )
+
+    def offset(self, delta: Iterable[int]) -> int:
+        """
+        Pack an offset between coordinates; it may be negative
+
+        Args:
+            delta (Iterable[int]): The offset, one int per axis
+
+        Returns:
+            (int): The packed offset
+        """
+        return sum(d << (self._bits * i) for i, d in enumerate(delta))
+
+    def widened(self) -> "Packing":
+        """
+        The same packing, with twice the bits per axis
+
+        Returns:
+            (Packing): The wider packing
+        """
+        return Packing(self._dimensions, 2 * self._bits)
+
+
+class SparseLife:
+    """
+    Life-like cellular automaton on a set of packed cells
+    A dead cell with a neighbor count in `birth` comes alive; a live cell with
+      one in `survival` stays alive
+
+    Args:
+        packing   (Packing)               : How to pack the cells to begin
+                                            with; widened as they spread
+        live      (Iterable[Sequence[int]]): Coordinates of the live cells
+        neighbors (Iterable[Sequence[int]]): Offsets of the neighbors of a cell
+        birth     (Iterable[int])         : Neighbor counts that bring a dead
+                                            cell alive
+        survival  (Iterable[int])         : Neighbor counts that keep a live
+                                            cell alive
+
+    Public Instance Attributes:
+        packing (Packing) : How the live cells are packed
+        live    (set[int]): Packed live cells
+
+    Public Instance Methods:
+        propagate() -> None                : Construct the next generation
+        cells() -> set[tuple[int, ...]]    : Coordinates of the live cells
+
+    Raises:
+        ValueError: When dead cells with no live neighbors would come alive,
+                    all infinitely many of them
+    """
+
+    def __init__(
+        self,
+        packing: Packing,
+        live: Iterable[Sequence[int]],
+        neighbors: Iterable[Sequence[int]],
+        birth: Iterable[int],
+        survival: Iterable[int],
+    ) -> None:
+        self._birth = frozenset(birth)
+        self._survival = frozenset(survival)
+        if 0 in self._birth:
+            raise ValueError("Cells with no live neighbors cannot come alive")
+        self._deltas = [tuple(delta) for delta in neighbors]
+        # How far a generation may spread the live cells along any axis
+        self._reach = max((abs(d) for delta in self._deltas for d in delta), default=0)
+        self.packing = packing
+        self._pack([tuple(cell) for cell in live])
+
+    def cells(self) -> set[tuple[int, ...]]:
+        """
+        Coordinates of the live cells
+
+        Returns:
+            (set[tuple[int, ...]]): The coordinates
+        """
+        return {self.packing.unpack(cell) for cell in self.live}
+
+    def _pack(self, cells: list[tuple[int, ...]]) -> None:
+        """
+        Pack cells and the neighbor offsets, widening the packing until the
+          cells take up at most half of it
+
+        Args:
+            cells (list[tuple[int, ...]]): Coordinates of the live cells
+        """
+        # Largest absolute value of any axis of any live cell, from here on an
+        #   upper bound grown by `_reach` each generation
+        self._extent = max((abs(c) for cell in cells for c in cell), default=0)
+        while 2 * (self._extent + self._reach) > self.packing.limit:
+            self.packing = self.packing.widened()
+        count("cells packed", len(cells))
+        self.live = {self.packing.pack(cell) for cell in cells}
+        self._neighbors = tuple(self.packing.offset(delta) for delta in self._deltas)
+
+    def propagate(self) -> None:
+        """
+        Construct the next generation
+        """
+        if self._extent + self._reach > self.packing.limit:
+            # The neighbors of the live cells may overflow; measure how far
+            #   the cells actually spread, widening if they are near the edges
+            self._pack(list(self.cells()))
+        live = self.live
+        counts = Counter(
+            chain.from_iterable(
+                [cell + offset for offset in self._neighbors] for cell in live
+            )
+        )
+        count("cells evaluated", len(counts))
+        birth = self._birth
+        survival = self._survival
+        new_live = {
+            cell
+            for cell, neighbors in counts.items()
+            if (neighbors in survival if cell in live else neighbors in birth)
+        }
+        if 0 in survival:
+            new_live |= live - counts.keys()
+        self.live = new_live
+        self._extent += self._reach
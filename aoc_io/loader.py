@@ -0,0 +1,104 @@
+"""
+Module: Memory-mapped puzzle input loader
+
+Inputs are mapped into memory instead of being read into one large string.
+  Lines, records and numbers are then decoded one at a time, as they are used,
+  so huge generated inputs stream through in constant memory
+
+Public Functions:
+    map_input   : Map an input file into memory
+    iter_lines  : Iterate through the non-empty lines of an input
+    iter_records: Iterate through the blank-line-separated records of an input
+    read_ints   : Parse all the integers of an input into an array
+"""
+
+import mmap
+import re
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Signed decimal integers
+_INT_RE = re.compile(rb"-?\d+")
+
+
+@contextmanager
+def map_input(path: Path) -> Iterator[Optional[mmap.mmap]]:
+    """
+    Map an input file into memory, read-only
+
+    Args:
+        path (Path): Input file path
+
+    Yields:
+        (mmap.mmap | None): The mapped file; `None` if the file is empty, as
+                              empty files cannot be mapped
+    """
+    with path.open("rb") as fp:
+        if not path.stat().st_size:
+            yield None
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def iter_lines(path: Path) -> Iterator[str]:
+    """
+    Iterate through the non-empty lines of an input
+
+    Args:
+        path (Path): Input file path
+
+    Yields:
+        (str): Each non-empty line, stripped
+    """
+    with map_input(path) as mapped:
+        if mapped is None:
+            return
+        for raw_line in iter(mapped.readline, b""):
+            if line := raw_line.strip():
+                yield line.decode()
+
+
+def iter_records(path: Path) -> Iterator[list[str]]:
+    """
+    Iterate through the blank-line-separated records of an input
+
+    Args:
+        path (Path): Input file path
+
+    Yields:
+        (list[str]): Stripped lines of each record
+    """
+    record: list[str] = []
+    with map_input(path) as mapped:
+        if mapped is None:
+            return
+        for raw_line in iter(mapped.readline, b""):
+            if line := raw_line.strip():
+                record.append(line.decode())
+            elif record:
+                yield record
+                record = []
+    if record:
+        yield record
+
+
+def read_ints(path: Path) -> array:
+    """
+    Parse all the integers of an input into an array, whatever separates them
+
+    Args:
+        path (Path): Input file path
+
+    Returns:
+        (array): The integers, as signed 64-bit numbers
+
+    Raises:
+        OverflowError: When a number does not fit in 64 bits
+    """
+    with map_input(path) as mapped:
+        if mapped is None:
+            return array("q")
+        return array("q", (int(match[0]) for match in _INT_RE.finditer(mapped)))
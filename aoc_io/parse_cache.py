@@ -0,0 +1,114 @@
+"""
+Module: On-disk cache of parsed puzzle inputs
+
+A parser decorated with `cached_parse` pickles what it returns, keyed by the
+  hash of the input's content, the parser's name and a parser version. Parsing
+  the same input again, from the other level or from a later run, unpickles the
+  stored structure instead. Bump the version whenever a parser's output changes
+
+Public Functions:
+    cached_parse: Decorate a parser to cache its results on disk
+    clear_cache : Delete all cached results
+"""
+
+import hashlib
+import os
+import pickle
+from functools import wraps
+from pathlib import Path
+from typing import Callable, TypeVar
+
+CACHE_DIRNAME = ".parse_cache"
+CACHE_DIR = Path(__file__).parent / CACHE_DIRNAME
+
+_T = TypeVar("_T")
+
+
+def _cache_path(func: Callable, version: int, path: Path, cache_dir: Path) -> Path:
+    """
+    Get the cache file of a parser and an input
+
+    The module name is part of the key, because pickled classes are looked up
+      by module: a script run directly is `__main__`, not its imported name
+
+    Args:
+        func      (Callable): The parser
+        version   (int)     : Parser version
+        path      (Path)    : Input file path
+        cache_dir (Path)    : Cache directory
+
+    Returns:
+        (Path): Cache file path
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{func.__module__}:{func.__qualname__}:{version}\0".encode())
+    with path.open("rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            digest.update(chunk)
+    return cache_dir / f"{digest.hexdigest()}.pickle"
+
+
+def cached_parse(
+    version: int, cache_dir: Path = CACHE_DIR
+) -> Callable[[Callable[[Path], _T]], Callable[[Path], _T]]:
+    """
+    Decorate a parser, taking only an input path, to cache its results on disk
+
+    Each call returns a fresh copy, so solvers may mutate what they are given.
+      Unreadable cache files are treated as misses and overwritten
+
+    Args:
+        version   (int) : Parser version, to be bumped when the output changes
+        cache_dir (Path): Cache directory
+
+    Returns:
+        (Callable[[Callable[[Path], _T]], Callable[[Path], _T]]): The decorator
+    """
+
+    def decorator(func: Callable[[Path], _T]) -> Callable[[Path], _T]:
+        @wraps(func)
+        def wrapper(path: Path) -> _T:
+            cache_path = _cache_path(func, version, path, cache_dir)
+            try:
+                with cache_path.open("rb") as fp:
+                    return pickle.load(fp)
+            except Exception:
+                # Missing, truncated, or naming a class that has since moved;
+                #   parse again and overwrite
+                pass
+            parsed = func(path)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so that parallel solvers never read half a file
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                with tmp_path.open("wb") as fp:
+                    pickle.dump(parsed, fp, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                # Classes of a script loaded under an unimportable name cannot
+                #   be pickled; such runs just go uncached
+                tmp_path.unlink(missing_ok=True)
+                return parsed
+            os.replace(tmp_path, cache_path)
+            return parsed
+
+        return wrapper
+
+    return decorator
+
+
+def clear_cache(cache_dir: Path = CACHE_DIR) -> int:
+    """
+    Delete all cached results
+
+    Args:
+        cache_dir (Path): Cache directory
+
+    Returns:
+        (int): Number of files deleted
+    """
+    count = 0
+    # Leftover temporary files of interrupted writes go too
+    for cache_path in cache_dir.glob("*.*"):
+        cache_path.unlink(missing_ok=True)
+        count += 1
+    return count
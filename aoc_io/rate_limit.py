@@ -0,0 +1,47 @@
+"""
+Module: Per-host request rate limiting
+
+Public Classes:
+    RateLimiter: Thread-safe minimum interval between requests to each host
+"""
+
+from threading import Lock
+from time import monotonic, sleep
+
+
+class RateLimiter:
+    """
+    Thread-safe minimum interval between requests to each host
+
+    Each call to `wait` reserves the next free slot for the host and sleeps
+      until it arrives, so concurrent callers are spaced out evenly instead of
+      bursting
+
+    Args:
+        min_interval (float): Minimum seconds between two requests to a host
+
+    Public Attributes:
+        min_interval (float): Minimum seconds between two requests to a host
+
+    Public Methods:
+        wait: Block until a request to the host is allowed
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._next_slot: dict[str, float] = {}
+        self._lock = Lock()
+
+    def wait(self, host: str) -> None:
+        """
+        Block until a request to the host is allowed
+
+        Args:
+            host (str): Host the request is going to
+        """
+        with self._lock:
+            now = monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            sleep(slot - now)
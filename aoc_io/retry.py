@@ -0,0 +1,163 @@
+"""
+Module: Retry policy shared by the AOC clients
+
+Public Classes:
+    RetryPolicy: Exponential backoff with jitter, an attempt cap and a deadline
+    RetryBudget: Attempts and time left for one operation under a policy
+
+Public Constants:
+    DEFAULT_RETRY_POLICY: Policy used when none is given
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from time import monotonic
+from typing import Optional
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter, an attempt cap and a deadline
+
+    The n-th retry waits `base_delay * 2**(n-1)`, capped at `max_delay`, with
+      up to `jitter` of it shaved off at random so that many clients backing
+      off together do not retry in lockstep. A `Retry-After` from the server
+      is honored as a lower bound
+
+    Args:
+        max_attempts (int)         : Total number of attempts, including the
+                                     first one
+        base_delay   (float)       : Seconds to wait before the first retry
+        max_delay    (float)       : Upper bound of a single wait
+        deadline     (float | None): Seconds the whole operation may take;
+                                     `None` for no limit
+        jitter       (float)       : Fraction (0..1) of each wait that is
+                                     randomized
+
+    Public Methods:
+        start: Start the budget for a new operation
+        delay: Backoff before a given retry, without `Retry-After`
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        deadline: Optional[float] = 120.0,
+        jitter: float = 1.0,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"{max_attempts=} must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"{jitter=} is not in range 0..1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.jitter = jitter
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, "
+            f"base_delay={self.base_delay}, max_delay={self.max_delay}, "
+            f"deadline={self.deadline}, jitter={self.jitter})"
+        )
+
+    def start(self) -> RetryBudget:
+        """
+        Start the budget for a new operation
+
+        Returns:
+            (RetryBudget): Fresh budget, with the deadline counting from now
+        """
+        return RetryBudget(self)
+
+    def delay(self, retry: int) -> float:
+        """
+        Backoff before a given retry, without `Retry-After`
+
+        Args:
+            retry (int): 1 for the first retry, 2 for the second, ...
+
+        Returns:
+            (float): Seconds to wait
+        """
+        import random
+
+        delay = min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        return delay * (1 - self.jitter * random.random())
+
+
+class RetryBudget:
+    """
+    Attempts and time left for one operation under a policy
+
+    Args:
+        policy (RetryPolicy): The policy to follow
+
+    Public Attributes:
+        attempts (int): Number of attempts made so far
+
+    Public Methods:
+        next_delay: Record a failed attempt and get the wait before the next
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._policy = policy
+        self._started = monotonic()
+        self.attempts = 0
+
+    def next_delay(self, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Record a failed attempt and get the wait before the next
+
+        Args:
+            retry_after (str | None): `Retry-After` header of the failed
+                                      response, if any
+
+        Returns:
+            (float | None): Seconds to wait; `None` if the budget is exhausted
+        """
+        self.attempts += 1
+        policy = self._policy
+        if self.attempts >= policy.max_attempts:
+            return None
+        delay = policy.delay(self.attempts)
+        if (server_delay := _parse_retry_after(retry_after)) is not None:
+            delay = max(delay, server_delay)
+        if policy.deadline is not None:
+            remaining = policy.deadline - (monotonic() - self._started)
+            if delay >= remaining:
+                return None
+        return delay
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header, given either in seconds or as an HTTP date
+
+    Args:
+        value (str | None): The header value
+
+    Returns:
+        (float | None): Seconds to wait; `None` if absent or malformed
+    """
+    from email.utils import parsedate_to_datetime
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_time = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_time.tzinfo is None:
+        retry_time = retry_time.replace(tzinfo=timezone.utc)
+    return max((retry_time - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
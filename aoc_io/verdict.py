@@ -0,0 +1,81 @@
+"""
+Module: Streaming extraction of the verdict from an answer page
+
+The verdict is the text of the first `<p>` inside the first `<article>`. The
+  page is fed to an `html.parser.HTMLParser` chunk by chunk, and parsing stops
+  as soon as that paragraph closes; no tree is ever built
+
+Public Functions:
+    stream_verdict: Extract the verdict text from chunks of an answer page
+"""
+
+import codecs
+from html.parser import HTMLParser
+from typing import Iterable, Optional
+
+
+class _VerdictParser(HTMLParser):
+    """
+    HTML parser collecting the text of the first `<p>` in an `<article>`
+
+    Public Attributes:
+        done (bool): Whether the paragraph has been closed
+        text (str) : Text collected so far
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self._article_depth = 0
+        self._in_paragraph = False
+        self._parts: list[str] = []
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def handle_starttag(self, tag: str, attrs: object) -> None:
+        if tag == "article":
+            self._article_depth += 1
+        elif tag == "p" and self._article_depth and not self.done:
+            self._in_paragraph = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "article":
+            self._article_depth = max(self._article_depth - 1, 0)
+        if self._in_paragraph and tag in {"p", "article"}:
+            self._in_paragraph = False
+            self.done = True
+
+    def handle_data(self, data: str) -> None:
+        if self._in_paragraph:
+            self._parts.append(data)
+
+
+def stream_verdict(chunks: Iterable[bytes]) -> Optional[str]:
+    """
+    Extract the verdict text from chunks of an answer page
+
+    Chunks after the one closing the paragraph are not parsed, but they are
+      still consumed, so a streamed HTTP response is read to the end and its
+      connection can go back to the pool
+
+    Args:
+        chunks (Iterable[bytes]): The page, in UTF-8, in any chunking
+
+    Returns:
+        (str | None): Text of the verdict paragraph; `None` if there is none
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parser = _VerdictParser()
+    chunks_iter = iter(chunks)
+    for chunk in chunks_iter:
+        parser.feed(decoder.decode(chunk))
+        if parser.done:
+            # Drain the rest without parsing it
+            for _ in chunks_iter:
+                pass
+            return parser.text
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.text if parser.done else None
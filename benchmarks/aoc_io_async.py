@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: the asyncio client against a local stub server
+
+Runs, on a single event loop, a download and a submission for 25 days of
+  each year, with every puzzle pretending to open a couple of seconds from
+  now, and checks the files and verdicts. Compares the wall time against doing
+  the same with the blocking client, one day after another
+
+Usage:
+    python -m benchmarks.aoc_io_async [--years N] [--latency-ms MS]
+"""
+
+import argparse
+import asyncio
+import io
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from unittest import mock
+
+from aoc_io import aoc_io
+from aoc_io.async_aoc_io import async_get_input, async_session, async_submit_output
+from benchmarks.stub_server import run_stub_server, stub_input
+
+
+async def _run_async(pairs: list[tuple[int, int]], workdir: Path) -> list[str]:
+    """
+    Download and submit every (year, day) concurrently
+
+    Args:
+        pairs   (list[tuple[int, int]]): (year, day) pairs
+        workdir (Path)                 : Directory to download the inputs to
+
+    Returns:
+        (list[str]): Verdicts, in order of `pairs`
+    """
+
+    async def one(session: object, year: int, day: int) -> str:
+        await async_get_input(year, day, workdir / f"{year}_{day}.txt", session)
+        return await async_submit_output(year, day, 1, "42", session, use_ledger=False)
+
+    async with async_session(pool_size=len(pairs)) as session:
+        return await asyncio.gather(*(one(session, year, day) for year, day in pairs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--years", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--wait", type=float, default=2.0, help="seconds to unlock")
+    args = parser.parse_args()
+
+    pairs = [
+        (year, day)
+        for year in range(2020 - args.years + 1, 2021)
+        for day in range(1, 26)
+    ]
+    unlock = datetime.now() + timedelta(seconds=args.wait)
+    with run_stub_server(
+        latency=args.latency_ms / 1000, answer="42"
+    ) as server, mock.patch.object(aoc_io, "BASE_URL", server.url), mock.patch.object(
+        aoc_io, "get_cookies", lambda: {"session": "benchmark"}
+    ), mock.patch.object(
+        aoc_io, "unlock_time", lambda year, day: unlock
+    ), tempfile.TemporaryDirectory() as tmp, redirect_stdout(
+        io.StringIO()
+    ):
+        workdir = Path(tmp)
+        start = perf_counter()
+        verdicts = asyncio.run(_run_async(pairs, workdir))
+        async_elapsed = perf_counter() - start
+        for (year, day), verdict in zip(pairs, verdicts):
+            assert (workdir / f"{year}_{day}.txt").read_bytes() == stub_input(year, day)
+            assert "That's the right answer" in verdict, verdict
+
+        # The blocking client waits for the puzzle once, then goes day by day
+        start = perf_counter()
+        for year, day in pairs:
+            aoc_io.get_input(year, day, workdir / f"{year}_{day}.txt")
+            aoc_io.submit_output(year, day, 1, "42", use_ledger=False)
+        sync_elapsed = perf_counter() - start
+
+    print(f"{len(pairs)} days, {args.latency_ms:g} ms per request, {args.wait:g}s wait")
+    print(f"  blocking, one by one: {sync_elapsed:7.2f}s")
+    print(f"  asyncio, one loop   : {async_elapsed:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one-after-another downloads vs `aoc_io.bulk.get_inputs`
+
+Fetches 25 days for each year from a local stub server with a fixed
+  per-request latency, first sequentially with `fetch_input` and then
+  concurrently with `get_inputs`, and compares the wall time against the
+  latency of a single request
+
+Usage:
+    python -m benchmarks.aoc_io_bulk [--years N] [--latency-ms MS]
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from unittest import mock
+
+from aoc_io import aoc_io
+from aoc_io.bulk import get_inputs, input_paths
+from benchmarks.stub_server import run_stub_server, stub_input
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--years", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--workers", type=int, default=100)
+    parser.add_argument("--min-interval", type=float, default=0.0)
+    args = parser.parse_args()
+
+    pairs = [
+        (year, day)
+        for year in range(2020 - args.years + 1, 2021)
+        for day in range(1, 26)
+    ]
+    with run_stub_server(latency=args.latency_ms / 1000) as server, mock.patch.object(
+        aoc_io, "BASE_URL", server.url
+    ), mock.patch.object(
+        aoc_io, "get_cookies", lambda: {"session": "benchmark"}
+    ), tempfile.TemporaryDirectory() as tmp:
+        aoc_io.configure_session()
+        start = perf_counter()
+        for year, day in pairs:
+            aoc_io.fetch_input(year, day, verbose=False)
+        sequential = perf_counter() - start
+
+        paths = input_paths(pairs, Path(tmp), "{year}/Day_{day:02}")
+        start = perf_counter()
+        statuses = get_inputs(paths, args.workers, args.min_interval)
+        concurrent = perf_counter() - start
+        assert set(statuses.values()) == {"downloaded"}, statuses
+        for (year, day), path in paths.items():
+            assert path.read_bytes() == stub_input(year, day)
+
+        start = perf_counter()
+        statuses = get_inputs(paths, args.workers, args.min_interval)
+        rerun = perf_counter() - start
+        assert set(statuses.values()) == {"skipped"}, statuses
+
+    print(f"{len(pairs)} inputs, {args.latency_ms:g} ms per request")
+    print(f"  sequential: {sequential:7.2f}s")
+    print(f"  concurrent: {concurrent:7.2f}s ({args.workers} workers)")
+    print(f"  re-run    : {rerun:7.2f}s (all skipped)")
+
+
+if __name__ == "__main__":
+    main()
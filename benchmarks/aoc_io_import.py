@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: what a solver pays at cold start for importing `aoc_io.aoc_io`
+
+Runs `python -X importtime` in fresh interpreters and reports the median
+  cumulative import time of `aoc_io.aoc_io` alone, and of the network stack
+  it now defers until first use. Also checks that importing it neither reads
+  the token nor pulls in `requests`, `bs4` or `colorama`
+
+Usage:
+    python -m benchmarks.aoc_io_import [-n RUNS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+_DEFERRED = ("requests", "bs4", "colorama")
+
+
+def _import_time(code: str, module: str) -> int:
+    """
+    Cumulative import time of a module in a fresh interpreter
+
+    Args:
+        code   (str): Code to run with `-X importtime`
+        module (str): Top-level module to report
+
+    Returns:
+        (int): Cumulative import time, in microseconds
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            total += int(cumulative)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", "--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    check = (
+        "import sys, aoc_io.aoc_io; "
+        f"print(*[m for m in {_DEFERRED!r} if m in sys.modules])"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", check],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    if loaded:
+        raise SystemExit(f"importing aoc_io.aoc_io loads {loaded}")
+
+    results = {
+        "aoc_io.aoc_io": statistics.median(
+            _import_time("import aoc_io.aoc_io", "aoc_io.aoc_io")
+            for _ in range(args.runs)
+        ),
+    }
+    for module in _DEFERRED:
+        results[f"{module} (deferred)"] = statistics.median(
+            _import_time(f"import {module}", module) for _ in range(args.runs)
+        )
+    print(f"median cumulative import time over {args.runs} cold starts")
+    for name, microseconds in results.items():
+        print(f"  {name:22}: {microseconds / 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
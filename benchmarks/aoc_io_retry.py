@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: retries of the blocking and asyncio clients
+
+Runs a download and a submission with each client against a local stub server
+  that answers its first requests with 503 and a `Retry-After`, and against a
+  port nothing listens on. Checks that the first succeed once the server
+  recovers, after waiting as long as it asked, and that the second back off
+  and give up after every attempt of the policy instead of failing at once
+
+Usage:
+    python -m benchmarks.aoc_io_retry [--failures N] [--retry-after SECONDS]
+"""
+
+import argparse
+import asyncio
+import io
+import socket
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from unittest import mock
+
+from aoc_io import aoc_io
+from aoc_io.async_aoc_io import async_get_input, async_submit_output
+from aoc_io.retry import RetryPolicy
+from benchmarks.stub_server import run_stub_server, stub_input
+
+_YEAR, _DAY = 2020, 1
+
+
+def _closed_url() -> str:
+    """
+    Find a local port nothing listens on
+
+    Returns:
+        (str): Base URL on that port
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        host, port = sock.getsockname()
+    return f"http://{host}:{port}"
+
+
+def _run_blocking(policy: RetryPolicy, input_path: Path) -> str:
+    """
+    Download and submit with the blocking client
+
+    Args:
+        policy     (RetryPolicy): Retry policy to use
+        input_path (Path)       : Path to download the input to
+
+    Returns:
+        (str): Verdict of the submission
+    """
+    aoc_io.configure_session()
+    aoc_io.get_input(_YEAR, _DAY, input_path, retry_policy=policy)
+    return aoc_io.submit_output(
+        _YEAR, _DAY, 1, "42", retry_policy=policy, use_ledger=False
+    )
+
+
+def _run_async(policy: RetryPolicy, input_path: Path) -> str:
+    """
+    Download and submit with the asyncio client
+
+    Args:
+        policy     (RetryPolicy): Retry policy to use
+        input_path (Path)       : Path to download the input to
+
+    Returns:
+        (str): Verdict of the submission
+    """
+
+    async def run() -> str:
+        await async_get_input(_YEAR, _DAY, input_path, retry_policy=policy)
+        return await async_submit_output(
+            _YEAR, _DAY, 1, "42", retry_policy=policy, use_ledger=False
+        )
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--failures", type=int, default=2)
+    parser.add_argument("--retry-after", type=int, default=1, help="seconds")
+    parser.add_argument("--attempts", type=int, default=4)
+    args = parser.parse_args()
+
+    policy = RetryPolicy(
+        max_attempts=args.attempts, base_delay=0.01, max_delay=0.1, deadline=None
+    )
+    clients = {"blocking": _run_blocking, "asyncio": _run_async}
+    print(f"{'client':8} {'server':7} {'requests':>8} {'seconds':>8}  verdict")
+    with mock.patch.object(
+        aoc_io, "get_cookies", lambda: {"session": "benchmark"}
+    ), mock.patch.object(
+        aoc_io, "unlock_time", lambda year, day: datetime.min
+    ), tempfile.TemporaryDirectory() as tmp:
+        for name, run in clients.items():
+            input_path = Path(tmp) / f"{name}.txt"
+
+            # Every try of the download is turned away, the submission goes
+            #   through at once
+            with run_stub_server(
+                failures=args.failures, retry_after=str(args.retry_after)
+            ) as server, mock.patch.object(
+                aoc_io, "BASE_URL", server.url
+            ), redirect_stdout(
+                io.StringIO()
+            ):
+                start = perf_counter()
+                verdict = run(policy, input_path)
+                elapsed = perf_counter() - start
+            assert input_path.read_bytes() == stub_input(_YEAR, _DAY)
+            assert "That's the right answer" in verdict, verdict
+            assert server.request_count == args.failures + 2, server.request_count
+            assert elapsed >= args.failures * args.retry_after, elapsed
+            print(
+                f"{name:8} {'503':7} {server.request_count:>8} {elapsed:8.2f}"
+                f"  {verdict.splitlines()[-1]}"
+            )
+
+            input_path.unlink()
+            output = io.StringIO()
+            with mock.patch.object(
+                aoc_io, "BASE_URL", _closed_url()
+            ), redirect_stdout(output):
+                start = perf_counter()
+                verdict = run(policy, input_path)
+                elapsed = perf_counter() - start
+            assert not input_path.exists()
+            assert f"failed after {args.attempts} tries" in verdict, verdict
+            assert "connection failed" in verdict, verdict
+            tries = output.getvalue().count("ailed: ")
+            assert tries == args.attempts, output.getvalue()
+            print(f"{name:8} {'refused':7} {'-':>8} {elapsed:8.2f}  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
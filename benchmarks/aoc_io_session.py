@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fresh connection per request vs the pooled keep-alive session
+
+Runs `get_input` and `submit_output` against a local stub server, once the old
+  way (a bare `requests.get`/`requests.post` per call) and once through the
+  shared session, and reports the per-request latency saved
+
+Usage:
+    python -m benchmarks.aoc_io_session [-n REQUESTS] [--handshake-ms MS]
+"""
+
+import argparse
+import io
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from time import perf_counter
+from unittest import mock
+
+import requests
+
+from aoc_io import aoc_io
+from benchmarks.stub_server import run_stub_server
+
+
+def _time_calls(n: int, pooled: bool, workdir: Path) -> float:
+    """
+    Time `n` downloads plus `n` submissions
+
+    Args:
+        n       (int) : Number of days to download and submit
+        pooled  (bool): Whether to go through the shared session
+        workdir (Path): Directory to download the inputs to
+
+    Returns:
+        (float): Mean seconds per request
+    """
+    if pooled:
+        aoc_io.configure_session()
+        patches = []
+    else:
+        # What `aoc_io` did before: a brand new connection for every call
+        patches = [
+            mock.patch.object(aoc_io, "get_session", lambda: requests),
+            mock.patch.object(aoc_io, "_timeout", None),
+        ]
+    for patch in patches:
+        patch.start()
+    try:
+        start = perf_counter()
+        with redirect_stdout(io.StringIO()):
+            for i in range(n):
+                day = i % 25 + 1
+                aoc_io.get_input(2020, day, workdir / f"{i}.txt")
+                aoc_io.submit_output(2020, day, 1, i, use_ledger=False)
+        elapsed = perf_counter() - start
+    finally:
+        for patch in patches:
+            patch.stop()
+    return elapsed / (2 * n)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", "--requests", type=int, default=50)
+    parser.add_argument(
+        "--handshake-ms",
+        type=float,
+        default=20.0,
+        help="simulated TCP+TLS setup cost per new connection",
+    )
+    args = parser.parse_args()
+
+    with run_stub_server(
+        handshake_delay=args.handshake_ms / 1000
+    ) as server, tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+        aoc_io, "BASE_URL", server.url
+    ), mock.patch.object(
+        aoc_io, "get_cookies", lambda: {"session": "benchmark"}
+    ):
+        workdir = Path(tmp)
+        connections = server.connection_count
+        bare = _time_calls(args.requests, False, workdir)
+        bare_connections = server.connection_count - connections
+        connections = server.connection_count
+        pooled = _time_calls(args.requests, True, workdir)
+        pooled_connections = server.connection_count - connections
+
+    print(f"{2 * args.requests} requests, {args.handshake_ms:g} ms handshake")
+    print(f"  bare  : {bare * 1000:8.2f} ms/request, {bare_connections} connections")
+    print(
+        f"  pooled: {pooled * 1000:8.2f} ms/request, {pooled_connections} connections"
+    )
+    print(f"  saved : {(bare - pooled) * 1000:8.2f} ms/request")
+
+
+if __name__ == "__main__":
+    main()
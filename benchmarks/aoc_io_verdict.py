@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming verdict extraction vs a full BeautifulSoup parse
+
+Parses the captured answer pages in `benchmarks/fixtures` both ways, checks
+  that they agree, and compares the time per page and the peak memory
+  allocated while parsing
+
+Usage:
+    python -m benchmarks.aoc_io_verdict [-n REPEATS]
+"""
+
+import argparse
+import tracemalloc
+from pathlib import Path
+from timeit import timeit
+from typing import Callable
+
+from bs4 import BeautifulSoup
+
+from aoc_io.verdict import stream_verdict
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+_CHUNK_SIZE = 1024
+
+
+def _bs4_verdict(content: bytes) -> str:
+    """
+    What `submit_output` used to do
+
+    Args:
+        content (bytes): The answer page
+
+    Returns:
+        (str): Text of the verdict paragraph
+    """
+    return BeautifulSoup(content, "html.parser").article.p.text
+
+
+def _streamed_verdict(content: bytes) -> str:
+    """
+    Feed the page in the chunks a streamed response would arrive in
+
+    Args:
+        content (bytes): The answer page
+
+    Returns:
+        (str): Text of the verdict paragraph
+    """
+    chunks = (content[i : i + _CHUNK_SIZE] for i in range(0, len(content), _CHUNK_SIZE))
+    verdict = stream_verdict(chunks)
+    assert verdict is not None
+    return verdict
+
+
+def _peak_memory(parse: Callable[[bytes], str], content: bytes) -> int:
+    """
+    Peak memory allocated while parsing a page once
+
+    Args:
+        parse   (Callable[[bytes], str]): The parser
+        content (bytes)                 : The answer page
+
+    Returns:
+        (int): Peak traced memory, in bytes
+    """
+    tracemalloc.start()
+    try:
+        parse(content)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", "--repeats", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(
+        f"{'fixture':24} {'bs4 us':>8} {'stream us':>10}"
+        f" {'bs4 KiB':>8} {'stream KiB':>11}"
+    )
+    for path in sorted(FIXTURES_DIR.glob("answer_*.html")):
+        content = path.read_bytes()
+        assert _bs4_verdict(content) == _streamed_verdict(content), path.name
+        times = [
+            timeit(lambda: parse(content), number=args.repeats) / args.repeats
+            for parse in (_bs4_verdict, _streamed_verdict)
+        ]
+        peaks = [
+            _peak_memory(parse, content) for parse in (_bs4_verdict, _streamed_verdict)
+        ]
+        print(
+            f"{path.name:24} {times[0] * 1e6:8.1f} {times[1] * 1e6:10.1f}"
+            f" {peaks[0] / 1024:8.1f} {peaks[1] / 1024:11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
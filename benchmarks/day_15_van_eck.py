@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Day 15 Van Eck backends, and the dict engine they replaced
+
+Plays the memory game from the puzzle input on each backend that can run here,
+  checks that they agree, and compares the throughput in turns per second. The
+  dict engine is slow and memory-hungry at these sizes, so it only runs when
+  asked for
+
+Usage:
+    python -m benchmarks.day_15_van_eck [-t TURNS ...] [-b BACKEND ...]
+                                        [--dict] [--memory] [--input PATH]
+"""
+
+import argparse
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Optional, Sequence
+
+from Day_15.utils.read_input import read_input
+from Day_15.utils.van_eck import BACKENDS, available_backends, play
+
+INPUT_PATH = Path(__file__).resolve().parent.parent / "Day_15" / "input.txt"
+
+
+def _dict_play(starting: Sequence[int], turns: int) -> int:
+    """
+    What `Level 2.py` used to do
+
+    Args:
+        starting (Sequence[int]): Starting numbers
+        turns    (int)          : The turn whose number is wanted
+
+    Returns:
+        (int): The number spoken on that turn
+    """
+    nums_dict = {num: i + 1 for i, num in enumerate(starting[:-1])}
+    consideration = starting[-1]
+    for i in range(len(starting), turns):
+        if consideration in nums_dict:
+            new_last_num = i - nums_dict[consideration]
+        else:
+            new_last_num = 0
+        nums_dict[consideration] = i
+        consideration = new_last_num
+    return consideration
+
+
+def _measure(
+    engine: Callable[[Sequence[int], int], int],
+    starting: Sequence[int],
+    turns: int,
+    memory: bool,
+) -> tuple[int, float, Optional[int]]:
+    """
+    Play once, timing it, and once more tracing its allocations if asked
+
+    Tracing slows the Python engines down, so the time is measured in an
+      untraced run. Allocations made outside Python, by compiled backends, are
+      not traced
+
+    Args:
+        engine   (Callable[[Sequence[int], int], int]): The engine
+        starting (Sequence[int])                      : Starting numbers
+        turns    (int)                                : Turns to play
+        memory   (bool)                               : Whether to trace
+
+    Returns:
+        (int)          : The number spoken on the last turn
+        (float)        : Wall time, in seconds
+        (Optional[int]): Peak traced memory, in bytes, if traced
+    """
+    start = perf_counter()
+    result = engine(starting, turns)
+    elapsed = perf_counter() - start
+    if not memory:
+        return result, elapsed, None
+    tracemalloc.start()
+    try:
+        engine(starting, turns)
+        return result, elapsed, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-t", "--turns", type=int, nargs="+", default=[30_000_000, 300_000_000]
+    )
+    parser.add_argument(
+        "-b",
+        "--backends",
+        nargs="+",
+        choices=BACKENDS,
+        help="backends to compare (default: all that can run here)",
+    )
+    parser.add_argument(
+        "--dict", action="store_true", help="also run the original dict engine"
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="also measure the peak traced memory"
+    )
+    parser.add_argument("--input", type=Path, default=INPUT_PATH)
+    args = parser.parse_args()
+
+    starting = list(read_input(args.input))
+    engines: dict[str, Callable[[Sequence[int], int], int]] = {
+        backend: partial(play, backend=backend)
+        for backend in args.backends or available_backends()
+    }
+    if args.dict:
+        engines["dict"] = _dict_play
+    # Build and compile ahead, so that the first measurement does not pay
+    for engine in engines.values():
+        engine(starting, len(starting) + 1)
+
+    print(f"{'turns':>11} {'engine':8} {'seconds':>9} {'turns/s':>12} {'MiB':>8}")
+    for turns in args.turns:
+        results: set[int] = set()
+        for name, engine in engines.items():
+            result, elapsed, peak = _measure(engine, starting, turns, args.memory)
+            results.add(result)
+            mib = "" if peak is None else f"{peak / 2**20:.1f}"
+            rate = (turns - len(starting)) / elapsed
+            print(f"{turns:>11} {name:8} {elapsed:9.3f} {rate:12.0f} {mib:>8}")
+        assert len(results) == 1, f"engines disagree at {turns} turns: {results}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Day 17 dense N-dimensional engine vs the dict game it replaced
+
+Boots the pocket dimension from the puzzle input with the dense engine, with
+  and without symmetry, the sparse engine and the dict game, in each number of
+  dimensions; checks that they agree, and compares the time per generation.
+  The sparse engine and the dict game grow by a factor of 3 per cell with each
+  dimension, so they only run up to `--sparse-max` and `--dict-max` dimensions
+
+Usage:
+    python -m benchmarks.day_17_conway [-d DIMENSIONS ...] [-g GENERATIONS]
+                                       [--sparse-max N] [--dict-max N]
+                                       [--input PATH]
+"""
+
+import argparse
+from collections import defaultdict
+from functools import partial
+from itertools import product
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Union
+
+from Day_17.utils.conway import DenseGame, SparseGame
+from Day_17.utils.read_input import read_input
+
+INPUT_PATH = Path(__file__).resolve().parent.parent / "Day_17" / "input.txt"
+
+_Coord = tuple[int, ...]
+
+
+class _DictGame:
+    """
+    What `Level 1.py` and `Level 2.py` used to do, in any number of dimensions:
+      a `defaultdict[_Coord, bool]`, with every neighbor of every candidate
+      looked up
+
+    Args:
+        initial_state (list[list[bool]]): Original 2D board
+        dimensions    (int)             : Number of dimensions
+    """
+
+    def __init__(self, initial_state: list[list[bool]], dimensions: int) -> None:
+        self.board: defaultdict[_Coord, bool] = defaultdict(lambda: False)
+        self.coords: set[_Coord] = set()
+        for x, row in enumerate(initial_state):
+            for y, cell in enumerate(row):
+                if cell:
+                    coord = (x, y, *(0,) * (dimensions - 2))
+                    self.board[coord] = cell
+                    self.coords.add(coord)
+
+    def propagate(self) -> None:
+        """
+        Construct the next generation
+        """
+        interesting_coords: set[_Coord] = set()
+        for coord in self.coords:
+            if self.board[coord]:
+                interesting_coords |= set(
+                    product(*(range(c - 1, c + 2) for c in coord))
+                )
+        new_board: defaultdict[_Coord, bool] = defaultdict(lambda: False)
+        new_coords: set[_Coord] = set()
+        for icoord in interesting_coords:
+            neighbors = self._count_neighbors(icoord)
+            if neighbors == 3 or (neighbors == 2 and self.board[icoord]):
+                new_board[icoord] = True
+                new_coords.add(icoord)
+        self.board = new_board
+        self.coords = new_coords
+
+    def count_active(self) -> int:
+        """
+        Count the number of active cells
+
+        Returns:
+            (int): The number of active cells
+        """
+        return sum(self.board.values())
+
+    def _count_neighbors(self, coord: _Coord) -> int:
+        """
+        Count the number of active neighbors
+
+        Args:
+            coord (_Coord): The coord to be checked
+
+        Returns:
+            (int): The number of active neighbors around the coord
+        """
+        all_sum = sum(
+            self.board[icoord]
+            for icoord in product(*(range(c - 1, c + 2) for c in coord))
+        )
+        return all_sum - self.board[coord]
+
+
+# Initial state, dimensions -> game
+_GameType = Callable[[list[list[bool]], int], Union[_DictGame, DenseGame, SparseGame]]
+
+
+def _measure(
+    game_type: _GameType,
+    initial_state: list[list[bool]],
+    dimensions: int,
+    generations: int,
+) -> tuple[int, float]:
+    """
+    Boot a pocket dimension, timing it
+
+    Args:
+        game_type     (_GameType)       : The game class
+        initial_state (list[list[bool]]): Original 2D board
+        dimensions    (int)             : Number of dimensions
+        generations   (int)             : Number of generations
+
+    Returns:
+        (int)  : Number of active cubes at the end
+        (float): Wall time, in seconds
+    """
+    start = perf_counter()
+    game = game_type(initial_state, dimensions)
+    for _ in range(generations):
+        game.propagate()
+    return game.count_active(), perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-d", "--dimensions", type=int, nargs="+", default=[3, 4, 5, 6])
+    parser.add_argument("-g", "--generations", type=int, default=6)
+    parser.add_argument(
+        "--sparse-max",
+        type=int,
+        default=5,
+        help="most dimensions to run the sparse engine in",
+    )
+    parser.add_argument(
+        "--dict-max",
+        type=int,
+        default=4,
+        help="most dimensions to run the dict game in",
+    )
+    parser.add_argument("--input", type=Path, default=INPUT_PATH)
+    args = parser.parse_args()
+
+    initial_state = read_input(args.input)
+    print(f"{'dims':>4} {'engine':7} {'active':>9} {'seconds':>9} {'ms/gen':>9}")
+    for dimensions in args.dimensions:
+        engines: dict[str, _GameType] = {
+            "dense": DenseGame,
+            "orthant": partial(DenseGame, symmetric=True),
+        }
+        if dimensions <= args.sparse_max:
+            engines["sparse"] = SparseGame
+        if dimensions <= args.dict_max:
+            engines["dict"] = _DictGame
+        results: set[int] = set()
+        for name, game_type in engines.items():
+            active, elapsed = _measure(
+                game_type, initial_state, dimensions, args.generations
+            )
+            results.add(active)
+            per_gen = elapsed / args.generations * 1e3
+            print(f"{dimensions:>4} {name:7} {active:>9} {elapsed:9.3f} {per_gen:9.2f}")
+        assert len(results) == 1, f"engines disagree in {dimensions}D: {results}"
+
+
+if __name__ == "__main__":
+    main()
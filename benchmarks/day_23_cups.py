@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Day 23 successor-table engine vs the linked list it replaced
+
+Plays crab cups from the puzzle input both ways, checks that they agree, and
+  compares the throughput in moves per second and the peak memory allocated
+  while playing. With `--scaling`, plays as many moves as there are cups on
+  circles of 10^4 to 10^7 cups instead; the time per move should stay flat, so
+  that the total time is linear in the size
+
+Usage:
+    python -m benchmarks.day_23_cups [-c CUPS] [-m MOVES] [--input PATH]
+    python -m benchmarks.day_23_cups --scaling [-s SIZES ...] [--input PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+from Day_23.utils.cups import play
+from Day_23.utils.read_input import read_input
+
+INPUT_PATH = Path(__file__).resolve().parent.parent / "Day_23" / "input.txt"
+
+
+class _Node:
+    """
+    A cup of the linked list that `Level 2.py` used to build
+
+    Args:
+        value (int): Label of the cup
+    """
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self.next = self
+
+
+def _linked_list_play(cups: list[int], moves: int, total_cups: int) -> int:
+    """
+    What `Level 2.py` used to do: a `_Node` per cup and a label-node dict
+
+    Args:
+        cups       (list[int]): Labels of the starting cups
+        moves      (int)      : Number of moves
+        total_cups (int)      : Number of cups
+
+    Returns:
+        (int): Product of the 2 cups after cup 1
+    """
+    nodes = {label: _Node(label) for label in range(1, total_cups + 1)}
+    labels = cups + list(range(len(cups) + 1, total_cups + 1))
+    for label, next_label in zip(labels, labels[1:] + labels[:1]):
+        nodes[label].next = nodes[next_label]
+    current_node = nodes[labels[0]]
+    for _ in range(moves):
+        next_node = current_node.next
+        next_next_node = next_node.next
+        next_next_next_node = next_next_node.next
+        bad_nums = {
+            0,
+            next_node.value,
+            next_next_node.value,
+            next_next_next_node.value,
+        }
+        dest_value = current_node.value
+        while True:
+            dest_value -= 1
+            if not dest_value:
+                dest_value = total_cups
+            if dest_value not in bad_nums:
+                break
+        dest_node = nodes[dest_value]
+        current_node.next = next_next_next_node.next
+        next_next_next_node.next = dest_node.next
+        dest_node.next = next_node
+        current_node = current_node.next
+    one_node_next = nodes[1].next
+    return one_node_next.value * one_node_next.next.value
+
+
+def _array_play(cups: list[int], moves: int, total_cups: int) -> int:
+    """
+    What `Level 2.py` does now
+
+    Args:
+        cups       (list[int]): Labels of the starting cups
+        moves      (int)      : Number of moves
+        total_cups (int)      : Number of cups
+
+    Returns:
+        (int): Product of the 2 cups after cup 1
+    """
+    successors = play(cups, moves, total_cups)
+    return successors[1] * successors[successors[1]]
+
+
+def _measure(
+    engine: Callable[[list[int], int, int], int],
+    cups: list[int],
+    moves: int,
+    total_cups: int,
+) -> tuple[int, float, int]:
+    """
+    Play once, timing it, and once more tracing its allocations
+
+    Args:
+        engine     (Callable[[list[int], int, int], int]): The engine
+        cups       (list[int])                           : Starting cups
+        moves      (int)                                 : Number of moves
+        total_cups (int)                                 : Number of cups
+
+    Returns:
+        (int)  : Product of the 2 cups after cup 1
+        (float): Moves per second
+        (int)  : Peak traced memory, in bytes
+    """
+    start = perf_counter()
+    result = engine(cups, moves, total_cups)
+    elapsed = perf_counter() - start
+    tracemalloc.start()
+    try:
+        engine(cups, moves, total_cups)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, moves / elapsed, peak
+
+
+def _scaling(cups: list[int], sizes: list[int]) -> None:
+    """
+    Play as many moves as there are cups, for each number of cups
+
+    Args:
+        cups  (list[int]): Labels of the starting cups
+        sizes (list[int]): Numbers of cups
+    """
+    print(f"{'cups':>10} {'seconds':>9} {'ns/move':>9}")
+    for size in sizes:
+        start = perf_counter()
+        play(cups, size, size)
+        elapsed = perf_counter() - start
+        print(f"{size:>10} {elapsed:9.3f} {elapsed / size * 1e9:9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-c", "--cups", type=int, default=1_000_000)
+    parser.add_argument("-m", "--moves", type=int, default=1_000_000)
+    parser.add_argument(
+        "--scaling", action="store_true", help="time the engine alone at many sizes"
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10**4, 10**5, 10**6, 10**7],
+        help="numbers of cups for --scaling",
+    )
+    parser.add_argument("--input", type=Path, default=INPUT_PATH)
+    args = parser.parse_args()
+
+    cups = read_input(args.input)
+    if args.scaling:
+        _scaling(cups, args.sizes)
+        return
+    print(f"{'engine':12} {'moves/s':>10} {'MiB':>8}")
+    results = set()
+    for name, engine in (("linked list", _linked_list_play), ("array", _array_play)):
+        result, rate, peak = _measure(engine, cups, args.moves, args.cups)
+        results.add(result)
+        print(f"{name:12} {rate:10.0f} {peak / 2**20:8.1f}")
+    assert len(results) == 1, results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Day 24 hex-grid engines
+
+Runs the living art exhibit from the black tiles of the puzzle input, or of a
+  generated floor, on each engine, checks that they agree, and compares the
+  time per day. Over long exhibits on large floors, only the dense engine
+  finishes in seconds
+
+Usage:
+    python -m benchmarks.day_24_hex_life [-d DAYS] [--size SIZE] [--seed SEED]
+                                         [-e ENGINE ...] [--input PATH]
+"""
+
+import argparse
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterable, Protocol
+
+from Day_24.utils.generate import generate
+from Day_24.utils.hex_life import DenseHexGameOfLife, HexGameOfLife
+from Day_24.utils.read_input import resolve_tiles
+
+INPUT_PATH = Path(__file__).resolve().parent.parent / "Day_24" / "input.txt"
+
+
+class _Game(Protocol):
+    """
+    What the engines have in common
+    """
+
+    @property
+    def black_tiles_count(self) -> int: ...
+
+    def propagate(self) -> None: ...
+
+
+class _ComplexGame:
+    """
+    What `Level 2.py` used to do: a `set[complex]` of black tiles, with a fresh
+      set of neighbors for every tile and every candidate
+
+    Args:
+        black_tiles (Iterable[tuple[int, int]]): Axial coordinates of the black
+                                                 tiles
+    """
+
+    def __init__(self, black_tiles: Iterable[tuple[int, int]]) -> None:
+        self.board = {complex(q, r) for q, r in black_tiles}
+
+    @property
+    def black_tiles_count(self) -> int:
+        return len(self.board)
+
+    def propagate(self) -> None:
+        """
+        Run one round of propagation
+        """
+        sus_poses: set[complex] = set()
+        for black_pos in self.board:
+            sus_poses.add(black_pos)
+            sus_poses |= self.gen_neighbors(black_pos)
+        new_board: set[complex] = set()
+        for sus_pos in sus_poses:
+            neighbors_black = sum(
+                pos in self.board for pos in self.gen_neighbors(sus_pos)
+            )
+            if sus_pos in self.board:
+                if neighbors_black in {1, 2}:
+                    new_board.add(sus_pos)
+            else:
+                if neighbors_black == 2:
+                    new_board.add(sus_pos)
+        self.board = new_board
+
+    @staticmethod
+    def gen_neighbors(pos: complex) -> set[complex]:
+        """
+        Get set of coordinate of neighbors of a coordinate
+        """
+        return {pos + 1, pos - 1, pos + 1j, pos - 1j, pos + 1 + 1j, pos - 1 - 1j}
+
+
+def _measure(
+    engine: Callable[[Iterable[tuple[int, int]]], _Game],
+    black_tiles: set[tuple[int, int]],
+    days: int,
+) -> tuple[int, float]:
+    """
+    Run the exhibit, timing it
+
+    Args:
+        engine      (Callable[[Iterable[tuple[int, int]]], _Game]): The engine
+        black_tiles (set[tuple[int, int]])                        : Black tiles
+                                                                    at the start
+        days        (int)                                         : Number of
+                                                                    days
+
+    Returns:
+        (int)  : Number of black tiles at the end
+        (float): Wall time, in seconds
+    """
+    start = perf_counter()
+    game = engine(black_tiles)
+    for _ in range(days):
+        game.propagate()
+    return game.black_tiles_count, perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-d", "--days", type=int, default=100)
+    parser.add_argument(
+        "--size", type=float, help="run on a generated floor of this size instead"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "-e",
+        "--engines",
+        nargs="+",
+        choices=("complex", "sparse", "dense"),
+        default=["complex", "sparse", "dense"],
+        help="engines to compare (default: all)",
+    )
+    parser.add_argument("--input", type=Path, default=INPUT_PATH)
+    args = parser.parse_args()
+
+    if args.size is None:
+        data = args.input.read_bytes()
+    else:
+        data = generate(args.size, args.seed)[0].encode()
+    black_tiles = {(q, r) for q, r in resolve_tiles(data).tolist()}
+    engines: dict[str, Callable[[Iterable[tuple[int, int]]], _Game]] = {
+        "complex": _ComplexGame,
+        "sparse": HexGameOfLife,
+        "dense": DenseHexGameOfLife,
+    }
+    engines = {name: engines[name] for name in args.engines}
+
+    print(f"{'engine':8} {'black':>9} {'seconds':>9} {'ms/day':>9}")
+    results: set[int] = set()
+    for name, engine in engines.items():
+        black, elapsed = _measure(engine, black_tiles, args.days)
+        results.add(black)
+        print(f"{name:8} {black:>9} {elapsed:9.3f} {elapsed / args.days * 1e3:9.2f}")
+    assert len(results) == 1, f"engines disagree: {results}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Day 24 vectorized path resolver vs the step-by-step walk
+
+Builds random tile lists of many paths, finds their black tiles both ways,
+  checks that they agree, and compares the throughput in paths per second. The
+  paths are random walks rather than generated puzzles, whose answers take
+  long to work out at these sizes
+
+Usage:
+    python -m benchmarks.day_24_paths [-p PATHS ...] [-l LENGTH] [--seed SEED]
+"""
+
+import argparse
+from collections import defaultdict
+from random import Random
+from time import perf_counter
+
+from Day_24.utils.read_input import resolve_tiles
+
+_STEPS = ("e", "w", "ne", "sw", "nw", "se")
+
+
+def _walk_play(data: bytes) -> set[tuple[int, int]]:
+    """
+    What `read_input` and the levels used to do: tokenize each line char by
+      char, then walk the steps with complex arithmetic
+
+    Args:
+        data (bytes): Tile list, a path per line
+
+    Returns:
+        (set[tuple[int, int]]): Axial coordinates of the black tiles
+    """
+    instructions: list[list[str]] = []
+    for line in data.decode().split():
+        steps: list[str] = []
+        step = ""
+        for char in line:
+            if char in {"s", "n"}:
+                step = char
+            else:
+                steps.append(step + char)
+                step = ""
+        instructions.append(steps)
+    tiles_changed: defaultdict[complex, bool] = defaultdict(lambda: False)
+    for instruction in instructions:
+        coord = 0 + 0j
+        for step in instruction:
+            if step == "e":
+                coord += 1
+            elif step == "w":
+                coord -= 1
+            elif step == "nw":
+                coord += 1j
+            elif step == "se":
+                coord -= 1j
+            elif step == "ne":
+                coord += 1 + 1j
+            elif step == "sw":
+                coord -= 1 + 1j
+            else:
+                raise ValueError(f"Unknown step: {step}")
+        tiles_changed[coord] ^= True
+    return {
+        (int(coord.real), int(coord.imag))
+        for coord, black in tiles_changed.items()
+        if black
+    }
+
+
+def _vectorized_play(data: bytes) -> set[tuple[int, int]]:
+    """
+    What the levels do now
+
+    Args:
+        data (bytes): Tile list, a path per line
+
+    Returns:
+        (set[tuple[int, int]]): Axial coordinates of the black tiles
+    """
+    return {(q, r) for q, r in resolve_tiles(data).tolist()}
+
+
+def _tile_list(paths: int, length: int, seed: int) -> bytes:
+    """
+    Build a tile list of random paths
+
+    Args:
+        paths  (int): Number of paths
+        length (int): Steps per path
+        seed   (int): Seed of the generator
+
+    Returns:
+        (bytes): The tile list
+    """
+    rng = Random(seed)
+    return "".join(
+        "".join(rng.choices(_STEPS, k=length)) + "\n" for _ in range(paths)
+    ).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-p", "--paths", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("-l", "--length", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'paths':>9} {'engine':10} {'black':>9} {'seconds':>9} {'paths/s':>11}")
+    for paths in args.paths:
+        data = _tile_list(paths, args.length, args.seed)
+        results: list[set[tuple[int, int]]] = []
+        for name, engine in (("walk", _walk_play), ("vectorized", _vectorized_play)):
+            start = perf_counter()
+            black = engine(data)
+            elapsed = perf_counter() - start
+            results.append(black)
+            print(
+                f"{paths:>9} {name:10} {len(black):>9} {elapsed:9.3f}"
+                f" {paths / elapsed:11.0f}"
+            )
+        assert results[0] == results[1], f"engines disagree at {paths} paths"
+
+
+if __name__ == "__main__":
+    main()
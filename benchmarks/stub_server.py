@@ -0,0 +1,216 @@
+"""
+Module: Local stand-in for the AOC website
+
+Serves `/<year>/day/<day>/input` and `/<year>/day/<day>/answer` over plain
+  HTTP/1.1 with keep-alive, so the `aoc_io` clients can be exercised and
+  benchmarked offline. A per-connection delay stands in for the TCP+TLS
+  handshake a real HTTPS connection would pay
+
+Public Classes:
+    StubServer: Threaded stub server with configurable latency and failures
+
+Public Functions:
+    run_stub_server: Context manager running a `StubServer` in the background
+    stub_input     : The input body the stub serves for a given year and day
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from typing import Iterator, Optional
+
+_PATH_RE = re.compile(r"/(?P<year>\d+)/day/(?P<day>\d+)/(?P<kind>input|answer)")
+
+_ANSWER_HTML = (
+    '<!DOCTYPE html>\n<html lang="en-us">\n<head>\n<title>Day {day} - Advent of'
+    ' Code {year}</title>\n</head>\n<body>\n<header><h1><a href="/">Advent of'
+    " Code</a></h1></header>\n<main>\n<article><p>{text}</p></article>\n</main>\n"
+    "</body>\n</html>\n"
+)
+_RIGHT_TEXT = (
+    'That\'s the right answer!  You are <span class="day-success">one gold star'
+    '</span> closer to saving your vacation. <a href="/{year}/day/{day}">'
+    "[Continue to Part Two]</a>"
+)
+_WRONG_TEXT = (
+    "That's not the right answer.  If you're stuck, make sure you're using the"
+    ' full input data. <a href="/{year}/day/{day}">[Return to Day {day}]</a>'
+)
+
+
+def stub_input(year: int, day: int) -> bytes:
+    """
+    The input body the stub serves for a given year and day
+
+    Args:
+        year (int): The year of AOC
+        day  (int): The day of AOC
+
+    Returns:
+        (bytes): Deterministic puzzle input
+    """
+    return "".join(f"{year * 100 + day + i}\n" for i in range(200)).encode()
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Threaded stub server with configurable latency and failures
+
+    Args:
+        latency         (float): Seconds to wait before answering each request
+        handshake_delay (float): Seconds to wait when a new connection is
+                                 accepted, standing in for TCP+TLS setup
+        failures        (int)  : Number of initial requests answered with 503
+        retry_after     (str | None): `Retry-After` header sent with failures
+        answer          (str | None): The accepted answer; `None` accepts any
+
+    Public Attributes:
+        url              (str): Base URL to substitute for `aoc_io.BASE_URL`
+        connection_count (int): Number of connections accepted so far
+        request_count    (int): Number of requests served so far
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        handshake_delay: float = 0.0,
+        failures: int = 0,
+        retry_after: Optional[str] = None,
+        answer: Optional[str] = None,
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency = latency
+        self.handshake_delay = handshake_delay
+        self.failures = failures
+        self.retry_after = retry_after
+        self.answer = answer
+        self.connection_count = 0
+        self.request_count = 0
+        self._lock = threading.Lock()
+        host, port = self.server_address[:2]
+        self.url = f"http://{host}:{port}"
+
+    def _count_request(self) -> bool:
+        """
+        Count a request
+
+        Returns:
+            (bool): Whether the request should be failed
+        """
+        with self._lock:
+            self.request_count += 1
+            return self.request_count <= self.failures
+
+    def _count_connection(self) -> None:
+        """
+        Count a newly accepted connection
+        """
+        with self._lock:
+            self.connection_count += 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Request handler for `StubServer`
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: StubServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.server._count_connection()
+        if self.server.handshake_delay:
+            sleep(self.server.handshake_delay)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._handle("input")
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self._form = self.rfile.read(length).decode()
+        self._handle("answer")
+
+    def _handle(self, kind: str) -> None:
+        """
+        Answer a request to either endpoint
+
+        Args:
+            kind (str): "input" or "answer"
+        """
+        if self.server.latency:
+            sleep(self.server.latency)
+        match = _PATH_RE.fullmatch(self.path)
+        if match is None or match["kind"] != kind:
+            self._send(404, b"404 Not Found")
+            return
+        if self.server._count_request():
+            headers = {}
+            if self.server.retry_after is not None:
+                headers["Retry-After"] = self.server.retry_after
+            self._send(503, b"Service Unavailable", headers)
+            return
+        year, day = int(match["year"]), int(match["day"])
+        if kind == "input":
+            self._send(200, stub_input(year, day))
+            return
+        answer = dict(
+            pair.split("=", 1) for pair in self._form.split("&") if "=" in pair
+        ).get("answer")
+        if self.server.answer is None or answer == self.server.answer:
+            text = _RIGHT_TEXT.format(year=year, day=day)
+        else:
+            text = _WRONG_TEXT.format(year=year, day=day)
+        body = _ANSWER_HTML.format(year=year, day=day, text=text).encode()
+        self._send(200, body, {"Content-Type": "text/html"})
+
+    def _send(
+        self, status: int, body: bytes, headers: Optional[dict[str, str]] = None
+    ) -> None:
+        """
+        Send a complete response, keeping the connection open
+
+        Args:
+            status  (int)           : HTTP status code
+            body    (bytes)         : Response body
+            headers (dict[str, str]): Extra response headers
+        """
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@contextmanager
+def run_stub_server(**kwargs: object) -> Iterator[StubServer]:
+    """
+    Context manager running a `StubServer` in the background
+
+    Args:
+        **kwargs: Passed on to `StubServer`
+
+    Yields:
+        (StubServer): The running server
+    """
+    server = StubServer(**kwargs)  # type: ignore[arg-type]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()